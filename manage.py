@@ -8,7 +8,7 @@ def main():
     """Run administrative tasks."""
     os.environ.setdefault(
         'DJANGO_SETTINGS_MODULE',
-        'task_manager.core.settings'
+        'task_manager.core.settings.development'
     )
     try:
         from django.core.management import execute_from_command_line
@@ -0,0 +1,154 @@
+import json
+from http import HTTPStatus
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse_lazy
+
+from task_manager.core.pagination import encode_cursor
+from task_manager.core.pagination import NEXT
+from task_manager.labels.models import Label
+from task_manager.statuses.models import Status
+from task_manager.tasks.models import Task
+from task_manager.tasks.tests.task_test_case import TaskTestCase
+
+
+class TestTaskApi(TaskTestCase):
+    """JSON API over tasks with sparse fields, ids and cursors."""
+
+    url = reverse_lazy("api_tasks")
+
+    def get_json(self, params: dict = None, url: str = None) -> dict:
+        response = self.client.get(url or self.url, params or {})
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertTrue(response.streaming)
+        return json.loads(b"".join(response.streaming_content))
+
+    def test_anonymous_user_is_forbidden(self) -> None:
+        self.client.logout()
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, HTTPStatus.FORBIDDEN)
+
+    def test_lists_tasks_with_labels(self) -> None:
+        data = self.get_json()
+        expected = list(
+            Task.objects.order_by("-created_at", "-pk")
+            .values_list("pk", flat=True)
+        )
+        self.assertEqual([task["id"] for task in data["results"]], expected)
+        first = next(
+            task for task in data["results"]
+            if task["id"] == self.test_task_1.pk
+        )
+        self.assertEqual(first["name"], self.test_task_1.name)
+        self.assertEqual(first["status"], self.test_task_1.status_id)
+        self.assertEqual(
+            first["labels"],
+            sorted(self.test_task_1.labels.values_list("pk", flat=True)),
+        )
+        self.assertIsNone(data["next"])
+
+    def test_fields_select_only_requested_columns(self) -> None:
+        with CaptureQueriesContext(connection) as queries:
+            data = self.get_json({"fields": "name,status"})
+        for task in data["results"]:
+            self.assertEqual(set(task), {"name", "status"})
+        task_queries = [
+            query["sql"] for query in queries.captured_queries
+            if '"tasks_task"."name"' in query["sql"]
+        ]
+        self.assertEqual(len(task_queries), 1)
+        self.assertNotIn("description", task_queries[0])
+
+    def test_unknown_field_is_bad_request(self) -> None:
+        response = self.client.get(self.url, {"fields": "name,password"})
+        self.assertEqual(response.status_code, HTTPStatus.BAD_REQUEST)
+        self.assertIn("fields", response.json()["errors"])
+
+    def test_ids_fetch_given_tasks(self) -> None:
+        data = self.get_json({
+            "ids": f"{self.test_task_1.pk},{self.test_task_2.pk}",
+            "fields": "id",
+        })
+        self.assertEqual(
+            {task["id"] for task in data["results"]},
+            {self.test_task_1.pk, self.test_task_2.pk},
+        )
+        response = self.client.get(self.url, {"ids": "1,a"})
+        self.assertEqual(response.status_code, HTTPStatus.BAD_REQUEST)
+
+    def test_task_filter_parameters_apply(self) -> None:
+        status = self.test_task_1.status_id
+        data = self.get_json({"status": status, "fields": "status"})
+        self.assertEqual(
+            len(data["results"]), Task.objects.filter(status=status).count()
+        )
+        self.assertTrue(
+            all(task["status"] == status for task in data["results"])
+        )
+        response = self.client.get(self.url, {"status": 0})
+        self.assertEqual(response.status_code, HTTPStatus.BAD_REQUEST)
+        self.assertIn("status", response.json()["errors"])
+
+    def test_cursor_walks_all_pages(self) -> None:
+        params = {"page_size": 1, "fields": "id", "ordering": "name"}
+        seen = []
+        while True:
+            data = self.get_json(params)
+            self.assertLessEqual(len(data["results"]), 1)
+            seen.extend(task["id"] for task in data["results"])
+            if data["next"] is None:
+                break
+            params["cursor"] = data["next"]
+        expected = list(
+            Task.objects.order_by("name", "pk").values_list("pk", flat=True)
+        )
+        self.assertEqual(seen, expected)
+
+    def test_invalid_cursor_is_bad_request(self) -> None:
+        response = self.client.get(self.url, {"cursor": "!"})
+        self.assertEqual(response.status_code, HTTPStatus.BAD_REQUEST)
+
+    def test_tampered_cursor_is_bad_request(self) -> None:
+        # Tasks are ordered by pk only
+        for values in (["garbage"], [None], [[1]]):
+            with self.subTest(values=values):
+                response = self.client.get(
+                    self.url, {"cursor": encode_cursor(NEXT, values)}
+                )
+                self.assertEqual(response.status_code, HTTPStatus.BAD_REQUEST)
+
+    def test_queries_do_not_grow_with_rows(self) -> None:
+        def count_queries():
+            with CaptureQueriesContext(connection) as queries:
+                self.get_json()
+            return len(queries)
+
+        few_rows = count_queries()
+        for number in range(20):
+            task = Task.objects.create(
+                name=f"Api{number}",
+                status=self.test_task_1.status,
+                author=self.test_user_1,
+            )
+            task.labels.set(Label.objects.all())
+        self.assertEqual(count_queries(), few_rows)
+
+
+class TestDictionaryApi(TaskTestCase):
+    """Statuses, labels and users share the same list endpoint."""
+
+    def test_statuses_are_listed(self) -> None:
+        response = self.client.get(reverse_lazy("api_statuses"))
+        data = json.loads(b"".join(response.streaming_content))
+        self.assertEqual(
+            {status["name"] for status in data["results"]},
+            set(Status.objects.values_list("name", flat=True)),
+        )
+
+    def test_users_do_not_expose_passwords(self) -> None:
+        response = self.client.get(reverse_lazy("api_users"))
+        data = json.loads(b"".join(response.streaming_content))
+        self.assertTrue(data["results"])
+        for user in data["results"]:
+            self.assertNotIn("password", user)
@@ -0,0 +1,16 @@
+from django.urls import path
+
+from task_manager.api.views import LabelApiView
+from task_manager.api.views import StatusApiView
+from task_manager.api.views import TaskApiView
+from task_manager.api.views import TaskBulkApiView
+from task_manager.api.views import UserApiView
+
+
+urlpatterns = [
+    path("tasks/", TaskApiView.as_view(), name="api_tasks"),
+    path("tasks/bulk/", TaskBulkApiView.as_view(), name="api_tasks_bulk"),
+    path("statuses/", StatusApiView.as_view(), name="api_statuses"),
+    path("labels/", LabelApiView.as_view(), name="api_labels"),
+    path("users/", UserApiView.as_view(), name="api_users"),
+]
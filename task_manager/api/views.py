@@ -0,0 +1,297 @@
+import json
+from itertools import islice
+
+from django.conf import settings
+from django.contrib.auth.mixins import LoginRequiredMixin
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import JsonResponse
+from django.http import StreamingHttpResponse
+from django.utils.translation import gettext_lazy as _
+from django.views import View
+
+from task_manager.core.cache import ConditionalGetMixin
+from task_manager.core.pagination import InvalidCursor
+from task_manager.core.pagination import KeysetPaginator
+from task_manager.labels.models import Label
+from task_manager.statuses.models import Status
+from task_manager.tasks.bulk import BulkTaskService
+from task_manager.tasks.filters import TaskFilter
+from task_manager.tasks.models import Task
+from task_manager.users.models import User
+
+
+class ApiError(Exception):
+    """Invalid query parameters, answered with 400 and the errors."""
+
+    def __init__(self, errors: dict):
+        super().__init__(errors)
+        self.errors = errors
+
+
+def chunked(iterable, size: int):
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+class ApiListView(LoginRequiredMixin, ConditionalGetMixin, View):
+    """
+    Read-only JSON list of a model.
+
+    `fields` maps public names to columns, `many_fields` to many to many
+    fields. The `fields` query parameter picks some of them and only
+    those columns are selected. `ids` fetches the given objects.
+    Pages are keyset paginated and written row by row, so memory
+    doesn't grow with the page size.
+    """
+
+    raise_exception = True
+    queryset = None
+    fields = {}
+    many_fields = {}
+    ordering = ("-pk",)
+    fields_kwarg = "fields"
+    ids_kwarg = "ids"
+    page_kwarg = "cursor"
+    page_size_kwarg = "page_size"
+    paginate_by = settings.API_PAGE_SIZE
+    max_paginate_by = settings.API_MAX_PAGE_SIZE
+    chunk_size = 100
+    invalid_cursor_message = _("Invalid page cursor")
+
+    def get_queryset(self):
+        return self.queryset.order_by(*self.ordering)
+
+    def get_fields(self) -> list[str]:
+        available = [*self.fields, *self.many_fields]
+        requested = self.get_list(self.fields_kwarg)
+        if not requested:
+            return available
+        unknown = [name for name in requested if name not in available]
+        if unknown:
+            raise ApiError({self.fields_kwarg: [
+                _("Unknown fields: %(fields)s")
+                % {"fields": ", ".join(unknown)}
+            ]})
+        return list(dict.fromkeys(requested))
+
+    def get_list(self, kwarg: str) -> list[str]:
+        """Values given as `a,b` or repeated `kwarg=a&kwarg=b`."""
+        return [
+            value.strip()
+            for values in self.request.GET.getlist(kwarg)
+            for value in values.split(",")
+            if value.strip()
+        ]
+
+    def get_page_size(self) -> int:
+        try:
+            page_size = int(self.request.GET[self.page_size_kwarg])
+        except (KeyError, ValueError):
+            return self.paginate_by
+        return min(max(page_size, 1), self.max_paginate_by)
+
+    def filter_queryset(self, queryset):
+        ids = self.get_list(self.ids_kwarg)
+        if not ids:
+            return queryset
+        try:
+            ids = [int(pk) for pk in ids]
+        except ValueError:
+            raise ApiError({self.ids_kwarg: [_("Ids must be integers")]})
+        if len(ids) > self.max_paginate_by:
+            raise ApiError({self.ids_kwarg: [
+                _("At most %(count)s ids at once")
+                % {"count": self.max_paginate_by}
+            ]})
+        return queryset.filter(pk__in=ids)
+
+    def get_many(self, model, name: str, pks: list) -> dict:
+        """Related ids of every object, one query for all of them."""
+        field = model._meta.get_field(self.many_fields[name])
+        through = field.remote_field.through
+        source = through._meta.get_field(field.m2m_field_name()).attname
+        target = through._meta.get_field(
+            field.m2m_reverse_field_name()
+        ).attname
+        related = {pk: [] for pk in pks}
+        pairs = through.objects.filter(**{f"{source}__in": pks}) \
+            .order_by(target).values_list(source, target)
+        for pk, related_pk in pairs:
+            related[pk].append(related_pk)
+        return related
+
+    def stream(self, paginator, rows, fields: list[str], page_size: int):
+        columns = [self.fields[name] for name in fields if name in self.fields]
+        many = [name for name in fields if name in self.many_fields]
+        values = rows.values("pk", *columns, *paginator.key_names)
+
+        yield '{"results": ['
+        written, last, has_next = 0, None, False
+        for chunk in chunked(values.iterator(self.chunk_size),
+                             self.chunk_size):
+            # The extra row only tells that there is a next page
+            if written + len(chunk) > page_size:
+                has_next = True
+                chunk = chunk[:page_size - written]
+            if not chunk:
+                break
+            pks = [row["pk"] for row in chunk]
+            related = {
+                name: self.get_many(rows.model, name, pks) for name in many
+            }
+            for row in chunk:
+                obj = {}
+                for name in fields:
+                    if name in related:
+                        obj[name] = related[name][row["pk"]]
+                    else:
+                        obj[name] = row[self.fields[name]]
+                separator = "," if written else ""
+                yield separator + json.dumps(obj, cls=DjangoJSONEncoder)
+                written += 1
+            last = chunk[-1]
+        next_cursor = paginator.next_cursor_for(last) \
+            if has_next and last is not None else None
+        yield f'], "next": {json.dumps(next_cursor)}}}'
+
+    def get(self, request, *args, **kwargs):
+        try:
+            fields = self.get_fields()
+            page_size = self.get_page_size()
+            paginator = KeysetPaginator(
+                self.filter_queryset(self.get_queryset()), page_size
+            )
+            rows = paginator.forward_queryset(
+                request.GET.get(self.page_kwarg)
+            )
+        except InvalidCursor:
+            return JsonResponse(
+                {"errors": {self.page_kwarg: [
+                    str(self.invalid_cursor_message)
+                ]}},
+                status=400,
+            )
+        except ApiError as error:
+            return JsonResponse(
+                {"errors": {
+                    name: [str(message) for message in messages]
+                    for name, messages in error.errors.items()
+                }},
+                status=400,
+            )
+        return StreamingHttpResponse(
+            self.stream(paginator, rows, fields, page_size),
+            content_type="application/json",
+        )
+
+
+class TaskApiView(ApiListView):
+    """Tasks filtered with the parameters of the task list page."""
+    queryset = Task.objects.all()
+    fields = {
+        "id": "id",
+        "name": "name",
+        "description": "description",
+        "status": "status_id",
+        "author": "author_id",
+        "performer": "performer_id",
+        "created_at": "created_at",
+    }
+    many_fields = {"labels": "labels"}
+    ordering = ("-created_at",)
+    condition_models = (Task, Label)
+
+    def filter_queryset(self, queryset):
+        filterset = TaskFilter(
+            self.request.GET, queryset=queryset, request=self.request
+        )
+        if not filterset.is_valid():
+            raise ApiError(filterset.errors)
+        return super().filter_queryset(filterset.qs)
+
+
+class StatusApiView(ApiListView):
+    queryset = Status.objects.all()
+    fields = {
+        "id": "id",
+        "name": "name",
+        "created_at": "created_at",
+        "task_count": "task_count",
+    }
+    condition_models = (Status, Task)
+
+
+class LabelApiView(ApiListView):
+    queryset = Label.objects.all()
+    fields = {
+        "id": "id",
+        "name": "name",
+        "created_at": "created_at",
+        "task_count": "task_count",
+    }
+    condition_models = (Label, Task)
+
+
+class UserApiView(ApiListView):
+    queryset = User.objects.all()
+    fields = {
+        "id": "id",
+        "username": "username",
+        "first_name": "first_name",
+        "last_name": "last_name",
+        "date_joined": "date_joined",
+        "authored_task_count": "authored_task_count",
+        "performed_task_count": "performed_task_count",
+    }
+    condition_models = (User, Task)
+
+
+class TaskBulkApiView(LoginRequiredMixin, View):
+    """
+    Apply one action to many tasks in a single transaction:
+
+    - {"action": "create", "items": [{"name": ..., "status": ...}]}
+    - {"action": "update", "items": [{"id": ..., "labels": [...]}]}
+    - {"action": "set_status", "ids": [...], "status": ...}
+    - {"action": "delete", "ids": [...]}
+
+    Nothing is changed if any item has errors, they are reported
+    by the index of the item.
+    """
+
+    raise_exception = True
+    max_items = settings.BULK_MAX_ITEMS
+
+    def bad_request(self, name: str, message) -> JsonResponse:
+        return JsonResponse(
+            {"errors": [{"index": None, "errors": {name: [str(message)]}}]},
+            status=400,
+        )
+
+    def post(self, request, *args, **kwargs):
+        try:
+            data = json.loads(request.body)
+        except ValueError:
+            return self.bad_request("__all__", _("Request must be JSON"))
+        if not isinstance(data, dict):
+            return self.bad_request("__all__", _("Request must be JSON"))
+
+        action = data.get("action")
+        key = "items" if action in ("create", "update") else "ids"
+        items = data.get(key)
+        if action not in ("create", "update", "set_status", "delete"):
+            return self.bad_request("action", _("Unknown action"))
+        if not isinstance(items, list) or not items:
+            return self.bad_request(key, _("This field is required."))
+        if len(items) > self.max_items:
+            return self.bad_request(key, _(
+                "At most %(count)s items at once"
+            ) % {"count": self.max_items})
+
+        service = BulkTaskService(request.user)
+        if action == "set_status":
+            result = service.set_status(items, data.get("status"))
+        else:
+            result = getattr(service, action)(items)
+        return JsonResponse(result.as_dict(), status=200 if result.ok else 400)
@@ -0,0 +1,290 @@
+"""Concurrent HTTP clients driving the task manager like its users do."""
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from dataclasses import field
+from http.cookiejar import CookieJar
+from urllib.error import HTTPError
+from urllib.error import URLError
+from urllib.parse import urlencode
+from urllib.request import build_opener
+from urllib.request import HTTPCookieProcessor
+from urllib.request import HTTPRedirectHandler
+from urllib.request import Request
+
+from django.conf import settings
+from django.db import connection
+from django.urls import reverse
+
+from task_manager.tasks.models import Task
+
+
+class NoRedirect(HTTPRedirectHandler):
+    """Measure the response itself, not the page it redirects to."""
+
+    def redirect_request(self, *args, **kwargs):
+        return None
+
+
+@dataclass
+class Sample:
+    scenario: str
+    elapsed_ms: float
+    status: int
+    queries: int | None
+
+
+# Pages served by async views under ASGI, see ASYNC_VIEWS setting
+READ_WEIGHTS = {"list": 50, "detail": 35, "lookup": 15}
+
+
+@dataclass
+class Workload:
+    """Objects the clients pick request parameters from."""
+    status_ids: list
+    label_ids: list
+    user_ids: list
+    task_ids: list
+    weights: dict = field(default_factory=lambda: {
+        "list": 50,
+        "detail": 25,
+        "create": 10,
+        "update": 10,
+        "delete": 5,
+        "lookup": 0,
+    })
+
+
+class LoadClient:
+    """One logged in user sending requests in its own thread."""
+
+    def __init__(self, base_url: str, username: str, password: str,
+                 workload: Workload, samples: list, seed_value: int):
+        self.base_url = base_url.rstrip("/")
+        self.username = username
+        self.password = password
+        self.workload = workload
+        self.samples = samples
+        self.rng = random.Random(seed_value)
+        self.cookies = CookieJar()
+        self.opener = build_opener(HTTPCookieProcessor(self.cookies),
+                                   NoRedirect)
+        # Tasks created by this client, only they may be changed or deleted
+        self.own_tasks = []
+        self.created = 0
+
+    @property
+    def csrf_token(self) -> str:
+        for cookie in self.cookies:
+            if cookie.name == settings.CSRF_COOKIE_NAME:
+                return cookie.value
+        return ""
+
+    def request(self, scenario: str, path: str, data: dict = None) -> int:
+        body = None
+        if data is not None:
+            data = {**data, "csrfmiddlewaretoken": self.csrf_token}
+            body = urlencode(data, doseq=True).encode()
+        request = Request(self.base_url + path, data=body)
+        started = time.perf_counter()
+        try:
+            with self.opener.open(request) as response:
+                response.read()
+                status, headers = response.status, response.headers
+        except HTTPError as error:
+            status, headers = error.code, error.headers
+        except URLError:
+            status, headers = 0, {}
+        elapsed = (time.perf_counter() - started) * 1000
+        queries = headers.get("X-Query-Count")
+        self.samples.append(Sample(
+            scenario, elapsed, status,
+            int(queries) if queries is not None else None,
+        ))
+        return status
+
+    def login(self) -> None:
+        self.request("login_form", reverse("login"))
+        self.request("login", reverse("login"), {
+            "username": self.username,
+            "password": self.password,
+        })
+
+    def task_data(self, name: str) -> dict:
+        workload = self.workload
+        return {
+            "name": name,
+            "description": "Load test task",
+            "status": self.rng.choice(workload.status_ids),
+            "performer": self.rng.choice(workload.user_ids),
+            "labels": self.rng.sample(
+                workload.label_ids, min(2, len(workload.label_ids))
+            ),
+        }
+
+    def list_tasks(self) -> None:
+        workload = self.workload
+        params = self.rng.choice([
+            {},
+            {"status": self.rng.choice(workload.status_ids)},
+            {"performer": self.rng.choice(workload.user_ids)},
+            {"labels": self.rng.choice(workload.label_ids)},
+            {"own_task": "on"},
+            {
+                "status": self.rng.choice(workload.status_ids),
+                "performer": self.rng.choice(workload.user_ids),
+            },
+            {"ordering": "name"},
+        ])
+        query = f"?{urlencode(params)}" if params else ""
+        self.request("list", reverse("list_task") + query)
+
+    def detail(self) -> None:
+        pk = self.rng.choice(self.workload.task_ids)
+        self.request("detail", reverse("detail_task", args=[pk]))
+
+    def lookup(self) -> None:
+        """Typeahead request for a prefix of the generated names."""
+        url = reverse(self.rng.choice(["lookup_user", "lookup_label"]))
+        term = self.username[:self.rng.randrange(len(self.username) + 1)]
+        self.request("lookup", f"{url}?{urlencode({'q': term})}")
+
+    def create(self) -> None:
+        self.created += 1
+        name = f"load-{self.username}-{self.created}-{self.rng.random()}"
+        status = self.request(
+            "create", reverse("create_task"), self.task_data(name)
+        )
+        if status == 302:
+            pk = Task.objects.filter(name=name) \
+                .values_list("pk", flat=True).first()
+            if pk is not None:
+                self.own_tasks.append((pk, name))
+
+    def update(self) -> None:
+        pk, name = self.rng.choice(self.own_tasks)
+        self.request(
+            "update",
+            reverse("update_task", args=[pk]),
+            self.task_data(name),
+        )
+
+    def delete(self) -> None:
+        pk, _ = self.own_tasks.pop(self.rng.randrange(len(self.own_tasks)))
+        self.request("delete", reverse("delete_task", args=[pk]), {})
+
+    def run(self, deadline: float) -> None:
+        actions = {
+            "list": self.list_tasks,
+            "detail": self.detail,
+            "create": self.create,
+            "update": self.update,
+            "delete": self.delete,
+            "lookup": self.lookup,
+        }
+        names = list(self.workload.weights)
+        weights = list(self.workload.weights.values())
+        try:
+            self.login()
+            while time.perf_counter() < deadline:
+                name = self.rng.choices(names, weights)[0]
+                if name in ("update", "delete") and not self.own_tasks:
+                    name = "create"
+                actions[name]()
+        finally:
+            # Threads get their own connections, used to find created tasks
+            connection.close()
+
+
+def collect_static(env: dict) -> dict:
+    """
+    Environment of a server with static files collected to a temporary
+    STATIC_ROOT by its settings. Production pages fail without the
+    manifest collectstatic writes.
+    """
+    env = {**env, "STATIC_ROOT": tempfile.mkdtemp(prefix="static-")}
+    subprocess.run(
+        [sys.executable, "manage.py", "collectstatic", "--noinput",
+         "--verbosity=0"],
+        env=env, check=True, cwd=settings.BASE_DIR.parent,
+    )
+    return env
+
+
+def gunicorn_command(bind: str, workers: int) -> list[str]:
+    """WSGI server with sync workers, sync views."""
+    return [
+        sys.executable, "-m", "gunicorn",
+        "task_manager.core.wsgi:application",
+        "--bind", bind,
+        "--workers", str(workers),
+        "--log-level", "warning",
+    ]
+
+
+def uvicorn_command(bind: str, workers: int) -> list[str]:
+    """ASGI server, async views are turned on by core/asgi.py."""
+    host, port = bind.rsplit(":", 1)
+    return [
+        sys.executable, "-m", "uvicorn",
+        "task_manager.core.asgi:application",
+        "--host", host,
+        "--port", port,
+        "--workers", str(workers),
+        "--log-level", "warning",
+        # Django's ASGI handler doesn't answer lifespan events
+        "--lifespan", "off",
+    ]
+
+
+SERVERS = {
+    "gunicorn": gunicorn_command,
+    "uvicorn": uvicorn_command,
+}
+
+
+def run_clients(clients: list[LoadClient], duration: float) -> float:
+    """Run clients concurrently for duration seconds, return wall time."""
+    started = time.perf_counter()
+    deadline = started + duration
+    threads = [
+        threading.Thread(target=client.run, args=(deadline,))
+        for client in clients
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - started
+
+
+def summarize(samples: list[Sample], wall_time: float) -> dict:
+    """Latency percentiles, throughput and queries per request."""
+    timings = sorted(sample.elapsed_ms for sample in samples)
+    if not timings:
+        return {"requests": 0}
+    if len(timings) > 1:
+        cuts = statistics.quantiles(timings, n=100, method="inclusive")
+        p50, p95, p99 = cuts[49], cuts[94], cuts[98]
+    else:
+        p50 = p95 = p99 = timings[0]
+    queries = [
+        sample.queries for sample in samples if sample.queries is not None
+    ]
+    return {
+        "requests": len(samples),
+        "errors": sum(
+            1 for sample in samples if not 200 <= sample.status < 400
+        ),
+        "rps": round(len(samples) / wall_time, 2),
+        "p50_ms": round(p50, 3),
+        "p95_ms": round(p95, 3),
+        "p99_ms": round(p99, 3),
+        "queries_per_request": round(statistics.mean(queries), 2)
+        if queries else None,
+    }
@@ -0,0 +1,51 @@
+import json
+
+from task_manager.benchmarks.loadtest import SERVERS
+from task_manager.benchmarks.management.commands import loadtest
+from task_manager.benchmarks.seeding import seed
+from task_manager.benchmarks.seeding import SeedVolumes
+
+
+class Command(loadtest.Command):
+    help = (
+        "Compare throughput of gunicorn with sync views (WSGI) and "
+        "uvicorn with async views (ASGI) under many concurrent "
+        "connections. Both get the same workers, clients and read "
+        "workload: task list, task detail and lookups."
+    )
+
+    def add_arguments(self, parser):
+        super().add_arguments(parser)
+        parser.add_argument(
+            "--servers", nargs="+", choices=SERVERS, default=list(SERVERS),
+        )
+        parser.set_defaults(clients=64, duration=20, read_only=True)
+
+    def handle(self, *args, **options):
+        if not options["skip_seed"]:
+            volumes = SeedVolumes(
+                users=max(options["users"], options["clients"]),
+                statuses=options["statuses"],
+                labels=options["labels"],
+                tasks=options["tasks"],
+                password=options["password"],
+            )
+            seed(volumes, progress=self.progress)
+            self.stdout.write("")
+
+        results = {}
+        for server in options["servers"]:
+            self.stdout.write(self.style.MIGRATE_HEADING(server))
+            results[server] = self.run_load({**options, "server": server})
+            self.report(results[server])
+
+        self.stdout.write(self.style.MIGRATE_HEADING("Comparison"))
+        for server, result in results.items():
+            total = result["total"]
+            self.stdout.write(
+                f"{server:>12}: {total['rps']} rps, "
+                f"p95 {total['p95_ms']} ms, {total['errors']} errors"
+            )
+        if options["json_path"]:
+            with open(options["json_path"], "w") as file:
+                json.dump(results, file, indent=2)
@@ -0,0 +1,180 @@
+import json
+import statistics
+import time
+from types import SimpleNamespace
+
+from django.core.management.base import BaseCommand
+from django.db import connections
+from django.db import models
+
+from task_manager.benchmarks.seeding import seed
+from task_manager.benchmarks.seeding import SeedVolumes
+from task_manager.core.pagination import KeysetPaginator
+from task_manager.tasks.filters import TaskFilter
+from task_manager.tasks.models import Task
+from task_manager.tasks.models import TaskAndLabelNode
+
+# Indexes which existed before composite indexes were introduced:
+# the implicit single column indexes of foreign keys.
+BASELINE_INDEXES = {
+    Task: [
+        models.Index(fields=["status"], name="bench_task_status_idx"),
+        models.Index(fields=["author"], name="bench_task_author_idx"),
+        models.Index(fields=["performer"], name="bench_task_performer_idx"),
+    ],
+    TaskAndLabelNode: [
+        models.Index(fields=["task"], name="bench_node_task_idx"),
+        models.Index(fields=["label"], name="bench_node_label_idx"),
+    ],
+}
+
+
+class Command(BaseCommand):
+    help = (
+        "Seed tasks and compare EXPLAIN plans and timings of TaskFilter "
+        "queries without (before) and with (after) composite indexes."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--tasks", type=int, default=1_000_000)
+        parser.add_argument("--users", type=int, default=1000)
+        parser.add_argument("--statuses", type=int, default=20)
+        parser.add_argument("--labels", type=int, default=200)
+        parser.add_argument("--page-size", type=int, default=50)
+        parser.add_argument("--repeat", type=int, default=5)
+        parser.add_argument("--database", default="default")
+        parser.add_argument(
+            "--skip-seed", action="store_true",
+            help="Use rows which are already in the database.",
+        )
+        parser.add_argument(
+            "--json", dest="json_path",
+            help="Write results as JSON to this file.",
+        )
+
+    def handle(self, *args, **options):
+        self.using = options["database"]
+        self.page_size = options["page_size"]
+        self.repeat = options["repeat"]
+
+        if not options["skip_seed"]:
+            volumes = SeedVolumes(
+                users=options["users"],
+                statuses=options["statuses"],
+                labels=options["labels"],
+                tasks=options["tasks"],
+            )
+            started = time.perf_counter()
+            seed(volumes, using=self.using, progress=self.progress)
+            self.stdout.write(
+                f"Seeded in {time.perf_counter() - started:.1f}s"
+            )
+
+        scenarios = self.get_scenarios()
+        results = {}
+        try:
+            self.use_indexes(new=False)
+            results["before"] = self.measure(scenarios)
+        finally:
+            self.use_indexes(new=True)
+        results["after"] = self.measure(scenarios)
+
+        self.report(results)
+        if options["json_path"]:
+            with open(options["json_path"], "w") as file:
+                json.dump(results, file, indent=2)
+
+    def progress(self, model, count):
+        self.stdout.write(f"  {model._meta.label}: {count}", ending="\r")
+
+    def get_scenarios(self) -> dict:
+        """TaskFilter parameters of the typical list requests."""
+        tasks = Task.objects.using(self.using)
+        sample = tasks.exclude(performer=None).order_by("-pk").first()
+        label = TaskAndLabelNode.objects.using(self.using) \
+            .order_by("-pk").values_list("label", flat=True).first()
+        return {
+            "all": ({}, None),
+            "status": ({"status": sample.status_id}, None),
+            "performer": ({"performer": sample.performer_id}, None),
+            "own_task": ({"own_task": "on"}, sample.author),
+            "label": ({"labels": label}, None),
+            "status+performer": ({
+                "status": sample.status_id,
+                "performer": sample.performer_id,
+            }, None),
+        }
+
+    def page_queryset(self, data: dict, user):
+        """First page of the list exactly as TaskIndexView builds it."""
+        queryset = Task.objects.using(self.using).order_by("-created_at")
+        filterset = TaskFilter(
+            data, queryset=queryset, request=SimpleNamespace(user=user)
+        )
+        return KeysetPaginator(filterset.qs, self.page_size).page_queryset()
+
+    def measure(self, scenarios: dict) -> dict:
+        with connections[self.using].cursor() as cursor:
+            cursor.execute("ANALYZE")
+        results = {}
+        for name, (data, user) in scenarios.items():
+            queryset = self.page_queryset(data, user)
+            timings = []
+            for _ in range(self.repeat):
+                started = time.perf_counter()
+                list(queryset.all())
+                timings.append((time.perf_counter() - started) * 1000)
+            results[name] = {
+                "plan": queryset.explain(),
+                "median_ms": round(statistics.median(timings), 3),
+                "max_ms": round(max(timings), 3),
+            }
+        return results
+
+    def use_indexes(self, new: bool) -> None:
+        """Switch between baseline and composite indexes and constraints."""
+        connection = connections[self.using]
+        for model, baseline in BASELINE_INDEXES.items():
+            composite = list(model._meta.indexes)
+            to_drop, to_add = (baseline, composite) if new \
+                else (composite, baseline)
+            # SQLite rebuilds the table to change a unique constraint and
+            # recreates Meta indexes with it, so constraints go first and
+            # indexes are switched according to what really exists.
+            constraints = model._meta.constraints
+            with connection.schema_editor() as editor:
+                for constraint in constraints:
+                    if new:
+                        editor.add_constraint(model, constraint)
+                        continue
+                    # The rebuilt table must not get it back from Meta
+                    model._meta.constraints = []
+                    try:
+                        editor.remove_constraint(model, constraint)
+                    finally:
+                        model._meta.constraints = constraints
+            with connection.cursor() as cursor:
+                existing = connection.introspection.get_constraints(
+                    cursor, model._meta.db_table
+                )
+            with connection.schema_editor() as editor:
+                for index in to_drop:
+                    if index.name in existing:
+                        editor.remove_index(model, index)
+                for index in to_add:
+                    if index.name not in existing:
+                        editor.add_index(model, index)
+
+    def report(self, results: dict) -> None:
+        for name in results["after"]:
+            before = results["before"][name]
+            after = results["after"][name]
+            self.stdout.write(self.style.MIGRATE_HEADING(name))
+            self.stdout.write(f"  before {before['median_ms']} ms")
+            self.stdout.write(f"    {before['plan']}".replace(
+                "\n", "\n    "
+            ))
+            self.stdout.write(f"  after {after['median_ms']} ms")
+            self.stdout.write(f"    {after['plan']}".replace(
+                "\n", "\n    "
+            ))
@@ -0,0 +1,113 @@
+import json
+import statistics
+import time
+from collections import Counter
+
+from django.core.management.base import BaseCommand
+from django.core.management.base import CommandError
+from django.db.models import Q
+
+from task_manager.benchmarks.seeding import seed
+from task_manager.benchmarks.seeding import SeedVolumes
+from task_manager.tasks.models import Task
+
+
+class Command(BaseCommand):
+    help = (
+        "Seed tasks with generated descriptions and compare full-text "
+        "search with icontains filtering for common and rare words."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--tasks", type=int, default=200_000)
+        parser.add_argument("--page-size", type=int, default=50)
+        parser.add_argument("--repeat", type=int, default=5)
+        parser.add_argument("--database", default="default")
+        parser.add_argument(
+            "--skip-seed", action="store_true",
+            help="Use rows which are already in the database.",
+        )
+        parser.add_argument(
+            "--json", dest="json_path",
+            help="Write results as JSON to this file.",
+        )
+
+    def handle(self, *args, **options):
+        self.using = options["database"]
+        self.page_size = options["page_size"]
+        self.repeat = options["repeat"]
+
+        if not options["skip_seed"]:
+            started = time.perf_counter()
+            seed(SeedVolumes(tasks=options["tasks"]), using=self.using,
+                 progress=self.progress)
+            self.stdout.write(
+                f"Seeded in {time.perf_counter() - started:.1f}s"
+            )
+
+        results = {}
+        for kind, term in self.get_terms().items():
+            results[f"{kind}: {term}"] = {
+                name: self.measure(queryset)
+                for name, queryset in self.get_queries(term).items()
+            }
+        self.report(results)
+        if options["json_path"]:
+            with open(options["json_path"], "w") as file:
+                json.dump(results, file, indent=2)
+
+    def progress(self, model, count):
+        self.stdout.write(f"  {model._meta.label}: {count}", ending="\r")
+
+    def get_terms(self) -> dict:
+        """Most common, middle and rarest word of sampled descriptions."""
+        sample = Task.objects.using(self.using).order_by("-pk") \
+            .values_list("description", flat=True)[:2000]
+        words = Counter(
+            word for description in sample for word in description.split()
+        ).most_common()
+        if not words:
+            raise CommandError("There are no task descriptions to search.")
+        return {
+            "common": words[0][0],
+            "middle": words[len(words) // 2][0],
+            "rare": words[-1][0],
+        }
+
+    def get_queries(self, term: str) -> dict:
+        tasks = Task.objects.using(self.using)
+        contains = tasks.filter(
+            Q(name__icontains=term) | Q(description__icontains=term)
+        )
+        found = tasks.search(term)
+        return {
+            "icontains_page": contains.order_by("-created_at")
+            [:self.page_size],
+            "icontains_ids": contains.values("pk"),
+            "search_page": found[:self.page_size],
+            "search_ids": found.values("pk"),
+        }
+
+    def measure(self, queryset) -> dict:
+        timings = []
+        for _ in range(self.repeat):
+            started = time.perf_counter()
+            rows = len(list(queryset.all()))
+            timings.append((time.perf_counter() - started) * 1000)
+        return {
+            "rows": rows,
+            "plan": queryset.explain(),
+            "median_ms": round(statistics.median(timings), 3),
+        }
+
+    def report(self, results: dict) -> None:
+        for term, queries in results.items():
+            self.stdout.write(self.style.MIGRATE_HEADING(term))
+            for name, result in queries.items():
+                self.stdout.write(
+                    f"  {name}: {result['median_ms']} ms, "
+                    f"{result['rows']} rows"
+                )
+                self.stdout.write(f"    {result['plan']}".replace(
+                    "\n", "\n    "
+                ))
@@ -0,0 +1,119 @@
+import json
+import statistics
+import time
+
+from django.core.management.base import BaseCommand
+from django.core.management.base import CommandError
+from django.db import connection
+from django.test import Client
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from task_manager.benchmarks.seeding import seed
+from task_manager.benchmarks.seeding import SeedVolumes
+from task_manager.tasks.models import Task
+from task_manager.users.models import User
+
+# Session engine and user cache timeout of every mode
+MODES = {
+    "db": {
+        "SESSION_ENGINE": "django.contrib.sessions.backends.db",
+        "USER_CACHE_TIMEOUT": 0,
+    },
+    "db+user_cache": {
+        "SESSION_ENGINE": "django.contrib.sessions.backends.db",
+        "USER_CACHE_TIMEOUT": 300,
+    },
+    "cached_db+user_cache": {
+        "SESSION_ENGINE": "django.contrib.sessions.backends.cached_db",
+        "USER_CACHE_TIMEOUT": 300,
+    },
+}
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare database queries and time of authenticated requests "
+        "with database sessions, cached session users and cached sessions."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--requests", type=int, default=50)
+        parser.add_argument("--tasks", type=int, default=1000)
+        parser.add_argument(
+            "--skip-seed", action="store_true",
+            help="Use rows which are already in the database.",
+        )
+        parser.add_argument(
+            "--json", dest="json_path",
+            help="Write results as JSON to this file.",
+        )
+
+    def handle(self, *args, **options):
+        if not options["skip_seed"]:
+            seed(SeedVolumes(users=20, labels=20, tasks=options["tasks"]))
+        user = User.objects.filter(is_superuser=False).order_by("-pk").first()
+        if user is None:
+            raise CommandError("There are no users to log in with.")
+
+        results = {}
+        for mode, mode_settings in MODES.items():
+            self.stdout.write(self.style.MIGRATE_HEADING(mode))
+            with override_settings(**mode_settings):
+                results[mode] = self.measure(user, options["requests"])
+            self.report(results[mode])
+
+        if options["json_path"]:
+            with open(options["json_path"], "w") as file:
+                json.dump(results, file, indent=2)
+
+    def get_urls(self) -> dict:
+        task = Task.objects.order_by("-pk").first()
+        urls = {
+            "list_task": reverse("list_task"),
+            "list_status": reverse("list_status"),
+            "dashboard": reverse("dashboard"),
+        }
+        if task is not None:
+            urls["detail_task"] = reverse("detail_task", args=[task.pk])
+        return urls
+
+    def measure(self, user: User, requests: int) -> dict:
+        """Queries of a repeated request, the first one fills caches."""
+        # A new client sets up the middleware with the mode's settings
+        client = Client()
+        client.force_login(user)
+        results = {}
+        for name, url in self.get_urls().items():
+            client.get(url)
+            timings = []
+            for _ in range(requests):
+                started = time.perf_counter()
+                client.get(url)
+                timings.append((time.perf_counter() - started) * 1000)
+            with CaptureQueriesContext(connection) as queries:
+                client.get(url)
+            sql = [query["sql"] for query in queries.captured_queries]
+            results[name] = {
+                "median_ms": round(statistics.median(timings), 3),
+                "queries": len(sql),
+                "session_queries": sum(
+                    1 for query in sql if '"django_session"' in query
+                ),
+                "user_queries": sum(
+                    1 for query in sql if query.startswith(
+                        f'SELECT "{User._meta.db_table}"'
+                    )
+                ),
+            }
+        return results
+
+    def report(self, result: dict) -> None:
+        for name, timing in result.items():
+            self.stdout.write(
+                f"  {name}: median {timing['median_ms']} ms, "
+                f"{timing['queries']} queries, "
+                f"{timing['session_queries']} session, "
+                f"{timing['user_queries']} user"
+            )
@@ -0,0 +1,163 @@
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from argparse import SUPPRESS
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.core.management.base import CommandError
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from task_manager.benchmarks.loadtest import collect_static
+from task_manager.benchmarks.seeding import seed
+from task_manager.benchmarks.seeding import SeedVolumes
+from task_manager.tasks.models import Task
+from task_manager.users.models import User
+
+PROFILES = (
+    "task_manager.core.settings.development",
+    "task_manager.core.settings.production",
+)
+
+# What a WSGI server does before it can answer the first request
+STARTUP_SCRIPT = (
+    "from django.core.wsgi import get_wsgi_application;"
+    "get_wsgi_application()"
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare startup time and per-request overhead of settings "
+        "profiles, every profile is measured in its own process."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--profiles", nargs="+", default=PROFILES)
+        parser.add_argument("--requests", type=int, default=50)
+        parser.add_argument("--startup-repeat", type=int, default=5)
+        parser.add_argument("--tasks", type=int, default=1000)
+        parser.add_argument(
+            "--skip-seed", action="store_true",
+            help="Use rows which are already in the database.",
+        )
+        parser.add_argument(
+            "--json", dest="json_path",
+            help="Write results as JSON to this file.",
+        )
+        # Internal: measure requests in the current process and print JSON
+        parser.add_argument(
+            "--worker", action="store_true", help=SUPPRESS
+        )
+        parser.add_argument("--user", type=int, help=SUPPRESS)
+
+    def handle(self, *args, **options):
+        if options["worker"]:
+            results = self.measure_requests(
+                options["user"], options["requests"]
+            )
+            self.stdout.write(json.dumps(results))
+            return
+
+        if not options["skip_seed"]:
+            seed(SeedVolumes(users=20, labels=20, tasks=options["tasks"]))
+        user = User.objects.filter(is_superuser=False).order_by("-pk").first()
+        if user is None:
+            raise CommandError("There are no users to log in with.")
+
+        results = {}
+        for profile in options["profiles"]:
+            self.stdout.write(self.style.MIGRATE_HEADING(profile))
+            # Profiles are measured in one process, with the same cache
+            env = collect_static({
+                "LOCAL_CACHE": "1",
+                **os.environ,
+                "DJANGO_SETTINGS_MODULE": profile,
+            })
+            results[profile] = {
+                "startup_ms": self.measure_startup(
+                    env, options["startup_repeat"]
+                ),
+                "requests": self.run_worker(
+                    env, user.pk, options["requests"]
+                ),
+            }
+            self.report(results[profile])
+
+        if options["json_path"]:
+            with open(options["json_path"], "w") as file:
+                json.dump(results, file, indent=2)
+
+    def measure_startup(self, env: dict, repeat: int) -> float:
+        """Median wall time of a fresh interpreter loading the application."""
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            subprocess.run(
+                [sys.executable, "-c", STARTUP_SCRIPT],
+                env=env, check=True, cwd=settings.BASE_DIR.parent,
+            )
+            timings.append((time.perf_counter() - started) * 1000)
+        return round(statistics.median(timings), 1)
+
+    def run_worker(self, env: dict, user_id: int, requests: int) -> dict:
+        completed = subprocess.run(
+            [
+                sys.executable, sys.argv[0], "benchmark_settings", "--worker",
+                f"--user={user_id}", f"--requests={requests}",
+            ],
+            env=env, check=True, capture_output=True, text=True,
+            cwd=settings.BASE_DIR.parent,
+        )
+        return json.loads(completed.stdout.splitlines()[-1])
+
+    def get_urls(self) -> dict:
+        task = Task.objects.order_by("-pk").first()
+        urls = {
+            "home": reverse("home"),
+            "list_task": reverse("list_task"),
+            "list_status": reverse("list_status"),
+            "list_label": reverse("list_label"),
+            "list_user": reverse("list_user"),
+        }
+        if task is not None:
+            urls["detail_task"] = reverse("detail_task", args=[task.pk])
+        return urls
+
+    def measure_requests(self, user_id: int, requests: int) -> dict:
+        """Per-request time through the whole middleware stack."""
+        client = Client()
+        client.force_login(User.objects.get(pk=user_id))
+        results = {}
+        for name, url in self.get_urls().items():
+            # The first request fills template and choice caches
+            client.get(url)
+            timings = []
+            for _ in range(requests):
+                started = time.perf_counter()
+                client.get(url)
+                timings.append((time.perf_counter() - started) * 1000)
+            with CaptureQueriesContext(connection) as queries:
+                client.get(url)
+            results[name] = {
+                "median_ms": round(statistics.median(timings), 3),
+                "p95_ms": round(
+                    statistics.quantiles(timings, n=20)[-1], 3
+                ) if len(timings) > 1 else round(timings[0], 3),
+                "queries": len(queries),
+            }
+        return results
+
+    def report(self, result: dict) -> None:
+        self.stdout.write(f"  startup {result['startup_ms']} ms")
+        for name, timing in result["requests"].items():
+            self.stdout.write(
+                f"  {name}: median {timing['median_ms']} ms, "
+                f"p95 {timing['p95_ms']} ms, {timing['queries']} queries"
+            )
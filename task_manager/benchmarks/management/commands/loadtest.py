@@ -0,0 +1,215 @@
+import json
+import os
+import subprocess
+import tempfile
+import time
+from urllib.error import URLError
+from urllib.request import urlopen
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.core.management.base import CommandError
+from django.urls import reverse
+
+from task_manager.benchmarks.loadtest import collect_static
+from task_manager.benchmarks.loadtest import LoadClient
+from task_manager.benchmarks.loadtest import READ_WEIGHTS
+from task_manager.benchmarks.loadtest import run_clients
+from task_manager.benchmarks.loadtest import SERVERS
+from task_manager.benchmarks.loadtest import summarize
+from task_manager.benchmarks.loadtest import Workload
+from task_manager.benchmarks.seeding import seed
+from task_manager.benchmarks.seeding import SeedVolumes
+from task_manager.labels.models import Label
+from task_manager.statuses.models import Status
+from task_manager.tasks.models import Task
+from task_manager.users.models import User
+
+
+class Command(BaseCommand):
+    help = (
+        "Seed data, start gunicorn or uvicorn and drive the real routes with "
+        "concurrent logged in clients. Reports p50/p95/p99 latency, "
+        "requests/sec and queries per request."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--users", type=int, default=100)
+        parser.add_argument("--statuses", type=int, default=10)
+        parser.add_argument("--labels", type=int, default=50)
+        parser.add_argument("--tasks", type=int, default=10_000)
+        parser.add_argument(
+            "--skip-seed", action="store_true",
+            help="Use generated rows which are already in the database.",
+        )
+        parser.add_argument("--password", default=SeedVolumes.password)
+        parser.add_argument("--clients", type=int, default=8)
+        parser.add_argument(
+            "--duration", type=float, default=30,
+            help="Seconds to send requests for.",
+        )
+        parser.add_argument("--workers", type=int, default=2)
+        parser.add_argument(
+            "--server", choices=SERVERS, default="gunicorn",
+            help="gunicorn serves the WSGI application with sync views, "
+                 "uvicorn the ASGI one with async views.",
+        )
+        parser.add_argument(
+            "--read-only", action="store_true",
+            help="Send only list, detail and lookup requests.",
+        )
+        parser.add_argument("--bind", default="127.0.0.1:8765")
+        parser.add_argument(
+            "--settings-profile",
+            default="task_manager.core.settings.production",
+            help="DJANGO_SETTINGS_MODULE of the server process.",
+        )
+        parser.add_argument(
+            "--url",
+            help="Test an already running server instead of starting one.",
+        )
+        parser.add_argument(
+            "--json", dest="json_path",
+            help="Write results as JSON to this file.",
+        )
+
+    def handle(self, *args, **options):
+        if not options["skip_seed"]:
+            volumes = SeedVolumes(
+                users=options["users"],
+                statuses=options["statuses"],
+                labels=options["labels"],
+                tasks=options["tasks"],
+                password=options["password"],
+            )
+            seed(volumes, progress=self.progress)
+            self.stdout.write("")
+
+        results = self.run_load(options)
+        self.report(results)
+        if options["json_path"]:
+            with open(options["json_path"], "w") as file:
+                json.dump(results, file, indent=2)
+
+    def run_load(self, options) -> dict:
+        """Start the server unless --url is given and send the requests."""
+        workload, usernames = self.get_workload(options["clients"])
+        if options["read_only"]:
+            workload.weights = READ_WEIGHTS
+        server = None
+        base_url = options["url"]
+        if base_url is None:
+            base_url = f"http://{options['bind']}"
+            server = self.start_server(options)
+        try:
+            self.wait_ready(base_url, server, options["server"])
+            samples = []
+            clients = [
+                LoadClient(base_url, username, options["password"],
+                           workload, samples, seed_value=number)
+                for number, username in enumerate(usernames)
+            ]
+            wall_time = run_clients(clients, options["duration"])
+        finally:
+            if server is not None:
+                server.terminate()
+                server.wait()
+
+        return {
+            "meta": {
+                "commit": self.get_commit(),
+                "server": options["server"],
+                "settings": options["settings_profile"],
+                "clients": options["clients"],
+                "workers": options["workers"],
+                "duration_s": round(wall_time, 2),
+                "tasks": Task.objects.count(),
+            },
+            "total": summarize(samples, wall_time),
+            "scenarios": {
+                scenario: summarize(
+                    [s for s in samples if s.scenario == scenario], wall_time
+                )
+                for scenario in sorted({s.scenario for s in samples})
+            },
+        }
+
+    def progress(self, model, count):
+        self.stdout.write(f"  {model._meta.label}: {count}", ending="\r")
+
+    def get_workload(self, clients: int) -> tuple[Workload, list]:
+        """Ids to build requests from and generated users to log in as."""
+        users = User.objects.filter(
+            username__startswith="bench-"
+        ).order_by("-pk")
+        usernames = list(users.values_list("username", flat=True)[:clients])
+        if len(usernames) < clients:
+            raise CommandError(
+                f"Only {len(usernames)} generated users exist, "
+                f"{clients} clients need one each."
+            )
+        workload = Workload(
+            status_ids=list(Status.objects.values_list("pk", flat=True)),
+            label_ids=list(Label.objects.values_list("pk", flat=True)),
+            user_ids=list(users.values_list("pk", flat=True)[:1000]),
+            task_ids=list(
+                Task.objects.order_by("-pk").values_list("pk", flat=True)
+                [:1000]
+            ),
+        )
+        if not (workload.status_ids and workload.label_ids
+                and workload.task_ids):
+            raise CommandError("Seed statuses, labels and tasks first.")
+        return workload, usernames
+
+    def start_server(self, options) -> subprocess.Popen:
+        env = {
+            **os.environ,
+            "DJANGO_SETTINGS_MODULE": options["settings_profile"],
+            "QUERY_COUNT_HEADER": "1",
+        }
+        if "CACHE_BACKEND" not in env:
+            # Workers must see cache invalidation of each other
+            env["CACHE_BACKEND"] = \
+                "django.core.cache.backends.filebased.FileBasedCache"
+            env["CACHE_LOCATION"] = tempfile.mkdtemp(prefix="loadtest-")
+        return subprocess.Popen(
+            SERVERS[options["server"]](options["bind"], options["workers"]),
+            env=collect_static(env), cwd=settings.BASE_DIR.parent,
+        )
+
+    def wait_ready(self, base_url: str, server, name: str,
+                   timeout: float = 30) -> None:
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if server is not None and server.poll() is not None:
+                raise CommandError(f"{name} exited, see its output above.")
+            try:
+                with urlopen(base_url + reverse("login")):
+                    return
+            except URLError:
+                time.sleep(0.2)
+        raise CommandError(f"{base_url} did not respond in {timeout}s.")
+
+    def get_commit(self) -> str | None:
+        try:
+            return subprocess.run(
+                ["git", "rev-parse", "--short", "HEAD"],
+                capture_output=True, text=True, check=True,
+                cwd=settings.BASE_DIR.parent,
+            ).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            return None
+
+    def report(self, results: dict) -> None:
+        rows = {"total": results["total"], **results["scenarios"]}
+        for name, stats in rows.items():
+            if not stats["requests"]:
+                continue
+            self.stdout.write(
+                f"{name:>12}: {stats['requests']} requests, "
+                f"{stats['errors']} errors, {stats['rps']} rps, "
+                f"p50 {stats['p50_ms']} ms, p95 {stats['p95_ms']} ms, "
+                f"p99 {stats['p99_ms']} ms, "
+                f"{stats['queries_per_request']} queries"
+            )
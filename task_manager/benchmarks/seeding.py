@@ -0,0 +1,161 @@
+"""Fill database with generated users, statuses, labels and tasks."""
+import random
+from dataclasses import dataclass
+from datetime import timedelta
+from itertools import accumulate
+from uuid import uuid4
+
+from django.contrib.auth.hashers import make_password
+from django.db import transaction
+from django.utils import timezone
+
+from task_manager.labels.models import Label
+from task_manager.statuses.models import Status
+from task_manager.tasks.counters import reconcile_counters
+from task_manager.tasks.models import explicit_created_at
+from task_manager.tasks.models import Task
+from task_manager.tasks.models import TaskAndLabelNode
+from task_manager.users.models import User
+
+
+@dataclass
+class SeedVolumes:
+    """How many rows of every model to generate."""
+    users: int = 1000
+    statuses: int = 20
+    labels: int = 200
+    tasks: int = 100_000
+    # Tasks have from 0 to max_labels_per_task labels, fewer more often
+    max_labels_per_task: int = 5
+    # Share of tasks without performer
+    unassigned: float = 0.1
+    # Descriptions are up to description_words words long, picked from
+    # a generated vocabulary with Zipf-like frequencies
+    vocabulary: int = 5000
+    description_words: int = 60
+    # Creation dates are spread over this period
+    days: int = 365
+    batch_size: int = 5000
+    password: str = "bench"
+
+
+SYLLABLES = ("ka", "lo", "mi", "ne", "ru", "sa", "ti", "vo", "zu", "pre",
+             "dor", "fen", "gal", "hum", "jas", "kor", "lin", "mar")
+
+
+def make_vocabulary(size: int, rng: random.Random) -> list[str]:
+    """Distinct pronounceable words, the first ones are the most common."""
+    words = set()
+    while len(words) < size:
+        words.add("".join(rng.choices(SYLLABLES, k=rng.randint(2, 4))))
+    return sorted(words, key=lambda word: (len(word), word))
+
+
+@dataclass
+class SeedResult:
+    """Primary keys of generated objects, useful to build requests."""
+    prefix: str
+    user_ids: list
+    status_ids: list
+    label_ids: list
+    tasks: int = 0
+    nodes: int = 0
+
+
+def seed(volumes: SeedVolumes, using: str = "default",
+         seed_value: int = 0, progress=None) -> SeedResult:
+    """Bulk insert generated objects in batches, one transaction each."""
+    rng = random.Random(seed_value)
+    prefix = f"bench-{uuid4().hex[:8]}"
+    now = timezone.now()
+    password = make_password(volumes.password)
+
+    def batches(objects):
+        batch = []
+        for obj in objects:
+            batch.append(obj)
+            if len(batch) == volumes.batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    def insert(model, objects):
+        created = []
+        for batch in batches(objects):
+            with transaction.atomic(using=using):
+                created.extend(
+                    model.objects.using(using).bulk_create(batch)
+                )
+            if progress:
+                progress(model, len(created))
+        return created
+
+    users = insert(User, (
+        User(
+            username=f"{prefix}-user-{number}",
+            first_name=f"First{number}",
+            last_name=f"Last{number}",
+            password=password,
+        ) for number in range(volumes.users)
+    ))
+    statuses = insert(Status, (
+        Status(name=f"{prefix}-status-{number}")
+        for number in range(volumes.statuses)
+    ))
+    labels = insert(Label, (
+        Label(name=f"{prefix}-label-{number}")
+        for number in range(volumes.labels)
+    ))
+    result = SeedResult(
+        prefix=prefix,
+        user_ids=[user.pk for user in users],
+        status_ids=[status.pk for status in statuses],
+        label_ids=[label.pk for label in labels],
+    )
+
+    period = timedelta(days=volumes.days).total_seconds()
+    # Long tail fan-out: most tasks have few labels
+    label_counts = range(min(volumes.max_labels_per_task, volumes.labels) + 1)
+    label_weights = [1 / (count + 1) for count in label_counts]
+    vocabulary = make_vocabulary(volumes.vocabulary, rng)
+    word_weights = list(accumulate(
+        1 / rank for rank in range(1, len(vocabulary) + 1)
+    ))
+    with explicit_created_at():
+        for start in range(0, volumes.tasks, volumes.batch_size):
+            stop = min(start + volumes.batch_size, volumes.tasks)
+            tasks = [
+                Task(
+                    name=f"{prefix}-task-{number}",
+                    description=" ".join(rng.choices(
+                        vocabulary, cum_weights=word_weights,
+                        k=rng.randint(1, volumes.description_words),
+                    )),
+                    status_id=rng.choice(result.status_ids),
+                    author_id=rng.choice(result.user_ids),
+                    performer_id=None if rng.random() < volumes.unassigned
+                    else rng.choice(result.user_ids),
+                    created_at=now - timedelta(
+                        seconds=rng.random() * period
+                    ),
+                ) for number in range(start, stop)
+            ]
+            with transaction.atomic(using=using):
+                Task.objects.using(using).bulk_create(tasks)
+                nodes = [
+                    TaskAndLabelNode(task_id=task.pk, label_id=label_id)
+                    for task in tasks
+                    for label_id in rng.sample(
+                        result.label_ids,
+                        rng.choices(label_counts, label_weights)[0],
+                    )
+                ]
+                TaskAndLabelNode.objects.using(using).bulk_create(nodes)
+            result.tasks += len(tasks)
+            result.nodes += len(nodes)
+            if progress:
+                progress(Task, result.tasks)
+    # Counted once for all batches
+    reconcile_counters(using)
+    return result
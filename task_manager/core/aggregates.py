@@ -0,0 +1,22 @@
+from django.db.models import Aggregate
+from django.db.models import CharField
+from django.db.models import Value
+
+
+class GroupConcat(Aggregate):
+    """
+    Join values of a group into one string, in the database:
+    GROUP_CONCAT on SQLite, STRING_AGG on PostgreSQL.
+    Order of the joined values is not defined.
+    """
+
+    function = "GROUP_CONCAT"
+    output_field = CharField()
+
+    def __init__(self, expression, separator: str = ", ", **extra):
+        super().__init__(expression, Value(separator), **extra)
+
+    def as_postgresql(self, compiler, connection, **extra_context):
+        return super().as_sql(
+            compiler, connection, function="STRING_AGG", **extra_context
+        )
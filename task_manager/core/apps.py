@@ -0,0 +1,10 @@
+from django.apps import AppConfig
+
+
+class CoreConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'task_manager.core'
+
+    def ready(self):
+        from task_manager.core.signals import connect_signals
+        connect_signals()
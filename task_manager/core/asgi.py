@@ -10,6 +10,13 @@ import os
 
 from django.core.asgi import get_asgi_application
 
-os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'task_manager.core.settings')
+os.environ.setdefault(
+    'DJANGO_SETTINGS_MODULE', 'task_manager.core.settings.production'
+)
+# Task list, task detail and lookups are served by async views.
+# Database work of every request runs in a thread of its own, so
+# persistent connections would pile up per thread instead of being reused.
+os.environ.setdefault('ASYNC_VIEWS', '1')
+os.environ.setdefault('CONN_MAX_AGE', '0')
 
 application = get_asgi_application()
@@ -0,0 +1,77 @@
+"""
+PostgreSQL backend taking connections from a psycopg_pool.ConnectionPool.
+
+Django 5.0 has no pool of its own, connections are opened per thread and
+kept for CONN_MAX_AGE at most. Here closing a connection at the end of a
+request returns it to a pool shared by the threads of the process, so
+threads and ASGI requests don't pay for a new connection each.
+Pool arguments (min_size, max_size, timeout...) are read from
+OPTIONS["pool"], CONN_HEALTH_CHECKS makes the pool check connections
+before lending them. Requires psycopg 3 and psycopg_pool.
+"""
+from django.core.exceptions import ImproperlyConfigured
+from django.db.backends.postgresql import base
+from django.utils.asyncio import async_unsafe
+
+if not base.is_psycopg3:
+    raise ImproperlyConfigured("Connection pool requires psycopg 3.")
+
+try:
+    from psycopg_pool import ConnectionPool
+except ImportError as error:
+    raise ImproperlyConfigured(
+        "Connection pool requires psycopg_pool, install psycopg[pool]."
+    ) from error
+
+
+class DatabaseWrapper(base.DatabaseWrapper):
+    # Pools by alias, shared by the wrappers of all threads
+    _connection_pools = {}
+
+    @property
+    def pool(self) -> ConnectionPool:
+        if self.alias not in self._connection_pools:
+            if self.settings_dict["CONN_MAX_AGE"]:
+                raise ImproperlyConfigured(
+                    "Pooled connections are returned to the pool after "
+                    "every request, set CONN_MAX_AGE to 0."
+                )
+            params = self.get_connection_params()
+            # Django sets autocommit itself when it takes a connection
+            params["autocommit"] = True
+            check = ConnectionPool.check_connection \
+                if self.settings_dict["CONN_HEALTH_CHECKS"] else None
+            pool = ConnectionPool(
+                kwargs=params,
+                # Opened by the first connection, not when settings load
+                open=False,
+                check=check,
+                **self.settings_dict["OPTIONS"].get("pool", {}),
+            )
+            # Threads racing here build a pool each, the first one is kept
+            self._connection_pools.setdefault(self.alias, pool)
+        return self._connection_pools[self.alias]
+
+    def get_connection_params(self):
+        params = super().get_connection_params()
+        params.pop("pool", None)
+        return params
+
+    @async_unsafe
+    def get_new_connection(self, conn_params):
+        pool = self.pool
+        pool.open()
+        connection = pool.getconn()
+        isolation_level = self.settings_dict["OPTIONS"].get("isolation_level")
+        if isolation_level is None:
+            self.isolation_level = base.IsolationLevel.READ_COMMITTED
+        else:
+            self.isolation_level = base.IsolationLevel(isolation_level)
+            connection.isolation_level = self.isolation_level
+        return connection
+
+    def _close(self):
+        if self.connection is not None:
+            with self.wrap_database_errors:
+                # The pool rolls back a transaction left open
+                self.pool.putconn(self.connection)
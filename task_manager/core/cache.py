@@ -0,0 +1,210 @@
+from datetime import datetime
+from datetime import timezone
+from hashlib import md5
+from http import HTTPStatus
+from time import time_ns
+from urllib.parse import urlencode
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.messages import get_messages
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.utils.cache import patch_vary_headers
+from django.utils.translation import get_language
+from django.views.decorators.http import condition
+
+VERSION_KEY = "model-version:{}"
+PAGE_KEY = "anonymous-page:{}"
+
+
+def _version_key(model) -> str:
+    """Key of a model's version, or of a version named by a string."""
+    if isinstance(model, str):
+        return VERSION_KEY.format(model)
+    return VERSION_KEY.format(model._meta.label_lower)
+
+
+def get_model_versions(*models) -> list[int]:
+    """
+    Current versions of the models' tables.
+    A version is the time in nanoseconds of the last change, so a version
+    lost by the cache is replaced with a new one and never reused.
+    """
+    keys = [_version_key(model) for model in models]
+    versions = cache.get_many(keys)
+    missing = {key: time_ns() for key in keys if key not in versions}
+    if missing:
+        cache.set_many(missing, timeout=None)
+        versions.update(missing)
+    return [versions[key] for key in keys]
+
+
+async def aget_model_versions(*models) -> list[int]:
+    """get_model_versions() of async views."""
+    keys = [_version_key(model) for model in models]
+    versions = await cache.aget_many(keys)
+    missing = {key: time_ns() for key in keys if key not in versions}
+    if missing:
+        await cache.aset_many(missing, timeout=None)
+        versions.update(missing)
+    return [versions[key] for key in keys]
+
+
+def get_model_version(model) -> int:
+    return get_model_versions(model)[0]
+
+
+def bump_model_version(model) -> None:
+    """Invalidate every cache entry built with the model's version."""
+    cache.set(_version_key(model), time_ns(), timeout=None)
+
+
+class RowCacheMixin:
+    """
+    Let list_objects.html cache rendered rows.
+    Row key contains the values of `row_cache_fields`: the id and fields
+    which change with the row, like a modification timestamp or a
+    counter, the language and versions of `row_cache_models`: models
+    shown in a row, or names of versions of writes, which change rows
+    without changing these fields.
+    Rows are given to the template as (key, object) pairs in `rows`.
+    """
+
+    row_cache_fields = ("id",)
+    row_cache_models = ()
+
+    def get_row_cache_key(self, obj) -> str:
+        if isinstance(obj, dict):
+            values = [obj[name] for name in self.row_cache_fields]
+        else:
+            values = [getattr(obj, name) for name in self.row_cache_fields]
+        return "|".join(map(str, values))
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context["row_cache_timeout"] = settings.ROW_CACHE_TIMEOUT
+        context["row_cache_version"] = "-".join(
+            str(version)
+            for version in get_model_versions(*self.row_cache_models)
+        )
+        context["rows"] = [
+            (self.get_row_cache_key(obj), obj)
+            for obj in context["object_list"]
+        ]
+        return context
+
+
+class AnonymousPageCacheMixin:
+    """
+    Serve pages of anonymous users from the cache, without rendering
+    and without queries. A page is cached per language, values of
+    `page_cache_params`: query parameters the view reads, and with
+    versions of `page_cache_models`: models shown on the page, so their
+    changes render it again. Authenticated users, requests with other
+    query parameters and with pending flash messages are always rendered.
+    """
+
+    page_cache_models = ()
+    page_cache_params = ()
+
+    def get_page_cache_key(self, request) -> str:
+        params = sorted(
+            (name, request.GET.getlist(name))
+            for name in self.page_cache_params if name in request.GET
+        )
+        parts = [
+            request.path,
+            urlencode(params, doseq=True),
+            get_language(),
+            *map(str, get_model_versions(*self.page_cache_models)),
+        ]
+        return PAGE_KEY.format(md5("|".join(parts).encode()).hexdigest())
+
+    def dispatch(self, request, *args, **kwargs):
+        if request.method not in ("GET", "HEAD") \
+                or not settings.PAGE_CACHE_TIMEOUT \
+                or request.user.is_authenticated \
+                or not set(request.GET).issubset(self.page_cache_params) \
+                or len(get_messages(request)):
+            return super().dispatch(request, *args, **kwargs)
+        key = self.get_page_cache_key(request)
+        cached = cache.get(key)
+        if cached is not None:
+            content, content_type = cached
+            response = HttpResponse(content, content_type=content_type)
+        else:
+            response = super().dispatch(request, *args, **kwargs)
+            if response.status_code == HTTPStatus.OK:
+                response.add_post_render_callback(
+                    lambda rendered: cache.set(
+                        key,
+                        (rendered.content, rendered["Content-Type"]),
+                        settings.PAGE_CACHE_TIMEOUT,
+                    )
+                )
+        # The page differs for logged in users and in other languages
+        patch_vary_headers(response, ("Cookie", "Accept-Language"))
+        return response
+
+
+class ConditionalGetMixin:
+    """
+    Answer 304 Not Modified without rendering when nothing shown on the
+    page changed. Validators are built from versions of
+    `condition_models`, so they cost no queries. The ETag also depends
+    on the query string, the language, the user and the CSRF secret.
+    """
+
+    condition_models = ()
+
+    def get_etag(self, request, versions) -> str:
+        parts = [
+            request.get_full_path(),
+            get_language(),
+            str(request.user.pk),
+            request.META.get("CSRF_COOKIE", ""),
+            *map(str, versions),
+        ]
+        return md5("|".join(parts).encode()).hexdigest()
+
+    def get_last_modified(self, versions) -> datetime:
+        return datetime.fromtimestamp(max(versions) / 10 ** 9, tz=timezone.utc)
+
+    def get_condition(self, request, versions):
+        """condition() decorator answering with validators of versions."""
+        etag = self.get_etag(request, versions)
+        last_modified = self.get_last_modified(versions)
+        return condition(
+            etag_func=lambda *args, **kwargs: etag,
+            last_modified_func=lambda *args, **kwargs: last_modified,
+        )
+
+    def dispatch(self, request, *args, **kwargs):
+        # Pending flash messages must be rendered, not answered with 304
+        if request.method not in ("GET", "HEAD") \
+                or len(get_messages(request)):
+            return super().dispatch(request, *args, **kwargs)
+        versions = get_model_versions(*self.condition_models)
+        view = self.get_condition(request, versions)(super().dispatch)
+        return view(request, *args, **kwargs)
+
+
+class AsyncConditionalGetMixin(ConditionalGetMixin):
+    """ConditionalGetMixin of async views."""
+
+    async def dispatch(self, request, *args, **kwargs):
+        handler = super(ConditionalGetMixin, self).dispatch
+        if request.method not in ("GET", "HEAD"):
+            return await handler(request, *args, **kwargs)
+        # Messages may be stored in the session, which is read in a thread
+        if await sync_to_async(lambda: len(get_messages(request)))():
+            return await handler(request, *args, **kwargs)
+        versions = await aget_model_versions(*self.condition_models)
+
+        # condition() wraps a view as async only if it's a coroutine function
+        async def view(request, *args, **kwargs):
+            return await handler(request, *args, **kwargs)
+
+        view = self.get_condition(request, versions)(view)
+        return await view(request, *args, **kwargs)
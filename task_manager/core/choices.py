@@ -0,0 +1,76 @@
+from hashlib import md5
+
+import django_filters
+from django import forms
+from django.conf import settings
+from django.core.cache import cache
+from django.forms.models import ModelChoiceIterator
+from django.forms.models import ModelChoiceIteratorValue
+from django_filters import fields as filter_fields
+
+from task_manager.core.cache import get_model_version
+
+
+def get_cached_choices(queryset, label_from_instance) -> list[tuple]:
+    """
+    Return (pk, label) pairs of queryset objects.
+    Pairs are cached until the model version is changed by signals.
+    """
+    model = queryset.model
+    query_hash = md5(str(queryset.query).encode()).hexdigest()
+    key = (
+        f"choices:{model._meta.label_lower}:"
+        f"{get_model_version(model)}:{query_hash}"
+    )
+    choices = cache.get(key)
+    if choices is None:
+        choices = [
+            (obj.pk, str(label_from_instance(obj)))
+            for obj in queryset.iterator()
+        ]
+        cache.set(key, choices, timeout=settings.CHOICES_CACHE_TIMEOUT)
+    return choices
+
+
+class CachedModelChoiceIterator(ModelChoiceIterator):
+    """Yield choices from cache instead of querying the queryset."""
+
+    def cached_choices(self) -> list[tuple]:
+        return get_cached_choices(
+            self.queryset, self.field.label_from_instance
+        )
+
+    def __iter__(self):
+        if self.field.empty_label is not None:
+            yield ("", self.field.empty_label)
+        for pk, label in self.cached_choices():
+            yield ModelChoiceIteratorValue(pk, None), label
+
+    def __len__(self):
+        empty_choice = 1 if self.field.empty_label is not None else 0
+        return len(self.cached_choices()) + empty_choice
+
+    def __bool__(self):
+        return self.field.empty_label is not None \
+            or bool(self.cached_choices())
+
+
+class CachedModelChoiceField(forms.ModelChoiceField):
+    iterator = CachedModelChoiceIterator
+
+
+class CachedModelMultipleChoiceField(forms.ModelMultipleChoiceField):
+    iterator = CachedModelChoiceIterator
+
+
+class CachedFilterModelChoiceIterator(filter_fields.ModelChoiceIterator,
+                                      CachedModelChoiceIterator):
+    """Cached choices with the null choice of django-filter."""
+
+
+class CachedFilterModelChoiceField(filter_fields.ModelChoiceField):
+    iterator = CachedFilterModelChoiceIterator
+
+
+class CachedModelChoiceFilter(django_filters.ModelChoiceFilter):
+    field_class = CachedFilterModelChoiceField
@@ -0,0 +1,38 @@
+from django.db import models
+
+
+def search_key(value: str) -> str:
+    """Casefolded text with single spaces, as typed terms are compared."""
+    return " ".join(str(value).casefold().split())
+
+
+class SearchKeyField(models.CharField):
+    """
+    search_key() of `source`, an attribute or method of the model,
+    for case insensitive prefix search. It's set on save() and
+    bulk_create(), not by update() and bulk_update().
+
+    Lower() can't be used instead: SQLite lowers ASCII letters only,
+    so Cyrillic names would never match.
+    """
+
+    def __init__(self, *args, source: str = None, **kwargs):
+        self.source = source
+        kwargs.setdefault("max_length", 255)
+        kwargs.setdefault("default", "")
+        kwargs.setdefault("editable", False)
+        kwargs.setdefault("db_index", True)
+        super().__init__(*args, **kwargs)
+
+    def deconstruct(self):
+        name, path, args, kwargs = super().deconstruct()
+        kwargs["source"] = self.source
+        return name, path, args, kwargs
+
+    def pre_save(self, model_instance, add):
+        value = getattr(model_instance, self.source)
+        if callable(value):
+            value = value()
+        value = search_key(value)[:self.max_length]
+        setattr(model_instance, self.attname, value)
+        return value
@@ -0,0 +1,85 @@
+from django.conf import settings
+from django.contrib.auth.mixins import LoginRequiredMixin
+from django.db.models import F
+from django.http import JsonResponse
+from django.utils.translation import gettext_lazy as _
+from django.views import View
+
+from task_manager.core.fields import search_key
+from task_manager.core.pagination import InvalidCursor
+from task_manager.core.pagination import KeysetPaginator
+from task_manager.core.permission_mixins import AsyncUserMixin
+
+
+class ModelLookupView(LoginRequiredMixin, View):
+    """
+    JSON prefix search for typeahead widgets.
+
+    `search_expression` must be an indexed SearchKeyField of the text
+    label_from_instance() shows, so both the prefix range and the keyset
+    ordering of pages are served by that index. Terms are compared as
+    search_key() of them, case insensitive on every backend.
+    """
+
+    raise_exception = True
+    queryset = None
+    search_expression = F("search_name")
+    query_kwarg = "q"
+    page_kwarg = "cursor"
+    page_size = settings.LOOKUP_PAGE_SIZE
+    invalid_cursor_message = _("Invalid page cursor")
+
+    def get_queryset(self):
+        return self.queryset.all()
+
+    def label_from_instance(self, obj) -> str:
+        return str(obj)
+
+    def search(self, queryset, term: str):
+        """Prefix as a range, because LIKE can't use the index everywhere."""
+        queryset = queryset.annotate(search_key=self.search_expression)
+        if term:
+            queryset = queryset.filter(
+                search_key__gte=term, search_key__lt=f"{term}\uffff"
+            )
+        return queryset.order_by("search_key")
+
+    def get_paginator(self) -> KeysetPaginator:
+        term = search_key(self.request.GET.get(self.query_kwarg, ""))
+        return KeysetPaginator(
+            self.search(self.get_queryset(), term), self.page_size
+        )
+
+    def render_page(self, page) -> JsonResponse:
+        return JsonResponse({
+            "results": [
+                {"id": obj.pk, "text": self.label_from_instance(obj)}
+                for obj in page
+            ],
+            "next": page.next_cursor,
+        })
+
+    def render_invalid_cursor(self) -> JsonResponse:
+        return JsonResponse(
+            {"error": str(self.invalid_cursor_message)}, status=400
+        )
+
+    def get(self, request, *args, **kwargs):
+        try:
+            page = self.get_paginator().page(request.GET.get(self.page_kwarg))
+        except InvalidCursor:
+            return self.render_invalid_cursor()
+        return self.render_page(page)
+
+
+class AsyncModelLookupView(AsyncUserMixin, ModelLookupView):
+    """ModelLookupView fetching the page with the async ORM."""
+
+    async def get(self, request, *args, **kwargs):
+        try:
+            page = await self.get_paginator().apage(
+                request.GET.get(self.page_kwarg)
+            )
+        except InvalidCursor:
+            return self.render_invalid_cursor()
+        return self.render_page(page)
@@ -0,0 +1,148 @@
+"""
+Message storage keeping flash messages small.
+
+Messages of views are lazy translations declared as `*_message` class
+attributes. They are stored as short ids of their msgid instead of the
+translated text, and shown in the language of the request reading them.
+Other messages are stored as text. Messages go to the signed cookie,
+only those which don't fit in it go to the session.
+"""
+import json
+from functools import cache
+from hashlib import md5
+
+from django.conf import settings
+from django.contrib.messages.storage.base import Message
+from django.contrib.messages.storage.cookie import CookieStorage
+from django.contrib.messages.storage.fallback import FallbackStorage
+from django.contrib.messages.storage.session import SessionStorage
+from django.core.exceptions import ImproperlyConfigured
+from django.urls import get_resolver
+from django.urls import URLResolver
+from django.utils import translation
+from django.utils.functional import Promise
+from django.utils.safestring import mark_safe
+from django.utils.safestring import SafeData
+
+MESSAGE_ATTR_SUFFIX = "_message"
+
+
+def message_id(msgid: str) -> int:
+    """Short id of a message, the same in every process."""
+    return int(md5(msgid.encode()).hexdigest()[:6], 16)
+
+
+def _view_classes(patterns):
+    for pattern in patterns:
+        if isinstance(pattern, URLResolver):
+            yield from _view_classes(pattern.url_patterns)
+        else:
+            view_class = getattr(pattern.callback, "view_class", None)
+            if view_class is not None:
+                yield view_class
+
+
+def _view_messages(patterns):
+    """Lazy `*_message` attributes of the views and their mixins."""
+    for view_class in _view_classes(patterns):
+        for klass in view_class.__mro__:
+            for name, value in vars(klass).items():
+                if name.endswith(MESSAGE_ATTR_SUFFIX) \
+                        and isinstance(value, Promise):
+                    yield value
+
+
+@cache
+def get_registry(resolver) -> tuple[dict, dict]:
+    """
+    Messages of the views routed by the resolver by id, and ids by
+    the message text in every language.
+    """
+    messages, ids, msgids = {}, {}, {}
+    for message in _view_messages(resolver.url_patterns):
+        with translation.override(None):
+            msgid = str(message)
+        key = message_id(msgid)
+        if msgids.setdefault(key, msgid) != msgid:
+            raise ImproperlyConfigured(
+                f"Messages {msgid!r} and {msgids[key]!r} have the same id."
+            )
+        messages[key] = message
+        ids.setdefault(msgid, key)
+        for language, _name in settings.LANGUAGES:
+            with translation.override(language):
+                ids.setdefault(str(message), key)
+    return messages, ids
+
+
+def encode_message(message: Message) -> list:
+    """`[level, id or text, extra_tags, safe]` without trailing defaults."""
+    safe = isinstance(message.message, SafeData)
+    text = str(message.message)
+    _messages, ids = get_registry(get_resolver())
+    entry = [message.level, text if safe else ids.get(text, text)]
+    if message.extra_tags or safe:
+        entry.append(message.extra_tags or "")
+    if safe:
+        entry.append(1)
+    return entry
+
+
+def decode_message(entry: list) -> Message | None:
+    """Message of an encode_message() entry, None for an unknown id."""
+    level, text, extra_tags, safe = (entry + ["", 0])[:4]
+    if isinstance(text, int):
+        messages, _ids = get_registry(get_resolver())
+        # Message removed since it was stored
+        if text not in messages:
+            return None
+        text = messages[text]
+    elif safe:
+        text = mark_safe(text)
+    return Message(level, text, extra_tags=extra_tags or None)
+
+
+class CompactCookieStorage(CookieStorage):
+    """CookieStorage signing encode_message() entries."""
+
+    def _store(self, messages, response, *args, **kwargs):
+        entries = [encode_message(message) for message in messages]
+        by_entry = {
+            id(entry): message for entry, message in zip(entries, messages)
+        }
+        # Entries are plain lists, serialized as they are
+        unstored = super()._store(entries, response, *args, **kwargs)
+        return [by_entry[id(entry)] for entry in unstored]
+
+    def _decode(self, data):
+        messages = super()._decode(data)
+        if messages is None:
+            return None
+        # The not finished sentinel is kept as it is
+        decoded = [
+            decode_message(entry) if isinstance(entry, list) else entry
+            for entry in messages
+        ]
+        return [message for message in decoded if message is not None]
+
+
+class CompactSessionStorage(SessionStorage):
+    """SessionStorage saving encode_message() entries."""
+
+    def serialize_messages(self, messages):
+        return json.dumps(
+            [encode_message(message) for message in messages],
+            separators=(",", ":"),
+        )
+
+    def deserialize_messages(self, data):
+        if data and isinstance(data, str):
+            decoded = [decode_message(entry) for entry in json.loads(data)]
+            return [message for message in decoded if message is not None]
+        return data
+
+
+class CompactFallbackStorage(FallbackStorage):
+    """Cookie first, only messages which don't fit go to the session."""
+
+    storage_classes = (CompactCookieStorage, CompactSessionStorage)
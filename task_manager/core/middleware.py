@@ -0,0 +1,207 @@
+import logging
+from contextlib import ExitStack
+from contextvars import ContextVar
+from functools import wraps
+from time import perf_counter
+
+from asgiref.sync import iscoroutinefunction
+from asgiref.sync import markcoroutinefunction
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from django.template.base import Template
+
+
+logger = logging.getLogger(__name__)
+
+
+class QueryBudgetExceeded(Exception):
+    """Request ran more queries, or for longer, than the budget allows."""
+
+
+class QueryCounter:
+    """Database execute wrapper which counts executed queries and time."""
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        started = perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.duration += perf_counter() - started
+
+    @property
+    def duration_ms(self) -> float:
+        return round(self.duration * 1000, 3)
+
+
+class QueryCountMiddleware:
+    """
+    Record the number and time of database queries of a request.
+
+    With QUERY_COUNT_HEADER they are sent in the X-Query-Count and
+    X-Query-Time (milliseconds) headers, e.g. for the load test.
+    Requests over QUERY_BUDGET queries or QUERY_TIME_BUDGET_MS are
+    logged, or raise QueryBudgetExceeded with QUERY_BUDGET_STRICT,
+    which fails tests. Without any of them it costs nothing.
+    """
+    count_header = "X-Query-Count"
+    time_header = "X-Query-Time"
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.send_headers = settings.QUERY_COUNT_HEADER
+        self.budget = settings.QUERY_BUDGET
+        self.time_budget = settings.QUERY_TIME_BUDGET_MS
+        self.strict = settings.QUERY_BUDGET_STRICT
+        if not (self.send_headers or self.budget or self.time_budget):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def count_queries(self, counter: QueryCounter) -> ExitStack:
+        """Install counter on connections of the current thread."""
+        stack = ExitStack()
+        for connection in connections.all():
+            stack.enter_context(connection.execute_wrapper(counter))
+        return stack
+
+    def check_budget(self, request, counter: QueryCounter) -> None:
+        if not (self.budget and counter.count > self.budget
+                or self.time_budget
+                and counter.duration_ms > self.time_budget):
+            return
+        message = (
+            f"{request.method} {request.get_full_path()} ran "
+            f"{counter.count} queries in {counter.duration_ms} ms, "
+            f"budget is {self.budget or '-'} queries "
+            f"and {self.time_budget or '-'} ms"
+        )
+        if self.strict:
+            raise QueryBudgetExceeded(message)
+        logger.warning(message)
+
+    def finish(self, request, response, counter: QueryCounter):
+        self.check_budget(request, counter)
+        if self.send_headers:
+            response[self.count_header] = str(counter.count)
+            response[self.time_header] = str(counter.duration_ms)
+        return response
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        counter = QueryCounter()
+        with self.count_queries(counter):
+            response = self.get_response(request)
+        return self.finish(request, response, counter)
+
+    async def __acall__(self, request):
+        # Under ASGI sync code of a request, async ORM queries included,
+        # runs in one thread of the request, see ThreadSensitiveContext
+        counter = QueryCounter()
+        stack = await sync_to_async(self.count_queries)(counter)
+        try:
+            response = await self.get_response(request)
+        finally:
+            await sync_to_async(stack.close)()
+        return self.finish(request, response, counter)
+
+
+class TemplateProfile:
+    """Render count and seconds by template name, in render order."""
+
+    def __init__(self):
+        self.templates = {}
+
+    def add(self, name: str, duration: float) -> None:
+        count, total = self.templates.get(name, (0, 0.0))
+        self.templates[name] = (count + 1, total + duration)
+
+    def server_timing(self) -> str:
+        return ", ".join(
+            f'tpl;desc="{name} x{count}";dur={round(total * 1000, 3)}'
+            for name, (count, total) in self.templates.items()
+        )
+
+
+# Profile of the current request, None when it isn't profiled
+template_profile = ContextVar("template_profile", default=None)
+
+
+def profile_render(render):
+    """Wrap Template._render to add render times to the current profile."""
+
+    @wraps(render)
+    def profiled_render(self, context):
+        profile = template_profile.get()
+        if profile is None:
+            return render(self, context)
+        started = perf_counter()
+        try:
+            return render(self, context)
+        finally:
+            profile.add(self.name or "<string>", perf_counter() - started)
+
+    profiled_render.profiled = True
+    return profiled_render
+
+
+class TemplateRenderProfilerMiddleware:
+    """
+    Send render times of every template of a request, included and
+    extended ones too, in the Server-Timing header with TEMPLATE_PROFILE.
+    A time includes the templates rendered by the template, e.g.
+    `list_objects.html` includes its rows. Browsers show the header in
+    the network panel. Without TEMPLATE_PROFILE it costs nothing.
+    """
+    header = "Server-Timing"
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not settings.TEMPLATE_PROFILE:
+            raise MiddlewareNotUsed
+        if not getattr(Template._render, "profiled", False):
+            Template._render = profile_render(Template._render)
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def finish(self, response, profile: TemplateProfile):
+        # Template responses are rendered by now, after the view
+        if profile.templates:
+            timing = profile.server_timing()
+            if self.header in response:
+                timing = f"{response[self.header]}, {timing}"
+            response[self.header] = timing
+        return response
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        profile = TemplateProfile()
+        token = template_profile.set(profile)
+        try:
+            response = self.get_response(request)
+        finally:
+            template_profile.reset(token)
+        return self.finish(response, profile)
+
+    async def __acall__(self, request):
+        # Threads of sync_to_async get a copy of the context, which
+        # refers to the same profile
+        profile = TemplateProfile()
+        token = template_profile.set(profile)
+        try:
+            response = await self.get_response(request)
+        finally:
+            template_profile.reset(token)
+        return self.finish(response, profile)
@@ -0,0 +1,265 @@
+import json
+from base64 import urlsafe_b64decode
+from base64 import urlsafe_b64encode
+from binascii import Error as BinasciiError
+from collections.abc import Sequence
+from functools import reduce
+from operator import or_
+
+from django.core.exceptions import ValidationError
+from django.db.models import F
+from django.db.models import Q
+from django.db.models import QuerySet
+from django.http import Http404
+from django.utils.translation import gettext_lazy as _
+
+NEXT = "n"
+PREVIOUS = "p"
+
+
+class InvalidCursor(Exception):
+    """Cursor can't be decoded or doesn't match the ordering."""
+
+
+def encode_cursor(direction: str, values: list) -> str:
+    """Pack keyset values into an opaque url-safe token."""
+    payload = json.dumps([direction, values], default=str)
+    return urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> tuple[str, list]:
+    """Unpack a token made by encode_cursor."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        direction, values = json.loads(urlsafe_b64decode(padded))
+    except (BinasciiError, ValueError, TypeError):
+        raise InvalidCursor(cursor)
+    if direction not in (NEXT, PREVIOUS) or not isinstance(values, list) \
+            or len(values) != size:
+        raise InvalidCursor(cursor)
+    return direction, values
+
+
+class KeysetPage(Sequence):
+    """One page of keyset paginated objects."""
+
+    def __init__(self, object_list, next_cursor, previous_cursor, paginator):
+        self.object_list = object_list
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+        self.paginator = paginator
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def __getitem__(self, index):
+        return self.object_list[index]
+
+    def has_next(self) -> bool:
+        return self.next_cursor is not None
+
+    def has_previous(self) -> bool:
+        return self.previous_cursor is not None
+
+    def has_other_pages(self) -> bool:
+        return self.has_next() or self.has_previous()
+
+
+class KeysetPaginator:
+    """
+    Paginate queryset by the values of its ordering columns
+    instead of OFFSET, so every page costs the same.
+
+    The last ordering column is always the primary key, which makes
+    the ordering total. Ordering columns must not be nullable.
+    """
+
+    def __init__(self, queryset: QuerySet, per_page: int, ordering=None):
+        self.per_page = int(per_page)
+        ordering = list(ordering or queryset.query.order_by or ["-pk"])
+        if ordering[-1].lstrip("-") not in ("pk", "id"):
+            ordering.append("-pk" if ordering[-1].startswith("-") else "pk")
+        self.ordering = ordering
+        self.queryset = queryset.annotate(**{
+            self._key_name(index): F(field.lstrip("-"))
+            for index, field in enumerate(ordering)
+        })
+
+    @staticmethod
+    def _key_name(index: int) -> str:
+        return f"keyset_{index}"
+
+    @staticmethod
+    def _reverse(field: str) -> str:
+        return field[1:] if field.startswith("-") else f"-{field}"
+
+    def _seek(self, values: list, ordering: list[str]) -> Q:
+        """Build row-value comparison `(a, b, pk) > (x, y, z)` in Q terms."""
+        conditions = []
+        for index, field in enumerate(ordering):
+            name = field.lstrip("-")
+            lookup = "lt" if field.startswith("-") else "gt"
+            equal = {
+                previous.lstrip("-"): value
+                for previous, value in zip(ordering[:index], values)
+            }
+            conditions.append(
+                Q(**equal, **{f"{name}__{lookup}": values[index]})
+            )
+        return reduce(or_, conditions)
+
+    def _cursor(self, direction: str, obj) -> str:
+        return encode_cursor(direction, [
+            getattr(obj, self._key_name(index))
+            for index in range(len(self.ordering))
+        ])
+
+    def _page_queryset(self, direction: str, values: list | None):
+        ordering = self.ordering
+        if direction == PREVIOUS:
+            ordering = [self._reverse(field) for field in ordering]
+        queryset = self.queryset.order_by(*ordering)
+        if values is not None:
+            queryset = queryset.filter(self._seek(values, ordering))
+        # One extra row tells whether there is a page after this one
+        return queryset[:self.per_page + 1]
+
+    def _clean(self, values: list) -> list:
+        """
+        Convert cursor values with the fields of the ordering columns,
+        so a tampered cursor, or one of another ordering, is invalid
+        instead of failing the query.
+        """
+        cleaned = []
+        for index, value in enumerate(values):
+            field = self.queryset.query.annotations[
+                self._key_name(index)
+            ].output_field
+            try:
+                value = field.to_python(value)
+            except (ValidationError, TypeError, ValueError):
+                raise InvalidCursor(value)
+            # Ordering columns are not nullable
+            if value is None:
+                raise InvalidCursor(value)
+            cleaned.append(value)
+        return cleaned
+
+    def _decode(self, cursor: str | None) -> tuple[str, list | None]:
+        if not cursor:
+            return NEXT, None
+        direction, values = decode_cursor(cursor, len(self.ordering))
+        return direction, self._clean(values)
+
+    def page_queryset(self, cursor: str | None = None) -> QuerySet:
+        """Queryset which would be evaluated for the page, e.g. to explain."""
+        return self._page_queryset(*self._decode(cursor))
+
+    def forward_queryset(self, cursor: str | None = None) -> QuerySet:
+        """
+        Rows of the page after the cursor plus one row telling whether
+        there is a next page, for callers iterating without a KeysetPage.
+        Only cursors made by next_cursor_for are accepted.
+        """
+        direction, values = self._decode(cursor)
+        if direction != NEXT:
+            raise InvalidCursor(cursor)
+        return self._page_queryset(direction, values)
+
+    @property
+    def key_names(self) -> list[str]:
+        """Annotations holding the ordering values, to select in values()."""
+        return [self._key_name(index) for index in range(len(self.ordering))]
+
+    def next_cursor_for(self, row: dict) -> str:
+        """Cursor of the page after a row selected with key_names."""
+        return encode_cursor(NEXT, [row[name] for name in self.key_names])
+
+    def page(self, cursor: str | None = None) -> KeysetPage:
+        """Return page which starts right after (or before) the cursor."""
+        direction, values = self._decode(cursor)
+        objects = list(self._page_queryset(direction, values))
+        return self._build_page(direction, values, objects)
+
+    async def apage(self, cursor: str | None = None) -> KeysetPage:
+        """page() fetching the rows with the async ORM."""
+        direction, values = self._decode(cursor)
+        objects = [
+            obj async for obj in self._page_queryset(direction, values)
+        ]
+        return self._build_page(direction, values, objects)
+
+    def _build_page(self, direction: str, values: list | None,
+                    objects: list) -> KeysetPage:
+        has_more = len(objects) > self.per_page
+        objects = objects[:self.per_page]
+
+        if direction == PREVIOUS:
+            objects.reverse()
+            has_next, has_previous = True, has_more
+        else:
+            has_next, has_previous = has_more, values is not None
+
+        next_cursor = previous_cursor = None
+        if objects and has_next:
+            next_cursor = self._cursor(NEXT, objects[-1])
+        if objects and has_previous:
+            previous_cursor = self._cursor(PREVIOUS, objects[0])
+        return KeysetPage(objects, next_cursor, previous_cursor, self)
+
+
+class KeysetPaginationMixin:
+    """
+    Replace OFFSET pagination of ListView with KeysetPaginator.
+    Page size may be changed with the `page_size` query parameter.
+    """
+
+    paginator_class = KeysetPaginator
+    page_kwarg = "cursor"
+    page_size_kwarg = "page_size"
+    max_paginate_by = 100
+    invalid_cursor_message = _("Invalid page cursor")
+
+    def get_paginate_by(self, queryset):
+        try:
+            page_size = int(self.request.GET[self.page_size_kwarg])
+        except (KeyError, ValueError):
+            return self.paginate_by
+        return min(max(page_size, 1), self.max_paginate_by)
+
+    def paginate_queryset(self, queryset, page_size):
+        paginator = self.paginator_class(queryset, page_size)
+        try:
+            page = paginator.page(self.request.GET.get(self.page_kwarg))
+        except InvalidCursor:
+            raise Http404(self.invalid_cursor_message)
+        return paginator, page, page.object_list, page.has_other_pages()
+
+    async def apaginate_queryset(self, queryset, page_size):
+        """paginate_queryset() of async views."""
+        paginator = self.paginator_class(queryset, page_size)
+        try:
+            page = await paginator.apage(self.request.GET.get(self.page_kwarg))
+        except InvalidCursor:
+            raise Http404(self.invalid_cursor_message)
+        return paginator, page, page.object_list, page.has_other_pages()
+
+    def get_page_query(self, cursor: str) -> str:
+        """Current query string (filters, ordering) with a new cursor."""
+        query = self.request.GET.copy()
+        query[self.page_kwarg] = cursor
+        return query.urlencode()
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        page = context.get("page_obj")
+        if page is not None:
+            if page.has_next():
+                context["next_page_query"] = self.get_page_query(
+                    page.next_cursor
+                )
+            if page.has_previous():
+                context["previous_page_query"] = self.get_page_query(
+                    page.previous_cursor
+                )
+        return context
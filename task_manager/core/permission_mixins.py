@@ -1,7 +1,10 @@
+from inspect import isawaitable
+
 from django.contrib import messages
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.contrib.auth.mixins import UserPassesTestMixin
 from django.db.models import ProtectedError
+from django.http import Http404
 from django.shortcuts import redirect
 from django.urls import reverse_lazy
 from django.utils.translation import gettext_lazy as _
@@ -28,6 +31,33 @@ class UserLoginRequiredMixin(LoginRequiredMixin):
         return super().dispatch(request, *args, **kwargs)
 
 
+class AsyncUserMixin:
+    """
+    Let sync permission mixins guard an async view. The user is loaded
+    with request.auser() first, so their checks run no queries in the
+    event loop. Must precede them; returns their denial response or
+    awaits the async handler.
+    """
+
+    async def dispatch(self, request, *args, **kwargs):
+        request.user = await request.auser()
+        response = super().dispatch(request, *args, **kwargs)
+        if isawaitable(response):
+            response = await response
+        return response
+
+
+class SingleObjectOnceMixin:
+    """Resolve the object of a detail view once per request."""
+
+    def get_object(self, queryset=None):
+        if queryset is not None:
+            return super().get_object(queryset)
+        if not hasattr(self, "_object"):
+            self._object = super().get_object()
+        return self._object
+
+
 class UserPermissionTestMixin(UserPassesTestMixin):
     """
     Deny request if the user is trying to change staff,
@@ -40,8 +70,16 @@ class UserPermissionTestMixin(UserPassesTestMixin):
     )
 
     def test_func(self):
-        """Testing that the current user is the owner."""
-        return self.get_object() == self.request.user
+        """
+        Testing that the current user is the owner, without a query.
+        Another pk is looked up to answer 404 for missing users.
+        """
+        pk = self.kwargs.get(self.pk_url_kwarg)
+        if str(pk) == str(self.request.user.pk):
+            return True
+        if not self.get_queryset().filter(pk=pk).exists():
+            raise Http404
+        return False
 
     def dispatch(self, request, *args, **kwargs):
         user_test_result = self.test_func()
@@ -74,7 +112,7 @@ class ProtectObjectDeletionMixin(DeletionMixin):
             return redirect(self.denied_url)
 
 
-class TaskDeletionTestMixin(UserPassesTestMixin):
+class TaskDeletionTestMixin(SingleObjectOnceMixin, UserPassesTestMixin):
     """Only author can delete his task."""
 
     protect_message: str = _("Only its author can delete a task")
@@ -82,7 +120,7 @@ class TaskDeletionTestMixin(UserPassesTestMixin):
 
     def test_func(self):
         """testing that current user is an author of task."""
-        return self.get_object().author == self.request.user
+        return self.get_object().author_id == self.request.user.pk
 
     def dispatch(self, request, *args, **kwargs):
         if not self.test_func():
@@ -0,0 +1,10 @@
+"""
+Settings profiles of task_manager project:
+
+- ``task_manager.core.settings.development`` (default of manage.py)
+  adds debug toolbar and django-extensions;
+- ``task_manager.core.settings.production`` (default of wsgi/asgi)
+  drops dev-only apps, caches templates and keeps DB connections open.
+
+Choose one with DJANGO_SETTINGS_MODULE.
+"""
@@ -0,0 +1,300 @@
+"""
+Django settings shared by all profiles of task_manager project.
+Profiles (development, production) import everything from here
+and add or override what differs.
+
+Generated by 'django-admin startproject' using Django 4.2.5.
+
+For more information on this file, see
+https://docs.djangoproject.com/en/4.2/topics/settings/
+
+For the full list of settings and their values, see
+https://docs.djangoproject.com/en/4.2/ref/settings/
+"""
+import os
+from pathlib import Path
+
+import dj_database_url
+from django.core.exceptions import ImproperlyConfigured
+from dotenv import load_dotenv
+
+# Build paths inside the project like this: BASE_DIR / 'subdir'.
+BASE_DIR = Path(__file__).resolve().parent.parent.parent
+load_dotenv()
+
+
+def env_flag(name: str, default: bool = False) -> bool:
+    """Read boolean environment variable, e.g. DEBUG=false or DEBUG=1."""
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+# Quick-start development settings - unsuitable for production
+# See https://docs.djangoproject.com/en/4.2/howto/deployment/checklist/
+
+# SECURITY WARNING: keep the secret key used in production secret!
+SECRET_KEY = os.getenv("SECRET_KEY")
+
+# SECURITY WARNING: don't run with debug turned on in production!
+DEBUG = env_flag("DEBUG")
+
+ALLOWED_HOSTS = ['*']
+
+# Application definition
+
+INSTALLED_APPS = [
+    'django.contrib.admin',
+    'django.contrib.auth',
+    'django.contrib.contenttypes',
+    'django.contrib.sessions',
+    'django.contrib.messages',
+    'django.contrib.staticfiles',
+
+    'django_bootstrap5',
+    'django_filters',
+
+    'task_manager.core',
+    'task_manager.users',
+    'task_manager.statuses',
+    'task_manager.tasks',
+    'task_manager.labels',
+    'task_manager.api',
+    'task_manager.dashboard',
+    'task_manager.benchmarks',
+]
+
+MIDDLEWARE = [
+    'task_manager.core.middleware.QueryCountMiddleware',
+    'task_manager.core.middleware.TemplateRenderProfilerMiddleware',
+    'django.middleware.security.SecurityMiddleware',
+    'whitenoise.middleware.WhiteNoiseMiddleware',
+    'django.contrib.sessions.middleware.SessionMiddleware',
+    'django.middleware.locale.LocaleMiddleware',
+    'django.middleware.common.CommonMiddleware',
+    'django.middleware.csrf.CsrfViewMiddleware',
+    'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'django.contrib.messages.middleware.MessageMiddleware',
+    'django.middleware.clickjacking.XFrameOptionsMiddleware',
+]
+
+ROOT_URLCONF = 'task_manager.core.urls'
+
+TEMPLATES = [
+    {
+        'BACKEND': 'django.template.backends.django.DjangoTemplates',
+        'DIRS': [BASE_DIR / 'templates'],
+        'APP_DIRS': True,
+        'OPTIONS': {
+            'context_processors': [
+                'django.template.context_processors.debug',
+                'django.template.context_processors.request',
+                'django.contrib.auth.context_processors.auth',
+                'django.contrib.messages.context_processors.messages',
+                'django.template.context_processors.i18n',
+            ],
+        },
+    },
+]
+
+WSGI_APPLICATION = 'task_manager.core.wsgi.application'
+
+
+# Database
+# https://docs.djangoproject.com/en/4.2/ref/settings/#databases
+
+DATABASE_CONFIGS = {
+    'sqlite': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': BASE_DIR / 'db.sqlite3',
+    },
+    'postgresql': dj_database_url.config(
+        default=os.getenv("DATABASE_URL"),
+        conn_max_age=int(os.getenv("CONN_MAX_AGE", 1800)),
+        conn_health_checks=True,
+    ),
+}
+
+# Lend PostgreSQL connections from a pool of at most this many per process
+# instead of opening them per thread, 0 turns the pool off.
+# See core/backends/postgresql_pool.
+DATABASE_POOL_MAX_SIZE = int(os.getenv("DATABASE_POOL_MAX_SIZE", 0))
+if DATABASE_POOL_MAX_SIZE and DATABASE_CONFIGS['postgresql']:
+    DATABASE_CONFIGS['postgresql'].update({
+        'ENGINE': 'task_manager.core.backends.postgresql_pool',
+        # Connections go back to the pool instead of being kept
+        'CONN_MAX_AGE': 0,
+        'OPTIONS': {
+            **DATABASE_CONFIGS['postgresql'].get('OPTIONS', {}),
+            'pool': {
+                'min_size': int(os.getenv("DATABASE_POOL_MIN_SIZE", 2)),
+                'max_size': DATABASE_POOL_MAX_SIZE,
+                'timeout': float(os.getenv("DATABASE_POOL_TIMEOUT", 10)),
+            },
+        },
+    })
+
+# Database of the "default" alias, which the app reads and writes:
+# "sqlite" or "postgresql" (DATABASE_URL). The other one keeps its name.
+DATABASE_PRIMARY = os.getenv("DATABASE_PRIMARY", "sqlite")
+if DATABASE_PRIMARY not in DATABASE_CONFIGS:
+    raise ImproperlyConfigured(
+        f"DATABASE_PRIMARY must be one of {', '.join(DATABASE_CONFIGS)}."
+    )
+if not DATABASE_CONFIGS[DATABASE_PRIMARY]:
+    raise ImproperlyConfigured(
+        f"DATABASE_PRIMARY is {DATABASE_PRIMARY}, set DATABASE_URL."
+    )
+
+DATABASES = {
+    'default': DATABASE_CONFIGS[DATABASE_PRIMARY],
+    **{
+        alias: database for alias, database in DATABASE_CONFIGS.items()
+        if alias != DATABASE_PRIMARY
+    },
+}
+
+# Cache
+# https://docs.djangoproject.com/en/4.2/topics/cache/
+# Set CACHE_BACKEND to django.core.cache.backends.filebased.FileBasedCache
+# and CACHE_LOCATION to a directory to share cache between processes,
+# or to django.core.cache.backends.redis.RedisCache and a redis:// url
+# to share it between hosts. The default LocMemCache is per process:
+# cache invalidation is seen only by the process which changed the data,
+# so production settings refuse it.
+
+CACHES = {
+    'default': {
+        'BACKEND': os.getenv(
+            "CACHE_BACKEND", 'django.core.cache.backends.locmem.LocMemCache'
+        ),
+        'LOCATION': os.getenv("CACHE_LOCATION", 'task-manager'),
+    },
+}
+
+# Lifetime of cached select choices, they are also invalidated on change
+CHOICES_CACHE_TIMEOUT = int(os.getenv("CHOICES_CACHE_TIMEOUT", 3600))
+
+# Lifetime of cached rows of object lists, they are also invalidated on change
+ROW_CACHE_TIMEOUT = int(os.getenv("ROW_CACHE_TIMEOUT", 3600))
+
+# Lifetime of pages cached for anonymous users, they are also
+# invalidated on change. 0 renders every page
+PAGE_CACHE_TIMEOUT = int(os.getenv("PAGE_CACHE_TIMEOUT", 600))
+
+# Lifetime of cached session users, they are also dropped on change,
+# by the process which changes them. 0 loads the user on every request
+USER_CACHE_TIMEOUT = int(os.getenv("USER_CACHE_TIMEOUT", 300))
+
+# CACHED_SESSIONS reads sessions from the cache and writes them through
+# to the database. Needs a cache shared by all processes, otherwise a
+# session ended in one process stays alive in the others.
+if env_flag("CACHED_SESSIONS"):
+    SESSION_ENGINE = 'django.contrib.sessions.backends.cached_db'
+
+# Flash messages go to a signed cookie as ids of their translations,
+# the session only gets messages which don't fit in the cookie
+MESSAGE_STORAGE = 'task_manager.core.messages.CompactFallbackStorage'
+
+# Send number and milliseconds of queries of every request
+# in X-Query-Count and X-Query-Time headers
+QUERY_COUNT_HEADER = env_flag("QUERY_COUNT_HEADER")
+
+# Send render times of templates of every request in Server-Timing header
+TEMPLATE_PROFILE = env_flag("TEMPLATE_PROFILE")
+
+# Log requests running more queries, or queries for longer, than this.
+# 0 is no budget. With QUERY_BUDGET_STRICT they raise instead, e.g. in tests
+QUERY_BUDGET = int(os.getenv("QUERY_BUDGET", 0))
+QUERY_TIME_BUDGET_MS = float(os.getenv("QUERY_TIME_BUDGET_MS", 0))
+QUERY_BUDGET_STRICT = env_flag("QUERY_BUDGET_STRICT")
+
+# Route task list, task detail and lookups to async views, which don't
+# hold a thread while they wait for the database. Turned on by core/asgi.py
+ASYNC_VIEWS = env_flag("ASYNC_VIEWS")
+
+# Password validation
+# https://docs.djangoproject.com/en/4.2/ref/settings/#auth-password-validators
+
+AUTH_PASSWORD_VALIDATORS = [
+    {
+        'NAME': 'django.contrib.auth.password_validation.MinimumLengthValidator',  # noqa: E501
+        "OPTIONS": {
+            'min_length': 3,
+        }
+    },
+]
+
+
+# Internationalization
+# https://docs.djangoproject.com/en/4.2/topics/i18n/
+
+LANGUAGE_CODE = os.getenv("LANGUAGE_CODE") if os.getenv("LANGUAGE_CODE") \
+    else 'ru-ru'
+
+LANGUAGES = (
+    ('en-us', 'English'),
+    ('ru-ru', 'Russian'),
+)
+
+LOCALE_PATHS = (
+    os.path.join(BASE_DIR, 'locale'),
+)
+
+
+TIME_ZONE = 'UTC'
+
+USE_I18N = True
+
+USE_TZ = True
+
+AUTH_USER_MODEL = 'users.User'
+
+# Session users are read from the cache, see USER_CACHE_TIMEOUT.
+# Sessions store the path of the backend which logged the user in,
+# ModelBackend keeps sessions created before the cache valid.
+AUTHENTICATION_BACKENDS = [
+    'task_manager.users.backends.CachedModelBackend',
+    'django.contrib.auth.backends.ModelBackend',
+]
+
+# Static files (CSS, JavaScript, Images)
+# https://docs.djangoproject.com/en/4.2/howto/static-files/
+
+STATIC_URL = 'static/'
+# Bootstrap is vendored in core/static, pages load no third-party assets.
+# Benchmarks collect static files to a temporary STATIC_ROOT
+STATIC_ROOT = os.getenv("STATIC_ROOT") or BASE_DIR / 'staticfiles'
+
+# Default primary key field type
+# https://docs.djangoproject.com/en/4.2/ref/settings/#default-auto-field
+
+DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
+
+LOGIN_REDIRECT_URL = '/'
+LOGOUT_REDIRECT_URL = LOGIN_REDIRECT_URL
+
+FIXTURE_DIRS = ["task_manager/fixtures"]
+
+# Page size of JSON lookup endpoints of typeahead widgets
+LOOKUP_PAGE_SIZE = int(os.getenv("LOOKUP_PAGE_SIZE", 20))
+
+# Keyset pagination of the task list
+TASK_LIST_PAGE_SIZE = int(os.getenv("TASK_LIST_PAGE_SIZE", 50))
+TASK_LIST_MAX_PAGE_SIZE = int(os.getenv("TASK_LIST_MAX_PAGE_SIZE", 200))
+
+# Keyset pagination of the JSON API
+API_PAGE_SIZE = int(os.getenv("API_PAGE_SIZE", 100))
+API_MAX_PAGE_SIZE = int(os.getenv("API_MAX_PAGE_SIZE", 1000))
+
+# Bulk task operations: rows per query and items per request
+BULK_BATCH_SIZE = int(os.getenv("BULK_BATCH_SIZE", 500))
+BULK_MAX_ITEMS = int(os.getenv("BULK_MAX_ITEMS", 10000))
+
+# Rows read per query by the streaming task export
+EXPORT_CHUNK_SIZE = int(os.getenv("EXPORT_CHUNK_SIZE", 2000))
+
+# Dashboard: days of the creation chart and rows of top lists
+DASHBOARD_DAYS = int(os.getenv("DASHBOARD_DAYS", 30))
+DASHBOARD_TOP = int(os.getenv("DASHBOARD_TOP", 10))
@@ -0,0 +1,22 @@
+"""Local development profile: debug toolbar and shell_plus."""
+from task_manager.core.settings.base import *  # noqa: F401,F403
+from task_manager.core.settings.base import env_flag
+from task_manager.core.settings.base import INSTALLED_APPS
+from task_manager.core.settings.base import MIDDLEWARE
+
+DEBUG = env_flag("DEBUG", default=True)
+
+INTERNAL_IPS = [
+    '127.0.0.1',
+]
+
+INSTALLED_APPS = [
+    *INSTALLED_APPS,
+    'debug_toolbar',
+    'django_extensions',
+]
+
+MIDDLEWARE = [
+    *MIDDLEWARE,
+    'debug_toolbar.middleware.DebugToolbarMiddleware',
+]
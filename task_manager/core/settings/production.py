@@ -0,0 +1,69 @@
+"""
+Production profile: no dev-only apps and middleware,
+compiled templates are cached and DB connections are reused.
+"""
+import os
+import warnings
+
+from task_manager.core.settings.base import *  # noqa: F401,F403
+from task_manager.core.settings.base import CACHES
+from task_manager.core.settings.base import DATABASES
+from task_manager.core.settings.base import env_flag
+from task_manager.core.settings.base import TEMPLATES
+
+DEBUG = False
+
+# Templates are compiled once per process instead of on every render
+TEMPLATES = [{
+    **TEMPLATES[0],
+    'APP_DIRS': False,
+    'OPTIONS': {
+        **TEMPLATES[0]['OPTIONS'],
+        'loaders': [
+            ('django.template.loaders.cached.Loader', [
+                'django.template.loaders.filesystem.Loader',
+                'django.template.loaders.app_directories.Loader',
+            ]),
+        ],
+    },
+}]
+
+# Persistent connections, checked before reuse after a request
+CONN_MAX_AGE = int(os.getenv("CONN_MAX_AGE", 600))
+
+DATABASES = {
+    alias: {
+        'CONN_MAX_AGE': CONN_MAX_AGE,
+        **database,
+        'CONN_HEALTH_CHECKS': True,
+    }
+    for alias, database in DATABASES.items()
+}
+
+# collectstatic adds content hashes to file names and saves gzip and,
+# with brotli installed, brotli copies. Whitenoise serves hashed files
+# with a far-future immutable Cache-Control. Pages fail until static files
+# are collected with these settings, see `make static`
+STORAGES = {
+    'default': {
+        'BACKEND': 'django.core.files.storage.FileSystemStorage',
+    },
+    'staticfiles': {
+        'BACKEND': 'whitenoise.storage.CompressedManifestStaticFilesStorage',
+    },
+}
+
+# Cached choices, rows, anonymous pages and ETags are invalidated by
+# versions bumped in the cache by the process which changes the data.
+# Workers must share the cache to see them: RedisCache, a Memcached
+# backend, or FileBasedCache on a single host. LOCAL_CACHE=1 silences
+# the warning for a deploy of a single process.
+if CACHES['default']['BACKEND'] \
+        == 'django.core.cache.backends.locmem.LocMemCache' \
+        and not env_flag("LOCAL_CACHE"):
+    warnings.warn(
+        "LocMemCache is not shared by processes, which then serve stale "
+        "pages. Set CACHE_BACKEND and CACHE_LOCATION to a shared cache, "
+        "or LOCAL_CACHE=1 for a single process.",
+        RuntimeWarning,
+    )
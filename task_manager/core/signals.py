@@ -0,0 +1,39 @@
+from django.apps import apps
+from django.db import transaction
+from django.db.models.signals import post_delete
+from django.db.models.signals import post_save
+
+from task_manager.core.cache import bump_model_version
+
+# Models whose cached representations depend on the table version
+VERSIONED_MODELS = (
+    "statuses.Status",
+    "labels.Label",
+    "users.User",
+    "tasks.Task",
+)
+
+# Saving only these fields doesn't change anything shown from cache
+IGNORED_UPDATE_FIELDS = frozenset({"last_login"})
+
+
+def bump_version(sender, using=None, update_fields=None, **kwargs):
+    """
+    Change the model version now, for reads in the same transaction,
+    and after commit, for entries cached by concurrent requests meanwhile.
+    """
+    if update_fields and IGNORED_UPDATE_FIELDS.issuperset(update_fields):
+        return
+    bump_model_version(sender)
+    transaction.on_commit(lambda: bump_model_version(sender), using=using)
+
+
+def connect_signals():
+    for label in VERSIONED_MODELS:
+        model = apps.get_model(label)
+        post_save.connect(
+            bump_version, sender=model, dispatch_uid=f"bump-{label}-save",
+        )
+        post_delete.connect(
+            bump_version, sender=model, dispatch_uid=f"bump-{label}-delete",
+        )
@@ -0,0 +1,87 @@
+// Typeahead for selects rendered by LookupSelect widgets.
+// Selected options are kept, other options are replaced by search results.
+(function () {
+    "use strict";
+
+    function setup(select) {
+        var search = document.createElement("input");
+        search.type = "search";
+        search.className = "form-control mb-1";
+        search.placeholder = select.dataset.lookupPlaceholder || "";
+        select.parentNode.insertBefore(search, select);
+
+        var more = document.createElement("button");
+        more.type = "button";
+        more.className = "btn btn-link btn-sm";
+        more.textContent = select.dataset.lookupMore || "...";
+        more.hidden = true;
+        select.parentNode.insertBefore(more, select.nextSibling);
+
+        var term = "";
+        var cursor = null;
+        var loaded = false;
+        var timer = null;
+
+        function load(append) {
+            var params = new URLSearchParams({q: term});
+            if (append && cursor) {
+                params.set("cursor", cursor);
+            }
+            fetch(select.dataset.lookupUrl + "?" + params.toString(), {
+                credentials: "same-origin",
+                headers: {"Accept": "application/json"}
+            }).then(function (response) {
+                return response.json();
+            }).then(function (data) {
+                if (!append) {
+                    Array.from(select.options).forEach(function (option) {
+                        if (option.value && !option.selected) {
+                            option.remove();
+                        }
+                    });
+                }
+                var present = new Set(Array.from(select.options).map(
+                    function (option) { return option.value; }
+                ));
+                (data.results || []).forEach(function (item) {
+                    if (!present.has(String(item.id))) {
+                        select.add(new Option(item.text, item.id));
+                    }
+                });
+                cursor = data.next;
+                more.hidden = !cursor;
+            });
+        }
+
+        function loadOnce() {
+            if (!loaded) {
+                loaded = true;
+                load(false);
+            }
+        }
+
+        select.addEventListener("focus", loadOnce);
+        search.addEventListener("focus", loadOnce);
+        search.addEventListener("input", function () {
+            clearTimeout(timer);
+            timer = setTimeout(function () {
+                term = search.value.trim();
+                loaded = true;
+                load(false);
+            }, 250);
+        });
+        more.addEventListener("click", function () {
+            load(true);
+        });
+    }
+
+    function init() {
+        document.querySelectorAll("select[data-lookup-url]").forEach(setup);
+    }
+
+    if (document.readyState === "loading") {
+        document.addEventListener("DOMContentLoaded", init);
+    } else {
+        init();
+    }
+})();
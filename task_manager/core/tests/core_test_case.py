@@ -8,18 +8,29 @@ from django.contrib.messages import INFO
 from django.contrib.messages import Message
 from django.contrib.messages import SUCCESS
 from django.contrib.messages.test import MessagesTestMixin
+from django.core.cache import cache
 from django.test import TestCase
 from django.urls import reverse_lazy
 from django.utils.translation import gettext_lazy as _
 
 from task_manager.core.permission_mixins import UserLoginRequiredMixin
 from task_manager.core.views import UserLoginView
+from task_manager.core.views import UserLogoutView
 from task_manager.users.models import User
 
 LinkNames: Iterable[str, ...] = tuple
 
 
-class AuthTestCase(MessagesTestMixin, TestCase):
+class CacheTestCase(TestCase):
+    """TestCase starting every test with an empty cache."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        # Cached entries may refer to rows of rolled back tests
+        cache.clear()
+
+
+class AuthTestCase(MessagesTestMixin, CacheTestCase):
     """Testcase special for auth system and homepage."""
 
     credentials: dict = {
@@ -75,10 +86,11 @@ class AuthTestCase(MessagesTestMixin, TestCase):
     )
 
     success_logout_message: Message = Message(
-        message=_("You're logged out"), level=INFO
+        message=UserLogoutView.success_message, level=INFO
     )
 
     def setUp(self) -> None:
+        super().setUp()
         User.objects.create_user(**self.credentials)
         self.login_view = self.client.get(reverse_lazy("login"))
         self.home_view = self.client.get(reverse_lazy("home"))
@@ -1,5 +1,7 @@
 from http import HTTPStatus
 
+from django.contrib.staticfiles import finders
+from django.templatetags.static import static
 from django.urls import reverse_lazy
 
 from .core_test_case import AuthTestCase
@@ -37,3 +39,13 @@ class TestHomePage(AuthTestCase):
             self.assertContains(logged_response, test_field_name)
         for test_link in self.auth_links:
             self.assertContains(logged_response, test_link)
+
+    def test_home_page_loads_vendored_assets(self):
+        """Test that styles and scripts are served by the site itself"""
+        for asset in ("vendor/bootstrap/css/bootstrap.min.css",
+                      "vendor/bootstrap/js/bootstrap.bundle.min.js",
+                      "css/cover.css"):
+            self.assertIsNotNone(finders.find(asset))
+            self.assertContains(self.home_view, static(asset))
+        self.assertNotContains(self.home_view, "cdn.jsdelivr.net")
+        self.assertNotContains(self.home_view, "getbootstrap.com")
@@ -0,0 +1,107 @@
+import json
+from hashlib import md5
+
+from django.contrib.messages import INFO
+from django.contrib.messages import SUCCESS
+from django.contrib.messages.storage.base import Message
+from django.contrib.sessions.backends.db import SessionStore
+from django.http import HttpResponse
+from django.test import RequestFactory
+from django.urls import get_resolver
+from django.urls import reverse_lazy
+from django.utils import translation
+from django.utils.safestring import mark_safe
+from django.utils.safestring import SafeData
+
+from .core_test_case import AuthTestCase
+from task_manager.core.messages import CompactCookieStorage
+from task_manager.core.messages import CompactFallbackStorage
+from task_manager.core.messages import decode_message
+from task_manager.core.messages import encode_message
+from task_manager.core.messages import get_registry
+from task_manager.core.messages import message_id
+from task_manager.core.views import UserLoginView
+from task_manager.statuses.views import StatusCreateView
+
+
+class TestCompactMessages(AuthTestCase):
+    """Messages of views are stored as ids, others as text."""
+
+    def test_registry_has_messages_of_views(self) -> None:
+        messages, _ids = get_registry(get_resolver())
+        for message in (UserLoginView.success_message,
+                        StatusCreateView.success_message):
+            with self.subTest(message=message):
+                with translation.override(None):
+                    key = message_id(str(message))
+                self.assertIs(messages[key], message)
+
+    def test_translated_message_is_encoded_as_id(self) -> None:
+        for language in ("en-us", "ru-ru"):
+            with self.subTest(language=language), \
+                    translation.override(language):
+                entry = encode_message(Message(
+                    SUCCESS, str(UserLoginView.success_message)
+                ))
+                self.assertIsInstance(entry[1], int)
+                self.assertEqual(len(entry), 2)
+
+    def test_message_is_shown_in_language_of_reader(self) -> None:
+        with translation.override("en-us"):
+            entry = encode_message(Message(
+                SUCCESS, str(UserLoginView.success_message)
+            ))
+        with translation.override("ru-ru"):
+            message = decode_message(entry)
+            self.assertEqual(
+                str(message), str(UserLoginView.success_message)
+            )
+
+    def test_other_messages_are_kept_as_text(self) -> None:
+        for message in (
+            Message(INFO, "Unknown message", extra_tags="danger"),
+            Message(INFO, mark_safe("<b>Safe</b>")),
+        ):
+            with self.subTest(message=message.message):
+                decoded = decode_message(encode_message(message))
+                self.assertEqual(decoded, message)
+                self.assertEqual(decoded.extra_tags, message.extra_tags)
+                self.assertEqual(
+                    isinstance(decoded.message, SafeData),
+                    isinstance(message.message, SafeData),
+                )
+
+    def test_unknown_id_is_dropped(self) -> None:
+        self.assertIsNone(decode_message([INFO, -1]))
+
+    def test_login_message_cookie_holds_id(self) -> None:
+        response = self.client.post(reverse_lazy("login"), self.credentials)
+        cookie = response.cookies[CompactCookieStorage.cookie_name].value
+        self.assertLess(len(cookie), 100)
+        response = self.client.get(response["Location"])
+        self.assertMessages(response, [self.success_login_message])
+        self.assertNotIn("_messages", self.client.session)
+
+    def test_overflow_goes_to_session(self) -> None:
+        request = RequestFactory().get("/")
+        request.session = SessionStore()
+        storage = CompactFallbackStorage(request)
+        sent = [
+            # Hashes don't compress, so they don't fit in one cookie
+            Message(INFO, md5(str(number).encode()).hexdigest())
+            for number in range(200)
+        ]
+        for message in sent:
+            storage.add(message.level, message.message)
+        response = HttpResponse()
+        storage.update(response)
+        self.assertIn(CompactCookieStorage.cookie_name, response.cookies)
+        self.assertIsInstance(
+            json.loads(request.session["_messages"])[0], list
+        )
+
+        next_request = RequestFactory().get("/")
+        next_request.session = request.session
+        next_request.COOKIES[CompactCookieStorage.cookie_name] = \
+            response.cookies[CompactCookieStorage.cookie_name].value
+        self.assertEqual(list(CompactFallbackStorage(next_request)), sent)
@@ -0,0 +1,93 @@
+from django.db import connection
+from django.test import Client
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse_lazy
+
+from .core_test_case import AuthTestCase
+from task_manager.core.middleware import QueryBudgetExceeded
+
+
+class TestQueryCountMiddleware(AuthTestCase):
+    """Number of queries is reported in a header when enabled."""
+
+    @override_settings(QUERY_COUNT_HEADER=True)
+    def test_header_counts_queries_of_request(self):
+        client = Client()
+        client.login(**self.credentials)
+        with CaptureQueriesContext(connection) as queries:
+            response = client.get(reverse_lazy("list_user"))
+        self.assertEqual(response["X-Query-Count"], str(len(queries)))
+
+    @override_settings(QUERY_COUNT_HEADER=True)
+    def test_header_reports_query_time(self):
+        response = Client().get(reverse_lazy("home"))
+        self.assertGreaterEqual(float(response["X-Query-Time"]), 0)
+
+    @override_settings(QUERY_COUNT_HEADER=False)
+    def test_no_header_when_disabled(self):
+        response = Client().get(reverse_lazy("home"))
+        self.assertNotIn("X-Query-Count", response)
+
+
+@override_settings(QUERY_COUNT_HEADER=False, QUERY_BUDGET=1,
+                   QUERY_BUDGET_STRICT=False)
+class TestQueryBudget(AuthTestCase):
+    """Requests over the query budget are logged or fail."""
+
+    def get_users(self):
+        # Middleware is set up with the settings of the client's first request
+        client = Client()
+        client.login(**self.credentials)
+        return client.get(reverse_lazy("list_user"))
+
+    def test_request_over_budget_is_logged(self):
+        with self.assertLogs("task_manager.core.middleware") as logs:
+            response = self.get_users()
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn("X-Query-Count", response)
+        self.assertIn("GET /users/ ran", logs.output[0])
+
+    @override_settings(QUERY_BUDGET_STRICT=True)
+    def test_request_over_budget_fails_when_strict(self):
+        with self.assertRaises(QueryBudgetExceeded):
+            self.get_users()
+
+    @override_settings(QUERY_BUDGET=0, QUERY_TIME_BUDGET_MS=10 ** -6,
+                       QUERY_BUDGET_STRICT=True)
+    def test_time_budget(self):
+        with self.assertRaises(QueryBudgetExceeded):
+            self.get_users()
+
+    @override_settings(QUERY_BUDGET=100, QUERY_BUDGET_STRICT=True)
+    def test_request_within_budget(self):
+        with self.assertNoLogs("task_manager.core.middleware"):
+            response = self.get_users()
+        self.assertEqual(response.status_code, 200)
+
+
+class TestTemplateRenderProfiler(AuthTestCase):
+    """Render times of templates are reported in Server-Timing."""
+
+    @override_settings(TEMPLATE_PROFILE=True)
+    def test_header_has_every_template_of_page(self):
+        client = Client()
+        client.login(**self.credentials)
+        response = client.get(reverse_lazy("list_user"))
+        timing = response["Server-Timing"]
+        for name in ("list_objects.html", "base.html",
+                     "includes/nav-bar.html", "includes/rows/user.html"):
+            self.assertIn(f'desc="{name} x', timing)
+        self.assertRegex(timing, r'tpl;desc="base\.html x1";dur=[\d.]+')
+
+    @override_settings(TEMPLATE_PROFILE=True)
+    def test_no_header_without_templates(self):
+        client = Client()
+        client.login(**self.credentials)
+        response = client.get(reverse_lazy("lookup_user"))
+        self.assertNotIn("Server-Timing", response)
+
+    @override_settings(TEMPLATE_PROFILE=False)
+    def test_no_header_when_disabled(self):
+        response = Client().get(reverse_lazy("home"))
+        self.assertNotIn("Server-Timing", response)
@@ -0,0 +1,82 @@
+from unittest import mock
+
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse_lazy
+
+from .core_test_case import AuthTestCase
+from task_manager.users.models import User
+from task_manager.users.views import UserIndexView
+
+
+class TestAnonymousPageCache(AuthTestCase):
+    """Pages of anonymous users are served from the cache."""
+
+    home_url = reverse_lazy("home")
+    users_url = reverse_lazy("list_user")
+
+    def test_cached_page_runs_no_queries(self) -> None:
+        for url in (self.home_url, self.users_url):
+            with self.subTest(url=url):
+                client = Client()
+                rendered = client.get(url)
+                with self.assertNumQueries(0):
+                    cached = client.get(url)
+                self.assertEqual(cached.content, rendered.content)
+                self.assertEqual(
+                    cached["Content-Type"], rendered["Content-Type"]
+                )
+
+    def test_unknown_query_parameters_are_not_cached(self) -> None:
+        client = Client()
+        client.get(self.users_url, {"utm": "1"})
+        with CaptureQueriesContext(connection) as queries:
+            client.get(self.users_url, {"utm": "1"})
+        self.assertTrue(queries.captured_queries)
+
+    @mock.patch.object(UserIndexView, "page_cache_params", ("a", "b"))
+    def test_page_is_cached_per_sorted_parameters(self) -> None:
+        client = Client()
+        client.get(f"{self.users_url}?a=1&b=2")
+        with self.assertNumQueries(0):
+            client.get(f"{self.users_url}?b=2&a=1")
+        with CaptureQueriesContext(connection) as queries:
+            client.get(f"{self.users_url}?a=2&b=2")
+        self.assertTrue(queries.captured_queries)
+
+    def test_page_varies_on_cookie_and_language(self) -> None:
+        response = Client().get(self.users_url)
+        self.assertIn("Cookie", response["Vary"])
+        self.assertIn("Accept-Language", response["Vary"])
+
+    def test_page_is_cached_per_language(self) -> None:
+        client = Client()
+        english = client.get(self.home_url, headers={
+            "accept-language": "en-us",
+        })
+        russian = client.get(self.home_url, headers={
+            "accept-language": "ru-ru",
+        })
+        self.assertNotEqual(english.content, russian.content)
+
+    def test_user_changes_invalidate_user_list(self) -> None:
+        client = Client()
+        client.get(self.users_url)
+        user = User.objects.create_user(username="newcomer", password="123")
+        self.assertContains(client.get(self.users_url), "newcomer")
+        user.username = "renamed"
+        user.save()
+        response = client.get(self.users_url)
+        self.assertContains(response, "renamed")
+        self.assertNotContains(response, "newcomer")
+        user.delete()
+        self.assertNotContains(client.get(self.users_url), "renamed")
+
+    def test_authenticated_user_is_not_served_cached_page(self) -> None:
+        client = Client()
+        client.get(self.home_url)
+        client.login(**self.credentials)
+        response = client.get(self.home_url)
+        for link_name in self.auth_fields:
+            self.assertContains(response, link_name)
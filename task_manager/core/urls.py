@@ -14,6 +14,7 @@ Including another URLconf
     1. Import the include() function: from django.urls import include, path
     2. Add a URL to urlpatterns:  path('blog/', include('blog.urls'))
 """
+from django.apps import apps
 from django.contrib import admin
 from django.urls import include
 from django.urls import path
@@ -24,13 +25,18 @@ from task_manager.core.views import UserLogoutView
 
 urlpatterns = [
     path('admin/', admin.site.urls),
-    path('__debug__/', include('debug_toolbar.urls')),
     path('', UserIndexView.as_view(), name='home'),
     path('users/', include('task_manager.users.urls')),
     path('statuses/', include('task_manager.statuses.urls')),
     path('tasks/', include('task_manager.tasks.urls')),
     path('labels/', include('task_manager.labels.urls')),
+    path('api/', include('task_manager.api.urls')),
+    path('dashboard/', include('task_manager.dashboard.urls')),
     path('login/', UserLoginView.as_view(), name='login'),
     path('logout/', UserLogoutView.as_view(), name='logout'),
     path('i18n/', include('django.conf.urls.i18n')),
 ]
+
+# Debug toolbar is installed by the development settings profile only
+if apps.is_installed('debug_toolbar'):
+    urlpatterns.append(path('__debug__/', include('debug_toolbar.urls')))
@@ -8,8 +8,10 @@ from django.urls import reverse_lazy
 from django.utils.translation import gettext_lazy as _
 from django.views.generic.base import TemplateView
 
+from task_manager.core.cache import AnonymousPageCacheMixin
 
-class UserIndexView(TemplateView):
+
+class UserIndexView(AnonymousPageCacheMixin, TemplateView):
     """Shows home page."""
     template_name = "home.html"
 
@@ -30,12 +32,13 @@ class UserLoginView(SuccessMessageMixin, LoginView):
 class UserLogoutView(LogoutView):
     """Log out user."""
     next_page = reverse_lazy("home")
+    success_message = _("You're logged out")
 
     def post(self, request, *args, **kwargs):
         logout(request)
         messages.add_message(
             request=request,
             level=messages.INFO,
-            message=_("You're logged out"),
+            message=self.success_message,
         )
         return HttpResponseRedirect(self.next_page)
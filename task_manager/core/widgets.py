@@ -0,0 +1,62 @@
+from django import forms
+from django.core.exceptions import ValidationError
+from django.utils.translation import gettext_lazy as _
+
+
+class LookupSelectMixin:
+    """
+    Render only selected options of a model choice field.
+    Other options are searched by lookup.js in the lookup endpoint,
+    so the page doesn't grow with the table.
+    """
+
+    placeholder = _("Search...")
+    more_text = _("More")
+
+    def __init__(self, lookup_url, attrs=None):
+        super().__init__(attrs)
+        self.lookup_url = lookup_url
+
+    class Media:
+        js = ("js/lookup.js",)
+
+    def get_context(self, name, value, attrs):
+        context = super().get_context(name, value, attrs)
+        context["widget"]["attrs"].update({
+            "data-lookup-url": str(self.lookup_url),
+            "data-lookup-placeholder": str(self.placeholder),
+            "data-lookup-more": str(self.more_text),
+        })
+        return context
+
+    def selected_choices(self, value) -> list:
+        iterator = self.choices
+        choices = []
+        empty_label = getattr(iterator.field, "empty_label", None)
+        if not self.allow_multiple_selected and empty_label is not None:
+            choices.append(("", empty_label))
+        selected = [item for item in value if item not in (None, "")]
+        if not selected:
+            return choices
+        try:
+            objects = list(iterator.queryset.filter(pk__in=selected))
+        except (ValueError, ValidationError):
+            # Invalid input is reported by the field, not the widget
+            return choices
+        return choices + [iterator.choice(obj) for obj in objects]
+
+    def optgroups(self, name, value, attrs=None):
+        iterator = self.choices
+        self.choices = self.selected_choices(value)
+        try:
+            return super().optgroups(name, value, attrs)
+        finally:
+            self.choices = iterator
+
+
+class LookupSelect(LookupSelectMixin, forms.Select):
+    pass
+
+
+class LookupSelectMultiple(LookupSelectMixin, forms.SelectMultiple):
+    pass
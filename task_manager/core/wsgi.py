@@ -10,6 +10,8 @@ import os
 
 from django.core.wsgi import get_wsgi_application
 
-os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'task_manager.core.settings')
+os.environ.setdefault(
+    'DJANGO_SETTINGS_MODULE', 'task_manager.core.settings.production'
+)
 
 application = get_wsgi_application()
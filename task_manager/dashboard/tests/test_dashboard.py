@@ -0,0 +1,91 @@
+from datetime import timedelta
+from unittest import mock
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse_lazy
+from django.utils import timezone
+
+from task_manager.tasks.counters import reconcile_counters
+from task_manager.tasks.models import DailyTaskSummary
+from task_manager.tasks.models import Task
+from task_manager.tasks.tests.task_test_case import TaskTestCase
+
+
+class TestDashboard(TaskTestCase):
+    """Dashboard is read from maintained counters only."""
+
+    url = reverse_lazy("dashboard")
+
+    def setUp(self) -> None:
+        super().setUp()
+        # Fixtures are written without counters
+        reconcile_counters()
+
+    def get_day_count(self, day) -> int:
+        summary = DailyTaskSummary.objects.filter(day=day).first()
+        return summary.task_count if summary else 0
+
+    def test_dashboard_shows_counts(self) -> None:
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, self.status_ok)
+        self.assertEqual(response.context["total"], Task.objects.count())
+        statuses = {
+            row["name"]: row["task_count"]
+            for row in response.context["statuses"]
+        }
+        self.assertEqual(statuses[self.test_task_1.status.name], 1)
+        self.assertEqual(
+            sum(row["task_count"] for row in response.context["performers"]),
+            Task.objects.count(),
+        )
+
+    def test_task_table_is_not_queried(self) -> None:
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(self.url)
+        table = connection.ops.quote_name(Task._meta.db_table)
+        self.assertFalse([
+            query["sql"] for query in queries.captured_queries
+            if f"FROM {table}" in query["sql"]
+        ])
+
+    def test_days_follow_task_changes(self) -> None:
+        today = timezone.localdate()
+        old_day = timezone.localdate(self.test_task_1.created_at)
+        old_count = self.get_day_count(old_day)
+        Task.objects.create(
+            name="Today", status=self.test_task_1.status,
+            author=self.test_user_1,
+        )
+        self.assertEqual(self.get_day_count(today), 1)
+
+        # created_at is updated on save
+        self.test_task_1.save()
+        self.assertEqual(self.get_day_count(old_day), old_count - 1)
+        self.assertEqual(self.get_day_count(today), 2)
+
+        self.test_task_1.delete()
+        self.assertEqual(self.get_day_count(today), 1)
+        days = self.client.get(self.url).context["days"]
+        self.assertEqual(days[-1], {
+            "day": today, "task_count": 1, "share": 100,
+        })
+
+    def test_validators_change_next_day(self) -> None:
+        response = self.client.get(self.url)
+        tomorrow = timezone.now() + timedelta(days=1)
+        with mock.patch("django.utils.timezone.now", return_value=tomorrow):
+            for header, value in (
+                ("HTTP_IF_NONE_MATCH", response["ETag"]),
+                ("HTTP_IF_MODIFIED_SINCE", response["Last-Modified"]),
+            ):
+                with self.subTest(header=header):
+                    next_day = self.client.get(self.url, **{header: value})
+                    self.assertEqual(next_day.status_code, self.status_ok)
+
+    def test_login_is_required(self) -> None:
+        self.client.logout()
+        response = self.client.get(self.url)
+        self.assertRedirects(
+            response, f"{reverse_lazy('login')}?next={self.url}"
+        )
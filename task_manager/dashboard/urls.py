@@ -0,0 +1,8 @@
+from django.urls import path
+
+from task_manager.dashboard.views import DashboardView
+
+
+urlpatterns = [
+    path("", DashboardView.as_view(), name="dashboard"),
+]
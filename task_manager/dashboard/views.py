@@ -0,0 +1,111 @@
+from datetime import datetime
+from datetime import timedelta
+
+from django.conf import settings
+from django.db.models import F
+from django.db.models import Sum
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+from django.views.generic.base import TemplateView
+
+from task_manager.core.cache import ConditionalGetMixin
+from task_manager.core.permission_mixins import UserLoginRequiredMixin
+from task_manager.labels.models import Label
+from task_manager.statuses.models import Status
+from task_manager.tasks.models import DailyTaskSummary
+from task_manager.tasks.models import Task
+from task_manager.users.models import User
+
+
+def with_shares(rows: list[dict], total: int) -> list[dict]:
+    """Add the percentage of total to every row, for progress bars."""
+    for row in rows:
+        row["share"] = round(100 * row["task_count"] / total) if total else 0
+    return rows
+
+
+class DashboardView(UserLoginRequiredMixin,
+                    ConditionalGetMixin,
+                    TemplateView):
+    """
+    Tasks by status, performer, label and creation day. Counts are read
+    from counter columns and DailyTaskSummary maintained by
+    tasks.counters, the task table isn't aggregated.
+    """
+    template_name = "dashboard.html"
+    days = settings.DASHBOARD_DAYS
+    top = settings.DASHBOARD_TOP
+    extra_context = {"title": _("Dashboard")}
+    # ConditionalGetMixin attrs, task changes change all counters
+    condition_models = (Task, Status, User, Label, DailyTaskSummary)
+
+    def get_etag(self, request, versions) -> str:
+        # The period of days moves at midnight, without any change
+        return super().get_etag(
+            request, [*versions, timezone.localdate().isoformat()]
+        )
+
+    def get_last_modified(self, versions) -> datetime:
+        today = timezone.localtime().replace(
+            hour=0, minute=0, second=0, microsecond=0
+        )
+        return max(super().get_last_modified(versions), today)
+
+    def get_statuses(self) -> list[dict]:
+        return list(
+            Status.objects.order_by("-task_count", "name")
+            .values("name", "task_count")
+        )
+
+    def get_performers(self, total: int) -> list[dict]:
+        performers = list(
+            User.objects.filter(performed_task_count__gt=0)
+            .order_by("-performed_task_count", "username")
+            .values("first_name", "last_name", "username",
+                    task_count=F("performed_task_count"))
+            [:self.top]
+        )
+        assigned = User.objects.aggregate(
+            count=Sum("performed_task_count")
+        )["count"] or 0
+        if total > assigned:
+            performers.append({
+                "username": _("Unassigned"), "task_count": total - assigned,
+            })
+        return performers
+
+    def get_labels(self) -> list[dict]:
+        return list(
+            Label.objects.filter(task_count__gt=0)
+            .order_by("-task_count", "name")
+            .values("name", "task_count")[:self.top]
+        )
+
+    def get_days(self) -> list[dict]:
+        """Every day of the period, the ones without tasks too."""
+        first = timezone.localdate() - timedelta(days=self.days - 1)
+        counts = dict(
+            DailyTaskSummary.objects.filter(day__gte=first)
+            .values_list("day", "task_count")
+        )
+        days = [first + timedelta(days=number) for number in range(self.days)]
+        return [
+            {"day": day, "task_count": counts.get(day, 0)} for day in days
+        ]
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        statuses = self.get_statuses()
+        # Every task has a status
+        total = sum(row["task_count"] for row in statuses)
+        days = self.get_days()
+        context.update({
+            "total": total,
+            "statuses": with_shares(statuses, total),
+            "performers": with_shares(self.get_performers(total), total),
+            "labels": with_shares(self.get_labels(), total),
+            "days": with_shares(
+                days, max(row["task_count"] for row in days)
+            ),
+        })
+        return context
@@ -0,0 +1,18 @@
+# Generated by Django 5.0.1 on 2026-10-18 18:42
+import django.db.models.functions.text
+from django.db import migrations
+from django.db import models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('labels', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='label',
+            index=models.Index(django.db.models.functions.text.Lower('name'), name='label_name_lower_idx'),
+        ),
+    ]
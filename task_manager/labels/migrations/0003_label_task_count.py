@@ -0,0 +1,18 @@
+# Generated by Django 5.0.1 on 2026-10-18 19:15
+from django.db import migrations
+from django.db import models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('labels', '0002_lookup_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='label',
+            name='task_count',
+            field=models.IntegerField(default=0, editable=False, verbose_name='Tasks'),
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 5.0.1 on 2026-10-18 20:07
+
+import task_manager.core.fields
+from django.db import migrations
+from task_manager.core.fields import search_key
+
+
+def fill_search_name(apps, schema_editor):
+    """search_key() of the name of existing labels."""
+    Label = apps.get_model("labels", "Label")
+    labels = list(Label.objects.using(schema_editor.connection.alias))
+    for label in labels:
+        label.search_name = search_key(label.name)[:255]
+    Label.objects.using(schema_editor.connection.alias) \
+        .bulk_update(labels, ["search_name"], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('labels', '0003_label_task_count'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='label',
+            name='label_name_lower_idx',
+        ),
+        migrations.AddField(
+            model_name='label',
+            name='search_name',
+            field=task_manager.core.fields.SearchKeyField(db_index=True, default='', editable=False, max_length=255, source='name'),
+        ),
+        migrations.RunPython(fill_search_name, migrations.RunPython.noop),
+    ]
@@ -1,6 +1,8 @@
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 
+from task_manager.core.fields import SearchKeyField
+
 
 class Label(models.Model):
     """Label (Tag) model of project."""
@@ -17,6 +19,16 @@ class Label(models.Model):
         verbose_name=_("Creation date")
     )
 
+    # Maintained by tasks.counters
+    task_count = models.IntegerField(
+        default=0,
+        editable=False,
+        verbose_name=_("Tasks")
+    )
+
+    # Searched by prefix by the lookup endpoint
+    search_name = SearchKeyField(source="name")
+
     objects = models.Manager()
 
     def __str__(self):
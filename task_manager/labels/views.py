@@ -6,14 +6,25 @@ from django.views.generic.edit import DeleteView
 from django.views.generic.edit import UpdateView
 from django.views.generic.list import ListView
 
+from task_manager.core.cache import ConditionalGetMixin
+from task_manager.core.cache import RowCacheMixin
+from task_manager.core.lookups import AsyncModelLookupView
+from task_manager.core.lookups import ModelLookupView
 from task_manager.core.permission_mixins import ProtectObjectDeletionMixin
 from task_manager.core.permission_mixins import UserLoginRequiredMixin
 from task_manager.labels.forms import LabelForm
 from task_manager.labels.models import Label
+from task_manager.tasks.models import Task
 
 
-class LabelIndexView(UserLoginRequiredMixin, ListView):
-    """List all Label objects. Authentication required."""
+class LabelIndexView(UserLoginRequiredMixin,
+                     ConditionalGetMixin,
+                     RowCacheMixin,
+                     ListView):
+    """
+    List all Label objects. Authentication required.
+    Rows are cached by label's `created_at`, which is updated on save.
+    """
     model = Label
     template_name = "list_objects.html"
     extra_context = {
@@ -21,12 +32,26 @@ class LabelIndexView(UserLoginRequiredMixin, ListView):
         "button_text": _("Create label"),
         "button_class": "btn-success",
         "captions": [
-            "Name", "Creation date",
+            "Name", "Creation date", "Tasks",
         ],
         "url_to_create": reverse_lazy("create_label"),
         "url_to_update": "update_label",
         "url_to_delete": "delete_label",
+        "row_template": "includes/rows/named.html",
     }
+    # ConditionalGetMixin attrs, task changes change the counts
+    condition_models = (Label, Task)
+    # RowCacheMixin attrs
+    row_cache_fields = ("id", "created_at", "task_count")
+
+
+class LabelLookupView(ModelLookupView):
+    """Search labels by name prefix for typeahead widgets."""
+    queryset = Label.objects.all()
+
+
+class AsyncLabelLookupView(AsyncModelLookupView, LabelLookupView):
+    """LabelLookupView of async deployments, see ASYNC_VIEWS setting."""
 
 
 class LabelCreateView(UserLoginRequiredMixin,
@@ -10,6 +10,10 @@ class Status(models.Model):
                             verbose_name=_('Name'))
     created_at = models.DateTimeField(auto_now_add=True,
                                       verbose_name=_('Creation date'))
+    # Maintained by tasks.counters
+    task_count = models.IntegerField(default=0,
+                                     editable=False,
+                                     verbose_name=_('Tasks'))
     objects = models.Manager()
 
     def __str__(self):
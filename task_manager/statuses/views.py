@@ -6,13 +6,19 @@ from django.views.generic.edit import DeleteView
 from django.views.generic.edit import UpdateView
 from django.views.generic.list import ListView
 
+from task_manager.core.cache import ConditionalGetMixin
+from task_manager.core.cache import RowCacheMixin
 from task_manager.core.permission_mixins import ProtectObjectDeletionMixin
 from task_manager.core.permission_mixins import UserLoginRequiredMixin
 from task_manager.statuses.forms import StatusForm
 from task_manager.statuses.models import Status
+from task_manager.tasks.models import Task
 
 
-class StatusIndexView(UserLoginRequiredMixin, ListView):
+class StatusIndexView(UserLoginRequiredMixin,
+                      ConditionalGetMixin,
+                      RowCacheMixin,
+                      ListView):
     """List all Status objects. Authentication required."""
     model = Status
     template_name = "list_objects.html"
@@ -20,12 +26,18 @@ class StatusIndexView(UserLoginRequiredMixin, ListView):
         "title": _("Statuses"),
         "button_text": _("Create status"),
         "captions": [
-            _("Name"), _("Creation date")
+            _("Name"), _("Creation date"), _("Tasks"),
         ],
         "url_to_create": reverse_lazy("create_status"),
         "url_to_update": "update_status",
         "url_to_delete": "delete_status",
+        "row_template": "includes/rows/named.html",
     }
+    # ConditionalGetMixin attrs, task changes change the counts
+    condition_models = (Status, Task)
+    # RowCacheMixin attrs
+    row_cache_fields = ("id", "created_at", "task_count")
+    row_cache_models = (Status,)
 
 
 class StatusCreateView(UserLoginRequiredMixin,
@@ -1,5 +1,58 @@
+from django import forms
 from django.contrib import admin
+from django.contrib import messages
+from django.contrib.admin import helpers
+from django.template.response import TemplateResponse
+from django.utils.translation import gettext_lazy as _
 
+from task_manager.statuses.models import Status
+from task_manager.tasks.bulk import BulkTaskService
 from task_manager.tasks.models import Task
 
-admin.site.register(Task)
+
+class SetStatusForm(forms.Form):
+    status = forms.ModelChoiceField(
+        queryset=Status.objects.all(), label=_("Status")
+    )
+
+
+@admin.register(Task)
+class TaskAdmin(admin.ModelAdmin):
+    list_display = ("name", "status", "author", "performer", "created_at")
+    list_select_related = ("status", "author", "performer")
+    list_filter = ("status",)
+    actions = ("set_status",)
+
+    @admin.action(description=_("Change status of selected tasks"))
+    def set_status(self, request, queryset):
+        """Ask for a status, then move all tasks with one bulk update."""
+        form = SetStatusForm(request.POST if "apply" in request.POST
+                             else None)
+        ids = list(queryset.values_list("pk", flat=True))
+        if form.is_valid():
+            result = BulkTaskService(request.user).set_status(
+                ids, form.cleaned_data["status"].pk
+            )
+            if result.ok:
+                self.message_user(
+                    request,
+                    _("Status of %(count)s tasks changed")
+                    % {"count": len(result.ids)},
+                    messages.SUCCESS,
+                )
+            else:
+                for index, errors in result.errors.items():
+                    task = "" if index is None else f"#{ids[index]}: "
+                    for message in sum(errors.values(), []):
+                        self.message_user(
+                            request, task + message, messages.ERROR
+                        )
+            return None
+        return TemplateResponse(request, "admin/tasks/set_status.html", {
+            **self.admin_site.each_context(request),
+            "title": _("Change status of selected tasks"),
+            "opts": self.model._meta,
+            "form": form,
+            "ids": ids,
+            "action_checkbox_name": helpers.ACTION_CHECKBOX_NAME,
+        })
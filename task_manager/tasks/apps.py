@@ -4,3 +4,14 @@ from django.apps import AppConfig
 class TasksConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'task_manager.tasks'
+
+    def ready(self):
+        from django.db.models.signals import post_migrate
+
+        from task_manager.tasks.counters import connect_signals
+        from task_manager.tasks.search import repair_search_index
+        post_migrate.connect(
+            repair_search_index, sender=self,
+            dispatch_uid="tasks-repair-search-index",
+        )
+        connect_signals()
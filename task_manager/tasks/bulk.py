@@ -0,0 +1,388 @@
+"""
+Bulk operations on tasks. Items are validated together with a few
+queries, then written with batched queries in one transaction:
+either every item is applied or, if any item has errors, none.
+"""
+from dataclasses import dataclass
+from dataclasses import field
+
+from django.conf import settings
+from django.core.exceptions import NON_FIELD_ERRORS
+from django.core.exceptions import ValidationError
+from django.db import DatabaseError
+from django.db import transaction
+from django.utils.translation import gettext_lazy as _
+
+from task_manager.core.permission_mixins import TaskDeletionTestMixin
+from task_manager.core.signals import bump_version
+from task_manager.labels.models import Label
+from task_manager.statuses.models import Status
+from task_manager.tasks import counters
+from task_manager.tasks.models import Task
+from task_manager.tasks.models import TaskAndLabelNode
+from task_manager.users.models import User
+
+# Version of task rows, bulk queries change them keeping created_at
+ROWS_VERSION = "tasks.bulk-rows"
+
+TASK_FIELDS = ("name", "description", "status", "performer", "labels")
+
+invalid_choice_message = _(
+    "Select a valid choice. That choice is not one of the available choices."
+)
+missing_task_message = _("Task does not exist")
+item_type_message = _("Item must be an object")
+unknown_field_message = _("Unknown field")
+duplicate_name_message = _("Name is repeated in the request")
+
+
+def as_pk(value) -> int | None:
+    """Primary key given as a number or a string of digits."""
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, str) and value.isdigit():
+        value = int(value)
+    return value if isinstance(value, int) and value > 0 else None
+
+
+def batches(values: list, size: int):
+    for start in range(0, len(values), size):
+        yield values[start:start + size]
+
+
+def sync_labels(labels: dict[int, set], using: str = "default",
+                batch_size: int = None) -> None:
+    """
+    Make label nodes of tasks match the given label ids. Nodes are read
+    once, extra ones are deleted and missing ones inserted with a query
+    each per batch, unchanged tasks cost the read only. delete() reads
+    the extra nodes again to send post_delete, which counts them,
+    inserted ones are counted here.
+    """
+    if not labels:
+        return
+    batch_size = batch_size or settings.BULK_BATCH_SIZE
+    nodes = TaskAndLabelNode.objects.using(using)
+    extra = []
+    missing = {task: set(wanted) for task, wanted in labels.items()}
+    for batch in batches(list(labels), batch_size):
+        for pk, task, label in nodes.filter(task_id__in=batch) \
+                .values_list("pk", "task_id", "label_id"):
+            if label in missing[task]:
+                missing[task].discard(label)
+            else:
+                extra.append(pk)
+    with transaction.atomic(using=using, savepoint=False), \
+            counters.collect(using) as changes:
+        for batch in batches(extra, batch_size):
+            nodes.filter(pk__in=batch).delete()
+        nodes.bulk_create([
+            TaskAndLabelNode(task_id=task, label_id=label)
+            for task, wanted in missing.items()
+            for label in sorted(wanted)
+        ], batch_size=batch_size)
+        for wanted in missing.values():
+            changes.add_labels(wanted, 1)
+
+
+@dataclass
+class BulkResult:
+    """Ids of affected tasks or errors of items by their index."""
+    action: str
+    ids: list = field(default_factory=list)
+    errors: dict = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+    def add_error(self, index, name: str, message) -> None:
+        self.errors.setdefault(index, {}).setdefault(name, []) \
+            .append(str(message))
+
+    def as_dict(self) -> dict:
+        if self.ok:
+            return {"action": self.action, "ids": self.ids}
+        return {"action": self.action, "errors": [
+            {"index": index, "errors": errors}
+            for index, errors in sorted(
+                self.errors.items(), key=lambda item: (item[0] is None,
+                                                       item[0] or 0)
+            )
+        ]}
+
+
+class BulkTaskService:
+    """Create, update, move to a status or delete many tasks at once."""
+
+    def __init__(self, user: User, using: str = "default",
+                 batch_size: int = None):
+        self.user = user
+        self.using = using
+        self.batch_size = batch_size or settings.BULK_BATCH_SIZE
+
+    def batches(self, values: list):
+        return batches(values, self.batch_size)
+
+    def existing(self, queryset, values, *fields) -> list:
+        """values_list of rows whose pk is in values, batched."""
+        rows = []
+        for batch in self.batches(list(set(values))):
+            rows.extend(
+                queryset.using(self.using).filter(pk__in=batch)
+                .values_list(*fields, flat=len(fields) == 1)
+            )
+        return rows
+
+    def counted_values(self, pks: list) -> dict[int, dict]:
+        """Counted foreign keys of tasks before a bulk query changes them."""
+        keys = [key for key, _model, _counter in counters.TASK_COUNTERS]
+        return {
+            pk: dict(zip(keys, values))
+            for pk, *values in self.existing(Task.objects, pks, "pk", *keys)
+        }
+
+    # Validation
+
+    def clean_items(self, items: list, result: BulkResult,
+                    update: bool = False) -> list[dict]:
+        """Check values of every item, then references with one query each."""
+        allowed = {"id", *TASK_FIELDS} if update else set(TASK_FIELDS)
+        cleaned = []
+        for index, item in enumerate(items):
+            data = {}
+            cleaned.append(data)
+            if not isinstance(item, dict):
+                result.add_error(index, NON_FIELD_ERRORS, item_type_message)
+                continue
+            for name in set(item) - allowed:
+                result.add_error(index, name, unknown_field_message)
+            if update:
+                data["id"] = as_pk(item.get("id"))
+                if data["id"] is None:
+                    result.add_error(index, "id", missing_task_message)
+            for name in ("name", "description"):
+                if name in item or not update:
+                    try:
+                        data[name] = Task._meta.get_field(name).clean(
+                            item.get(name, ""), None
+                        )
+                    except ValidationError as error:
+                        for message in error.messages:
+                            result.add_error(index, name, message)
+            if "status" in item or not update:
+                data["status"] = as_pk(item.get("status"))
+                if data["status"] is None:
+                    result.add_error(index, "status", invalid_choice_message)
+            if "performer" in item:
+                data["performer"] = as_pk(item["performer"])
+                if item["performer"] not in (None, "") \
+                        and data["performer"] is None:
+                    result.add_error(
+                        index, "performer", invalid_choice_message
+                    )
+            if "labels" in item:
+                labels = item["labels"] or []
+                pks = [as_pk(label) for label in labels] \
+                    if isinstance(labels, list) else [None]
+                if None in pks:
+                    result.add_error(index, "labels", invalid_choice_message)
+                data["labels"] = set(pks) - {None}
+
+        self.check_references(cleaned, result)
+        self.check_names(cleaned, result)
+        if update:
+            tasks = set(self.existing(
+                Task.objects, [data["id"] for data in cleaned
+                               if data.get("id")], "pk",
+            ))
+            for index, data in enumerate(cleaned):
+                if data.get("id") and data["id"] not in tasks:
+                    result.add_error(index, "id", missing_task_message)
+        return cleaned
+
+    def check_references(self, cleaned: list[dict], result: BulkResult):
+        references = (
+            ("status", Status.objects),
+            ("performer", User.objects.exclude(is_superuser=True)),
+            ("labels", Label.objects),
+        )
+        for name, queryset in references:
+            def referenced(data: dict) -> set:
+                if name == "labels":
+                    return data.get(name, set())
+                return {data.get(name)} - {None}
+
+            wanted = set().union(*map(referenced, cleaned))
+            found = set(self.existing(queryset, wanted, "pk"))
+            for index, data in enumerate(cleaned):
+                if referenced(data) - found:
+                    result.add_error(index, name, invalid_choice_message)
+
+    def check_names(self, cleaned: list[dict], result: BulkResult):
+        """Names are unique among items and existing tasks."""
+        first_use = {}
+        for index, data in enumerate(cleaned):
+            name = data.get("name")
+            if not name:
+                continue
+            if name in first_use:
+                result.add_error(index, "name", duplicate_name_message)
+            first_use.setdefault(name, index)
+        taken = {}
+        for batch in self.batches(list(first_use)):
+            taken.update(
+                Task.objects.using(self.using).filter(name__in=batch)
+                .values_list("name", "pk")
+            )
+        unique_message = Task().unique_error_message(Task, ["name"])
+        for index, data in enumerate(cleaned):
+            pk = taken.get(data.get("name"))
+            if pk is not None and pk != data.get("id"):
+                result.add_error(index, "name", unique_message.messages[0])
+
+    # Writing
+
+    def write(self, result: BulkResult, operation) -> BulkResult:
+        """
+        Run operation(changes) in a transaction, tables changed get new
+        versions. Bulk queries send no signals, so operations report
+        changes of task counters themselves.
+        """
+        if not result.ok:
+            return result
+        try:
+            with transaction.atomic(using=self.using), \
+                    counters.collect(self.using) as changes:
+                operation(changes)
+                bump_version(Task, using=self.using)
+                bump_version(ROWS_VERSION, using=self.using)
+        except DatabaseError as error:
+            result.ids = []
+            result.add_error(None, NON_FIELD_ERRORS, error)
+        return result
+
+    def create(self, items: list[dict]) -> BulkResult:
+        result = BulkResult("create")
+        cleaned = self.clean_items(items, result)
+        tasks = [
+            Task(
+                name=data.get("name"),
+                description=data.get("description", ""),
+                status_id=data.get("status"),
+                performer_id=data.get("performer"),
+                author=self.user,
+            )
+            for data in cleaned
+        ]
+
+        def operation(changes):
+            Task.objects.using(self.using).bulk_create(
+                tasks, batch_size=self.batch_size
+            )
+            TaskAndLabelNode.objects.using(self.using).bulk_create([
+                TaskAndLabelNode(task_id=task.pk, label_id=label)
+                for task, data in zip(tasks, cleaned)
+                for label in sorted(data.get("labels", ()))
+            ], batch_size=self.batch_size)
+            for task, data in zip(tasks, cleaned):
+                changes.add_task(counters.task_values(task), 1)
+                changes.add_labels(data.get("labels", ()), 1)
+            result.ids = [task.pk for task in tasks]
+
+        return self.write(result, operation)
+
+    def update(self, items: list[dict]) -> BulkResult:
+        """Change only the fields given in every item."""
+        result = BulkResult("update")
+        cleaned = self.clean_items(items, result, update=True)
+        groups = {}
+        for data in cleaned:
+            fields = tuple(sorted(
+                set(data) & {"name", "description", "status", "performer"}
+            ))
+            task = Task(pk=data.get("id"))
+            for name in fields:
+                setattr(task, Task._meta.get_field(name).attname, data[name])
+            groups.setdefault(fields, []).append(task)
+        labels = {
+            data["id"]: data["labels"] for data in cleaned if "labels" in data
+        }
+
+        def operation(changes):
+            old = self.counted_values([
+                task.pk for fields, tasks in groups.items()
+                if {"status", "performer"} & set(fields) for task in tasks
+            ])
+            for fields, tasks in groups.items():
+                if fields:
+                    Task.objects.using(self.using).bulk_update(
+                        tasks, fields, batch_size=self.batch_size
+                    )
+                keys = {Task._meta.get_field(name).attname for name in fields}
+                for task in tasks:
+                    if task.pk in old:
+                        new = counters.task_values(task)
+                        for values, delta in ((old[task.pk], -1), (new, 1)):
+                            changes.add_task({
+                                key: value for key, value in values.items()
+                                if key in keys
+                            }, delta)
+            sync_labels(labels, self.using, self.batch_size)
+            result.ids = [data["id"] for data in cleaned]
+
+        return self.write(result, operation)
+
+    def clean_ids(self, ids: list, result: BulkResult) -> list[int]:
+        pks = [as_pk(pk) for pk in ids]
+        for index, pk in enumerate(pks):
+            if pk is None:
+                result.add_error(index, "id", missing_task_message)
+        return pks
+
+    def set_status(self, ids: list, status) -> BulkResult:
+        result = BulkResult("set_status")
+        pks = self.clean_ids(ids, result)
+        status = as_pk(status)
+        if status is None or not self.existing(
+            Status.objects, [status], "pk"
+        ):
+            result.add_error(None, "status", invalid_choice_message)
+        found = set(self.existing(Task.objects, pks, "pk"))
+        for index, pk in enumerate(pks):
+            if pk is not None and pk not in found:
+                result.add_error(index, "id", missing_task_message)
+
+        def operation(changes):
+            for pk, values in self.counted_values(pks).items():
+                changes.add_task({"status_id": values["status_id"]}, -1)
+                changes.add_task({"status_id": status}, 1)
+            for batch in self.batches(pks):
+                Task.objects.using(self.using).filter(pk__in=batch) \
+                    .update(status_id=status)
+            result.ids = pks
+
+        return self.write(result, operation)
+
+    def delete(self, ids: list) -> BulkResult:
+        """Only the author can delete a task, like in TaskDeleteView."""
+        result = BulkResult("delete")
+        pks = self.clean_ids(ids, result)
+        authors = dict(self.existing(Task.objects, pks, "pk", "author_id"))
+        for index, pk in enumerate(pks):
+            if pk is None:
+                continue
+            if pk not in authors:
+                result.add_error(index, "id", missing_task_message)
+            elif authors[pk] != self.user.pk:
+                result.add_error(
+                    index, "id", TaskDeletionTestMixin.protect_message
+                )
+
+        def operation(changes):
+            # Deleted tasks and nodes are counted by post_delete
+            for batch in self.batches(pks):
+                Task.objects.using(self.using).filter(pk__in=batch).delete()
+            result.ids = pks
+
+        return self.write(result, operation)
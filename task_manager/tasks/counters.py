@@ -0,0 +1,264 @@
+"""
+Task counters of statuses, labels and users, and tasks by day.
+
+Counter columns are changed with F() expressions in the transaction
+which changes tasks. Saving and deleting tasks and label nodes reports
+the changes through signals, bulk queries sending no signals report
+them with `collect()`. Inside `collect()` changes are summed up and
+written with one query per counter and delta when the block ends.
+`reconcile_counters` command recounts them from the tasks, which is
+needed after loading fixtures written without counters.
+"""
+import threading
+from collections import Counter
+from collections import defaultdict
+from contextlib import contextmanager
+
+from django.db.models import Count
+from django.db.models import F
+from django.db.models import IntegerField
+from django.db.models import OuterRef
+from django.db.models import Subquery
+from django.db.models.functions import Coalesce
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from task_manager.labels.models import Label
+from task_manager.statuses.models import Status
+from task_manager.tasks.models import DailyTaskSummary
+from task_manager.tasks.models import Task
+from task_manager.tasks.models import TaskAndLabelNode
+from task_manager.users.models import User
+
+# (task foreign key, counted model, counter field)
+TASK_COUNTERS = (
+    ("status_id", Status, "task_count"),
+    ("author_id", User, "authored_task_count"),
+    ("performer_id", User, "performed_task_count"),
+)
+LABEL_COUNTER = ("label_id", Label, "task_count")
+# Counted by the day of the value, rows are created for new days
+DAY_COUNTER = ("created_at", DailyTaskSummary, "task_count")
+
+_collecting = threading.local()
+
+
+class CounterChanges:
+    """Deltas of counters by the primary key of counted objects."""
+
+    def __init__(self):
+        self.deltas = defaultdict(Counter)
+
+    def add(self, model, counter: str, pk, delta: int) -> None:
+        if pk is not None and delta:
+            self.deltas[model, counter][pk] += delta
+
+    def add_task(self, values: dict, delta: int) -> None:
+        """Task given by `task_values` is added (1) or removed (-1)."""
+        for key, model, counter in TASK_COUNTERS:
+            if key in values:
+                self.add(model, counter, values[key], delta)
+        key, model, counter = DAY_COUNTER
+        if values.get(key) is not None:
+            self.add(model, counter, day_of(values[key]), delta)
+
+    def add_labels(self, labels, delta: int) -> None:
+        _key, model, counter = LABEL_COUNTER
+        for pk in labels:
+            self.add(model, counter, pk, delta)
+
+    def apply(self, using: str) -> None:
+        for (model, counter), deltas in self.deltas.items():
+            by_delta = defaultdict(list)
+            for pk, delta in deltas.items():
+                if delta:
+                    by_delta[delta].append(pk)
+            if model is DAY_COUNTER[1] and by_delta:
+                model.objects.using(using).bulk_create(
+                    [model(pk=pk) for pk in deltas], ignore_conflicts=True,
+                )
+            for delta, pks in by_delta.items():
+                model.objects.using(using).filter(pk__in=pks) \
+                    .update(**{counter: F(counter) + delta})
+        self.deltas.clear()
+
+
+@contextmanager
+def collect(using: str = "default"):
+    """
+    Sum up counter changes of the block, including ones from signals,
+    and write them at its end. Nested blocks share the outer changes.
+    """
+    active = getattr(_collecting, "changes", {})
+    if using in active:
+        yield active[using]
+        return
+    changes = active[using] = CounterChanges()
+    _collecting.changes = active
+    try:
+        yield changes
+    finally:
+        del active[using]
+    changes.apply(using)
+
+
+def record(using: str, change) -> None:
+    """Apply change(changes) now, or at the end of the active collect()."""
+    with collect(using) as changes:
+        change(changes)
+
+
+def day_of(value):
+    """Day of the creation date in the current time zone."""
+    if timezone.is_naive(value):
+        return value.date()
+    return timezone.localdate(value)
+
+
+def task_values(task: Task) -> dict:
+    """Loaded counted values, deferred ones are skipped."""
+    return {
+        key: task.__dict__[key]
+        for key, _model, _counter in (*TASK_COUNTERS, DAY_COUNTER)
+        if key in task.__dict__
+    }
+
+
+# Signal receivers
+
+def task_saved(sender, instance, created, using, raw=False, **kwargs):
+    loaded = getattr(instance, "_loaded_values", None)
+    new = task_values(instance)
+    if raw or not created and loaded is None:
+        # Loaded fixtures have counters of their own. Tasks saved without
+        # being loaded, like Task(pk=...).save(), have no old values.
+        return
+    old = {} if created else loaded
+    instance._loaded_values = {**(loaded or {}), **new}
+
+    def change(changes):
+        changes.add_task({key: old[key] for key in new if key in old}, -1)
+        changes.add_task(
+            {key: new[key] for key in new if created or key in old}, 1
+        )
+
+    record(using, change)
+
+
+def task_deleted(sender, instance, using, **kwargs):
+    values = {**task_values(instance),
+              **getattr(instance, "_loaded_values", {})}
+    record(using, lambda changes: changes.add_task(values, -1))
+
+
+def node_saved(sender, instance, created, using, raw=False, **kwargs):
+    if created and not raw:
+        record(using, lambda changes: changes.add_labels(
+            [instance.label_id], 1
+        ))
+
+
+def node_deleted(sender, instance, using, **kwargs):
+    record(using, lambda changes: changes.add_labels(
+        [instance.label_id], -1
+    ))
+
+
+def labels_added(sender, instance, action, reverse, pk_set, using,
+                 **kwargs):
+    """
+    m2m_changed receiver. add() bulk creates nodes without post_save,
+    remove() and clear() delete them one by one with post_delete.
+    """
+    if action != "post_add" or not pk_set:
+        return
+    if reverse:
+        # label.labels.add(*tasks)
+        record(using, lambda changes: changes.add(
+            Label, LABEL_COUNTER[2], instance.pk, len(pk_set)
+        ))
+    else:
+        record(using, lambda changes: changes.add_labels(pk_set, 1))
+
+
+def connect_signals():
+    from django.db.models.signals import m2m_changed
+    from django.db.models.signals import post_delete
+    from django.db.models.signals import post_save
+
+    receivers = (
+        (post_save, task_saved, Task),
+        (post_delete, task_deleted, Task),
+        (post_save, node_saved, TaskAndLabelNode),
+        (post_delete, node_deleted, TaskAndLabelNode),
+        (m2m_changed, labels_added, TaskAndLabelNode),
+    )
+    for signal, receiver, sender in receivers:
+        signal.connect(
+            receiver, sender=sender,
+            dispatch_uid=f"counters-{receiver.__name__}",
+        )
+
+
+# Reconciliation
+
+def actual_counts():
+    """(model, counter, subquery counting tasks of the outer row)."""
+    for key, model, counter in (*TASK_COUNTERS, LABEL_COUNTER):
+        source = TaskAndLabelNode if model is Label else Task
+        rows = source.objects.filter(**{key: OuterRef("pk")}) \
+            .order_by().values(key).annotate(count=Count("pk"))
+        yield model, counter, Coalesce(
+            Subquery(rows.values("count"), output_field=IntegerField()), 0
+        )
+
+
+def reconcile_days(using: str, fix: bool) -> int:
+    """Rebuild DailyTaskSummary, aggregating all tasks once."""
+    _key, model, counter = DAY_COUNTER
+    actual = dict(
+        Task.objects.using(using).order_by()
+        .values_list(TruncDate("created_at"))
+        .annotate(count=Count("pk"))
+    )
+    stored = dict(
+        model.objects.using(using).exclude(**{counter: 0})
+        .values_list("pk", counter)
+    )
+    wrong = {
+        day for day in actual.keys() | stored.keys()
+        if actual.get(day) != stored.get(day)
+    }
+    if wrong and fix:
+        objects = model.objects.using(using)
+        objects.filter(pk__in=wrong - actual.keys()).delete()
+        objects.bulk_create(
+            [model(pk=day, **{counter: actual[day]})
+             for day in wrong & actual.keys()],
+            batch_size=500,
+            update_conflicts=True,
+            update_fields=[counter],
+            unique_fields=["day"],
+        )
+    return len(wrong)
+
+
+def reconcile_counters(using: str = "default", fix: bool = True) -> dict:
+    """Number of wrong counters by `model.counter`, fixed unless told not."""
+    _key, model, counter = DAY_COUNTER
+    wrong = {
+        f"{model._meta.label}.{counter}": reconcile_days(using, fix),
+    }
+    for model, counter, actual in actual_counts():
+        objects = model.objects.using(using)
+        pks = list(
+            objects.annotate(actual=actual)
+            .exclude(**{counter: F("actual")})
+            .values_list("pk", flat=True)
+        )
+        wrong[f"{model._meta.label}.{counter}"] = len(pks)
+        if pks and fix:
+            for start in range(0, len(pks), 500):
+                objects.filter(pk__in=pks[start:start + 500]) \
+                    .update(**{counter: actual})
+    return wrong
@@ -0,0 +1,108 @@
+"""
+Export of filtered tasks as CSV or JSON lines. Rows are read in
+keyset chunks and written as they come, so memory holds one chunk.
+"""
+import csv
+import json
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import F
+from django.db.models import OuterRef
+from django.db.models import Subquery
+from django.db.models import Value
+from django.db.models.functions import Concat
+from django.utils.translation import gettext_lazy as _
+
+from task_manager.core.aggregates import GroupConcat
+from task_manager.core.pagination import KeysetPaginator
+from task_manager.tasks.models import TaskAndLabelNode
+
+# Can't appear in a label name typed in a form, unlike a comma
+LABEL_SEPARATOR = "\x1f"
+
+COLUMNS = (
+    ("id", "ID"),
+    ("name", _("Name")),
+    ("description", _("Description")),
+    ("status", _("Status")),
+    ("author", _("Author")),
+    ("performer", _("Performer")),
+    ("labels", _("Labels")),
+    ("created_at", _("Creation date")),
+)
+
+
+def full_name(prefix: str):
+    return Concat(
+        F(f"{prefix}__first_name"), Value(" "), F(f"{prefix}__last_name")
+    )
+
+
+def with_export_columns(queryset):
+    """Related names are joined, label names aggregated per task in SQL."""
+    label_names = TaskAndLabelNode.objects.filter(task=OuterRef("pk")) \
+        .order_by().values("task") \
+        .annotate(names=GroupConcat("label__name", LABEL_SEPARATOR)) \
+        .values("names")
+    return queryset.annotate(
+        status_name=F("status__name"),
+        author_name=full_name("author"),
+        performer_name=full_name("performer"),
+        label_names=Subquery(label_names),
+    )
+
+
+def iter_tasks(queryset, chunk_size: int):
+    """Export rows of the queryset in its ordering, chunk by chunk."""
+    paginator = KeysetPaginator(with_export_columns(queryset), chunk_size)
+    fields = (
+        "id", "name", "description", "status_name", "author_name",
+        "performer_name", "label_names", "created_at",
+    )
+    cursor = None
+    while True:
+        rows = list(
+            paginator.forward_queryset(cursor)
+            .values(*fields, *paginator.key_names)
+        )
+        for row in rows[:chunk_size]:
+            labels = row["label_names"]
+            yield {
+                "id": row["id"],
+                "name": row["name"],
+                "description": row["description"],
+                "status": row["status_name"],
+                "author": row["author_name"].strip(),
+                "performer": (row["performer_name"] or "").strip(),
+                "labels": sorted(labels.split(LABEL_SEPARATOR))
+                if labels else [],
+                "created_at": row["created_at"],
+            }
+        if len(rows) <= chunk_size:
+            return
+        cursor = paginator.next_cursor_for(rows[chunk_size - 1])
+
+
+class Echo:
+    """File-like object handing written lines back to csv.writer."""
+
+    def write(self, value: str) -> str:
+        return value
+
+
+def csv_lines(tasks, header: list[str]):
+    writer = csv.writer(Echo())
+    yield writer.writerow(header)
+    for task in tasks:
+        yield writer.writerow([
+            ", ".join(task[name]) if name == "labels"
+            else task[name].isoformat() if name == "created_at"
+            else task[name]
+            for name, _caption in COLUMNS
+        ])
+
+
+def jsonl_lines(tasks, header: list[str]):
+    for task in tasks:
+        yield json.dumps(task, cls=DjangoJSONEncoder, ensure_ascii=False) \
+            + "\n"
@@ -1,7 +1,10 @@
 import django_filters
 from django import forms
+from django.urls import reverse_lazy
 from django.utils.translation import gettext_lazy as _
 
+from task_manager.core.choices import CachedModelChoiceFilter
+from task_manager.core.widgets import LookupSelect
 from task_manager.labels.models import Label
 from task_manager.statuses.models import Status
 from task_manager.tasks.models import Task
@@ -9,17 +12,49 @@ from task_manager.users.models import User
 
 
 class TaskFilter(django_filters.FilterSet):
-    """Filter queryset by status, performer, labels and own tasks."""
-    status = django_filters.ModelChoiceFilter(queryset=Status.objects.all())
-    performer = django_filters.ModelChoiceFilter(
-        queryset=User.objects.exclude(is_superuser=True)
+    """
+    Filter queryset by text, status, performer, labels and own tasks.
+    Text search orders tasks by relevance unless ordering is chosen.
+    Status choices are rendered from cache, performers and labels
+    are searched with lookup endpoints.
+    Chosen ordering is continued by the keyset paginator of the list
+    view, so only non-nullable columns are sortable.
+    """
+    search = django_filters.CharFilter(
+        label=_("Search"),
+        method="search_tasks",
+    )
+    status = CachedModelChoiceFilter(queryset=Status.objects.all())
+    performer = CachedModelChoiceFilter(
+        queryset=User.objects.exclude(is_superuser=True),
+        widget=LookupSelect(lookup_url=reverse_lazy("lookup_user")),
+    )
+    labels = CachedModelChoiceFilter(
+        queryset=Label.objects.all(),
+        widget=LookupSelect(lookup_url=reverse_lazy("lookup_label")),
     )
-    labels = django_filters.ModelChoiceFilter(queryset=Label.objects.all())
     own_task = django_filters.BooleanFilter(
         label=_("Only own tasks"),
         method="get_user_own_tasks",
         widget=forms.CheckboxInput
     )
+    ordering = django_filters.OrderingFilter(
+        fields=(
+            ("created_at", "created_at"),
+            ("name", "name"),
+            ("status__name", "status"),
+            ("author__first_name", "author"),
+        ),
+        field_labels={
+            "created_at": _("Creation date"),
+            "name": _("Name"),
+            "status__name": _("Status"),
+            "author__first_name": _("Author"),
+        },
+    )
+
+    def search_tasks(self, queryset, name, value):
+        return queryset.search(value) if value.strip() else queryset
 
     def get_user_own_tasks(self, queryset, name, value):
         if value:
@@ -29,4 +64,6 @@ class TaskFilter(django_filters.FilterSet):
 
     class Meta:
         model = Task
-        fields = ["status", "performer", "labels", "own_task"]
+        fields = [
+            "search", "status", "performer", "labels", "own_task", "ordering",
+        ]
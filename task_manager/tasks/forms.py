@@ -1,27 +1,58 @@
-from django import forms
+from django.db import router
+from django.db import transaction
 from django.forms import ModelForm
+from django.urls import reverse_lazy
 
+from task_manager.core.choices import CachedModelChoiceField
+from task_manager.core.choices import CachedModelMultipleChoiceField
+from task_manager.core.widgets import LookupSelect
+from task_manager.core.widgets import LookupSelectMultiple
 from task_manager.labels.models import Label
 from task_manager.statuses.models import Status
+from task_manager.tasks import counters
+from task_manager.tasks.bulk import sync_labels
 from task_manager.tasks.models import Task
 from task_manager.users.models import User
 
 
 class TaskForm(ModelForm):
-    """Create form for tasks."""
-    status = forms.ModelChoiceField(
+    """
+    Create form for tasks. Status choices are rendered from cache,
+    performers and labels are searched with lookup endpoints.
+    The task and its labels are saved in one transaction, labels by
+    difference with the saved ones.
+    """
+    status = CachedModelChoiceField(
         queryset=Status.objects.all(),
         required=True,
     )
-    performer = forms.ModelChoiceField(
+    performer = CachedModelChoiceField(
         queryset=User.objects.exclude(is_superuser=True),
         required=False,
+        widget=LookupSelect(lookup_url=reverse_lazy("lookup_user")),
     )
-    labels = forms.ModelMultipleChoiceField(
+    labels = CachedModelMultipleChoiceField(
         queryset=Label.objects.all(),
         required=False,
+        widget=LookupSelectMultiple(lookup_url=reverse_lazy("lookup_label")),
     )
 
+    def save(self, commit=True):
+        if not commit:
+            return super().save(commit=False)
+        using = router.db_for_write(Task, instance=self.instance)
+        with transaction.atomic(using=using), counters.collect(using):
+            return super().save()
+
+    def _save_m2m(self):
+        """Labels are the only many to many field, synced by difference."""
+        sync_labels(
+            {self.instance.pk: {
+                label.pk for label in self.cleaned_data["labels"]
+            }},
+            using=self.instance._state.db,
+        )
+
     class Meta:
         model = Task
         fields = ["name", "description", "status", "performer", "labels"]
@@ -0,0 +1,330 @@
+"""
+Import of tasks from CSV or JSON lines. Rows are read as a stream and
+written with bulk_create in batches, one transaction per batch.
+Statuses, labels and users are referenced by name (users by username)
+and resolved through in-memory maps, missing ones may be created.
+"""
+import csv
+import json
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from dataclasses import field
+
+from django.contrib.auth.hashers import make_password
+from django.db import connections
+from django.db import transaction
+from django.utils.dateparse import parse_datetime
+
+from task_manager.core.signals import bump_version
+from task_manager.labels.models import Label
+from task_manager.statuses.models import Status
+from task_manager.tasks import counters
+from task_manager.tasks.models import explicit_created_at
+from task_manager.tasks.models import Task
+from task_manager.tasks.models import TaskAndLabelNode
+from task_manager.users.models import User
+
+# Indexes rebuilt once after the import instead of on every insert
+DEFERRABLE_INDEXES = (Task, TaskAndLabelNode)
+
+# Columns holding text, checked against their model fields
+TEXT_COLUMNS = {
+    "name": Task._meta.get_field("name"),
+    "description": Task._meta.get_field("description"),
+    "status": Status._meta.get_field("name"),
+    "author": User._meta.get_field("username"),
+    "performer": User._meta.get_field("username"),
+    "created_at": None,
+}
+LABEL_MAX_LENGTH = Label._meta.get_field("name").max_length
+
+
+@dataclass
+class InvalidRow:
+    """Row a reader can't parse, reported as an error of its line."""
+    message: str
+
+
+def read_csv(file):
+    """Rows of a CSV file with a header, labels separated by commas."""
+    reader = csv.DictReader(file)
+    while True:
+        try:
+            row = next(reader)
+        except StopIteration:
+            return
+        except csv.Error as error:
+            # The reader goes on with the next line
+            row = InvalidRow(f"invalid CSV: {error}")
+        yield row
+
+
+def read_jsonl(file):
+    """One JSON object per line, labels as a list or comma separated."""
+    for line in file:
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except json.JSONDecodeError as error:
+            yield InvalidRow(f"invalid JSON: {error.msg}")
+            continue
+        yield row if isinstance(row, dict) \
+            else InvalidRow("row is not a JSON object")
+
+
+READERS = {"csv": read_csv, "jsonl": read_jsonl}
+
+
+def split_labels(value) -> list[str]:
+    if not value:
+        return []
+    names = value if isinstance(value, list) else value.split(",")
+    return list(dict.fromkeys(name.strip() for name in names if name.strip()))
+
+
+@contextmanager
+def deferred_indexes(using: str = "default"):
+    """Drop Meta indexes of task tables and create them again at exit."""
+    connection = connections[using]
+    dropped = []
+    for model in DEFERRABLE_INDEXES:
+        with connection.cursor() as cursor:
+            existing = connection.introspection.get_constraints(
+                cursor, model._meta.db_table
+            )
+        with connection.schema_editor() as editor:
+            for index in model._meta.indexes:
+                if index.name in existing:
+                    editor.remove_index(model, index)
+                    dropped.append((model, index))
+    try:
+        yield
+    finally:
+        with connection.schema_editor() as editor:
+            for model, index in dropped:
+                editor.add_index(model, index)
+
+
+@dataclass
+class ImportResult:
+    rows: int = 0
+    imported: int = 0
+    skipped: int = 0
+    created: dict = field(default_factory=dict)
+    errors: list = field(default_factory=list)
+    elapsed: float = 0
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.elapsed if self.elapsed else 0
+
+
+class TaskImporter:
+    """
+    Write rows with columns name, description, status, author,
+    performer, labels and optional created_at as tasks.
+    Rows whose task name already exists are skipped.
+    """
+
+    max_errors = 100
+
+    def __init__(self, batch_size: int = 1000, create_missing: bool = True,
+                 default_author: str = None, using: str = "default",
+                 progress=None):
+        self.batch_size = batch_size
+        self.create_missing = create_missing
+        self.default_author = default_author
+        self.using = using
+        self.progress = progress
+        self.result = ImportResult()
+        self.statuses = self.load_map(Status, "name")
+        self.labels = self.load_map(Label, "name")
+        self.users = self.load_map(User, "username")
+        self.names = set()
+
+    def load_map(self, model, field_name: str) -> dict:
+        return dict(
+            model.objects.using(self.using).values_list(field_name, "pk")
+        )
+
+    def error(self, line: int, message: str) -> None:
+        self.result.skipped += 1
+        if len(self.result.errors) < self.max_errors:
+            self.result.errors.append(f"row {line}: {message}")
+
+    def run(self, rows) -> ImportResult:
+        started = time.perf_counter()
+        batch = []
+        for line, row in enumerate(rows, start=1):
+            self.result.rows += 1
+            batch.append((line, row))
+            if len(batch) == self.batch_size:
+                self.write(batch)
+                batch = []
+                self.result.elapsed = time.perf_counter() - started
+                if self.progress:
+                    self.progress(self.result)
+        if batch:
+            self.write(batch)
+        self.result.elapsed = time.perf_counter() - started
+        return self.result
+
+    def resolve(self, model, names: set[str], mapping: dict,
+                make) -> int:
+        """Create missing referenced objects of a batch at once."""
+        missing = sorted(name for name in names if name not in mapping)
+        if not missing or not self.create_missing:
+            return 0
+        objects = model.objects.using(self.using).bulk_create(
+            [make(name) for name in missing], batch_size=self.batch_size
+        )
+        field_name = "username" if model is User else "name"
+        for obj in objects:
+            mapping[getattr(obj, field_name)] = obj.pk
+        label = model._meta.label
+        self.result.created[label] = \
+            self.result.created.get(label, 0) + len(objects)
+        return len(objects)
+
+    def check_types(self, row: dict) -> str | None:
+        """Message of the first value of a wrong type or length."""
+        for column, model_field in TEXT_COLUMNS.items():
+            value = row.get(column)
+            if value is None:
+                continue
+            if not isinstance(value, str):
+                return f"{column} is not a string"
+            max_length = model_field and model_field.max_length
+            if max_length and len(value.strip()) > max_length:
+                return f"{column} is longer than {max_length} characters"
+        labels = row.get("labels")
+        if isinstance(labels, list):
+            if not all(isinstance(label, str) for label in labels):
+                return "labels are not strings"
+        elif labels is not None and not isinstance(labels, str):
+            return "labels are not a string or a list"
+        if any(len(label) > LABEL_MAX_LENGTH
+               for label in split_labels(labels)):
+            return f"labels are longer than {LABEL_MAX_LENGTH} characters"
+        return None
+
+    def clean(self, line: int, row: dict | InvalidRow) -> dict | None:
+        if isinstance(row, InvalidRow):
+            self.error(line, row.message)
+            return None
+        message = self.check_types(row)
+        if message:
+            self.error(line, message)
+            return None
+        name = (row.get("name") or "").strip()
+        status = (row.get("status") or "").strip()
+        author = (row.get("author") or self.default_author or "").strip()
+        if not name or not status or not author:
+            self.error(line, "name, status and author are required")
+            return None
+        if name in self.names:
+            self.error(line, f"task {name!r} is repeated")
+            return None
+        created_at = None
+        if row.get("created_at"):
+            try:
+                created_at = parse_datetime(row["created_at"])
+            except ValueError:
+                created_at = None
+            if created_at is None:
+                self.error(line, "created_at is not a date and time")
+                return None
+        self.names.add(name)
+        return {
+            "line": line,
+            "name": name,
+            "description": row.get("description") or "",
+            "status": status,
+            "author": author,
+            "performer": (row.get("performer") or "").strip() or None,
+            "labels": split_labels(row.get("labels")),
+            "created_at": created_at,
+        }
+
+    def write(self, batch: list) -> None:
+        rows = [self.clean(line, row) for line, row in batch]
+        rows = [row for row in rows if row is not None]
+        existing = set(
+            Task.objects.using(self.using)
+            .filter(name__in=[row["name"] for row in rows])
+            .values_list("name", flat=True)
+        )
+        password = make_password(None)
+        with transaction.atomic(using=self.using), \
+                counters.collect(self.using) as changes:
+            created = self.resolve(
+                Status, {row["status"] for row in rows}, self.statuses,
+                lambda name: Status(name=name),
+            )
+            created += self.resolve(
+                Label, {name for row in rows for name in row["labels"]},
+                self.labels, lambda name: Label(name=name),
+            )
+            created += self.resolve(
+                User,
+                {row[key] for row in rows for key in ("author", "performer")
+                 if row[key]},
+                self.users,
+                lambda name: User(username=name, password=password),
+            )
+
+            tasks, task_labels = [], []
+            for row in rows:
+                if row["name"] in existing:
+                    self.error(row["line"], f"task {row['name']!r} exists")
+                    continue
+                missing = [
+                    value for value, mapping in (
+                        (row["status"], self.statuses),
+                        (row["author"], self.users),
+                        (row["performer"], self.users),
+                        *((label, self.labels) for label in row["labels"]),
+                    )
+                    if value is not None and value not in mapping
+                ]
+                if missing:
+                    self.error(row["line"], f"unknown {', '.join(missing)}")
+                    continue
+                tasks.append(Task(
+                    name=row["name"],
+                    description=row["description"],
+                    status_id=self.statuses[row["status"]],
+                    author_id=self.users[row["author"]],
+                    performer_id=self.users.get(row["performer"]),
+                    created_at=row["created_at"],
+                ))
+                task_labels.append(row["labels"])
+
+            self.insert_tasks(tasks)
+            TaskAndLabelNode.objects.using(self.using).bulk_create([
+                TaskAndLabelNode(task_id=task.pk, label_id=self.labels[name])
+                for task, names in zip(tasks, task_labels)
+                for name in names
+            ], batch_size=self.batch_size)
+            for task, names in zip(tasks, task_labels):
+                changes.add_task(counters.task_values(task), 1)
+                changes.add_labels(
+                    {self.labels[name] for name in names}, 1
+                )
+            if tasks or created:
+                for model in (Task, Status, Label, User):
+                    bump_version(model, using=self.using)
+        self.result.imported += len(tasks)
+
+    def insert_tasks(self, tasks: list[Task]) -> None:
+        dated = [task for task in tasks if task.created_at is not None]
+        undated = [task for task in tasks if task.created_at is None]
+        Task.objects.using(self.using).bulk_create(
+            undated, batch_size=self.batch_size
+        )
+        with explicit_created_at():
+            Task.objects.using(self.using).bulk_create(
+                dated, batch_size=self.batch_size
+            )
@@ -0,0 +1,78 @@
+import sys
+from contextlib import nullcontext
+from pathlib import Path
+
+from django.core.management.base import BaseCommand
+from django.core.management.base import CommandError
+
+from task_manager.tasks.importer import deferred_indexes
+from task_manager.tasks.importer import READERS
+from task_manager.tasks.importer import TaskImporter
+
+
+class Command(BaseCommand):
+    help = (
+        "Import tasks from a CSV or JSON lines file (or - for stdin). "
+        "Columns: name, description, status, author, performer, labels, "
+        "created_at. Statuses and labels are given by name, users by "
+        "username."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path")
+        parser.add_argument(
+            "--format", choices=sorted(READERS),
+            help="Guessed from the file extension by default.",
+        )
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument(
+            "--no-create", action="store_true",
+            help="Skip rows referencing unknown statuses, labels or users "
+                 "instead of creating them.",
+        )
+        parser.add_argument(
+            "--author",
+            help="Username of the author of rows without one.",
+        )
+        parser.add_argument(
+            "--defer-indexes", action="store_true",
+            help="Drop task indexes during the import, build them after.",
+        )
+        parser.add_argument("--database", default="default")
+
+    def handle(self, *args, **options):
+        path = options["path"]
+        file_format = options["format"] or Path(path).suffix.lstrip(".")
+        if file_format not in READERS:
+            raise CommandError("Use --format to choose csv or jsonl.")
+
+        importer = TaskImporter(
+            batch_size=options["batch_size"],
+            create_missing=not options["no_create"],
+            default_author=options["author"],
+            using=options["database"],
+            progress=self.progress,
+        )
+        file = sys.stdin if path == "-" \
+            else open(path, newline="", encoding="utf-8")
+        indexes = deferred_indexes(options["database"]) \
+            if options["defer_indexes"] else nullcontext()
+        with file, indexes:
+            result = importer.run(READERS[file_format](file))
+
+        self.stdout.write("")
+        for error in result.errors:
+            self.stderr.write(error)
+        for label, count in result.created.items():
+            self.stdout.write(f"Created {count} {label}")
+        self.stdout.write(self.style.SUCCESS(
+            f"Imported {result.imported} of {result.rows} rows, "
+            f"skipped {result.skipped}, in {result.elapsed:.1f}s "
+            f"({result.rows_per_second:.0f} rows/s)"
+        ))
+
+    def progress(self, result):
+        self.stdout.write(
+            f"  {result.rows} rows, {result.rows_per_second:.0f} rows/s",
+            ending="\r",
+        )
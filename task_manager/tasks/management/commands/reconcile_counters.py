@@ -0,0 +1,40 @@
+from django.core.management.base import BaseCommand
+from django.core.management.base import CommandError
+
+from task_manager.core.cache import bump_model_version
+from task_manager.tasks.counters import DAY_COUNTER
+from task_manager.tasks.counters import LABEL_COUNTER
+from task_manager.tasks.counters import reconcile_counters
+from task_manager.tasks.counters import TASK_COUNTERS
+
+
+class Command(BaseCommand):
+    help = (
+        "Recount tasks of statuses, labels, users and days and fix "
+        "counters which differ. May be scheduled to refresh them."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--check", action="store_true",
+            help="Only report wrong counters, exit with an error if any.",
+        )
+        parser.add_argument("--database", default="default")
+
+    def handle(self, *args, **options):
+        wrong = reconcile_counters(
+            using=options["database"], fix=not options["check"]
+        )
+        for counter, count in wrong.items():
+            self.stdout.write(f"{counter}: {count} wrong")
+        if not any(wrong.values()):
+            self.stdout.write(self.style.SUCCESS("All counters are right."))
+        elif options["check"]:
+            raise CommandError("Some counters are wrong.")
+        else:
+            # Update queries send no signals
+            for _key, model, _counter in (
+                *TASK_COUNTERS, LABEL_COUNTER, DAY_COUNTER,
+            ):
+                bump_model_version(model)
+            self.stdout.write(self.style.SUCCESS("Counters are fixed."))
@@ -0,0 +1,81 @@
+# Generated by Django 5.0.1 on 2026-10-18 18:38
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations
+from django.db import models
+
+
+def remove_duplicate_nodes(apps, schema_editor):
+    """Keep the first node of every (label, task) pair."""
+    TaskAndLabelNode = apps.get_model('tasks', 'TaskAndLabelNode')
+    nodes = TaskAndLabelNode.objects.using(schema_editor.connection.alias)
+    first_ids = nodes.values('label', 'task').annotate(
+        first_id=models.Min('id'),
+    ).values('first_id')
+    nodes.exclude(id__in=first_ids).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('labels', '0001_initial'),
+        ('statuses', '0001_initial'),
+        ('tasks', '0004_alter_task_performer'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='task',
+            name='author',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.PROTECT, related_name='author', to=settings.AUTH_USER_MODEL, verbose_name='Author'),
+        ),
+        migrations.AlterField(
+            model_name='task',
+            name='performer',
+            field=models.ForeignKey(db_index=False, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='performer', to=settings.AUTH_USER_MODEL, verbose_name='Performer'),
+        ),
+        migrations.AlterField(
+            model_name='task',
+            name='status',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.PROTECT, to='statuses.status', verbose_name='Status'),
+        ),
+        migrations.AlterField(
+            model_name='taskandlabelnode',
+            name='label',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.PROTECT, to='labels.label'),
+        ),
+        migrations.AlterField(
+            model_name='taskandlabelnode',
+            name='task',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, to='tasks.task'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['created_at', 'id'], name='task_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['status', 'created_at', 'id'], name='task_status_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['performer', 'created_at', 'id'], name='task_performer_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['author', 'created_at', 'id'], name='task_author_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='taskandlabelnode',
+            index=models.Index(fields=['task', 'label'], name='task_label_idx'),
+        ),
+        migrations.RunPython(
+            remove_duplicate_nodes,
+            migrations.RunPython.noop,
+        ),
+        migrations.AddConstraint(
+            model_name='taskandlabelnode',
+            constraint=models.UniqueConstraint(fields=('label', 'task'), name='unique_label_task'),
+        ),
+    ]
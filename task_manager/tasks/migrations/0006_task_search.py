@@ -0,0 +1,23 @@
+from django.db import migrations
+
+from task_manager.tasks import search
+
+
+def create_search_index(apps, schema_editor):
+    """FTS5 table with triggers on SQLite, tsvector with GIN on PostgreSQL."""
+    search.install(schema_editor.connection)
+
+
+def drop_search_index(apps, schema_editor):
+    search.uninstall(schema_editor.connection)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0005_task_filter_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
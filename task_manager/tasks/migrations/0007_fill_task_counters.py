@@ -0,0 +1,43 @@
+from django.db import migrations
+from django.db.models import Count
+from django.db.models import IntegerField
+from django.db.models import OuterRef
+from django.db.models import Subquery
+from django.db.models.functions import Coalesce
+
+# (counted model, counter field, counting model, foreign key)
+COUNTERS = (
+    ("statuses.Status", "task_count", "tasks.Task", "status"),
+    ("users.User", "authored_task_count", "tasks.Task", "author"),
+    ("users.User", "performed_task_count", "tasks.Task", "performer"),
+    ("labels.Label", "task_count", "tasks.TaskAndLabelNode", "label"),
+)
+
+
+def fill_task_counters(apps, schema_editor):
+    """Count existing tasks, tasks.counters maintains them from now on."""
+    using = schema_editor.connection.alias
+    for model, counter, source, key in COUNTERS:
+        rows = apps.get_model(source).objects.using(using) \
+            .filter(**{key: OuterRef("pk")}) \
+            .order_by().values(key).annotate(count=Count("pk"))
+        apps.get_model(model).objects.using(using).update(**{
+            counter: Coalesce(
+                Subquery(rows.values("count"), output_field=IntegerField()),
+                0,
+            ),
+        })
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('labels', '0003_label_task_count'),
+        ('statuses', '0002_status_task_count'),
+        ('tasks', '0006_task_search'),
+        ('users', '0003_user_task_counts'),
+    ]
+
+    operations = [
+        migrations.RunPython(fill_task_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 5.0.1 on 2026-10-18 19:19
+from django.db import migrations
+from django.db import models
+from django.db.models import Count
+from django.db.models.functions import TruncDate
+
+
+def fill_daily_task_summary(apps, schema_editor):
+    """Count existing tasks, tasks.counters maintains the rows from now on."""
+    using = schema_editor.connection.alias
+    Task = apps.get_model("tasks", "Task")
+    DailyTaskSummary = apps.get_model("tasks", "DailyTaskSummary")
+    days = Task.objects.using(using).order_by() \
+        .values(day=TruncDate("created_at")).annotate(count=Count("pk"))
+    DailyTaskSummary.objects.using(using).bulk_create(
+        [DailyTaskSummary(day=row["day"], task_count=row["count"])
+         for row in days],
+        batch_size=500,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0007_fill_task_counters'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DailyTaskSummary',
+            fields=[
+                ('day', models.DateField(primary_key=True, serialize=False, verbose_name='Day')),
+                ('task_count', models.IntegerField(default=0, verbose_name='Tasks')),
+            ],
+        ),
+        migrations.RunPython(
+            fill_daily_task_summary, migrations.RunPython.noop
+        ),
+    ]
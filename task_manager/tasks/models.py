@@ -1,15 +1,34 @@
+from contextlib import contextmanager
+
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 
 from task_manager.labels.models import Label
 from task_manager.statuses.models import Status
+from task_manager.tasks.search import search as full_text_search
 from task_manager.users.models import User
 
 
+class TaskQuerySet(models.QuerySet):
+    """Task queryset with shortcuts for pages showing related objects."""
+
+    def with_related(self):
+        """Load related objects with a constant number of queries."""
+        return self.select_related(
+            "status", "author", "performer"
+        ).prefetch_related(
+            models.Prefetch("labels", queryset=Label.objects.order_by("name"))
+        )
+
+    def search(self, text: str):
+        """Full-text search ordered by relevance, see tasks.search."""
+        return full_text_search(self, text)
+
+
 class Task(models.Model):
     """Model of task in project."""
 
-    objects = models.Manager()
+    objects = TaskQuerySet.as_manager()
 
     name = models.CharField(
         max_length=255,
@@ -24,15 +43,18 @@ class Task(models.Model):
         verbose_name=_("Description"),
     )
 
+    # Foreign keys are indexed by composite indexes from Meta
     status = models.ForeignKey(
         to=Status,
         on_delete=models.PROTECT,
+        db_index=False,
         verbose_name=_("Status"),
     )
 
     author = models.ForeignKey(
         to=User,
         on_delete=models.PROTECT,
+        db_index=False,
         verbose_name=_("Author"),
         related_name="author",
     )
@@ -41,6 +63,7 @@ class Task(models.Model):
         to=User,
         on_delete=models.PROTECT,
         null=True,
+        db_index=False,
         verbose_name=_("Performer"),
         related_name="performer",
     )
@@ -61,8 +84,74 @@ class Task(models.Model):
     def __str__(self):
         return self.name
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        task = super().from_db(db, field_names, values)
+        # Saved values, tasks.counters compares new values with them
+        task._loaded_values = dict(zip(field_names, values))
+        return task
+
+    class Meta:
+        # Every TaskFilter combination is read in (created_at, id) order
+        indexes = [
+            models.Index(
+                fields=["created_at", "id"],
+                name="task_created_idx",
+            ),
+            models.Index(
+                fields=["status", "created_at", "id"],
+                name="task_status_created_idx",
+            ),
+            models.Index(
+                fields=["performer", "created_at", "id"],
+                name="task_performer_created_idx",
+            ),
+            models.Index(
+                fields=["author", "created_at", "id"],
+                name="task_author_created_idx",
+            ),
+        ]
+
 
 class TaskAndLabelNode(models.Model):
     """Model relate two models for m2m field deletion protect."""
-    task = models.ForeignKey(Task, on_delete=models.CASCADE)
-    label = models.ForeignKey(Label, on_delete=models.PROTECT)
+    task = models.ForeignKey(Task, on_delete=models.CASCADE, db_index=False)
+    label = models.ForeignKey(Label, on_delete=models.PROTECT, db_index=False)
+
+    class Meta:
+        # (label, task) serves the labels filter, (task, label) serves
+        # prefetching labels of tasks. Both cover the node completely.
+        constraints = [
+            models.UniqueConstraint(
+                fields=["label", "task"],
+                name="unique_label_task",
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["task", "label"], name="task_label_idx"),
+        ]
+
+
+class DailyTaskSummary(models.Model):
+    """
+    Number of tasks by the day of their `created_at`, in the current
+    time zone. Maintained by tasks.counters like other task counters.
+    """
+    day = models.DateField(primary_key=True, verbose_name=_("Day"))
+    task_count = models.IntegerField(default=0, verbose_name=_("Tasks"))
+
+    objects = models.Manager()
+
+    def __str__(self):
+        return f"{self.day}: {self.task_count}"
+
+
+@contextmanager
+def explicit_created_at():
+    """Let bulk_create keep given creation dates despite auto_now."""
+    field = Task._meta.get_field("created_at")
+    field.auto_now = False
+    try:
+        yield
+    finally:
+        field.auto_now = True
@@ -0,0 +1,171 @@
+"""
+Full-text search over task name and description.
+
+SQLite: FTS5 external content table `tasks_task_fts`, kept in sync with
+`tasks_task` by triggers. PostgreSQL: generated `search_vector` column
+with a GIN index. Both are maintained by the database itself, so bulk
+queries are indexed too. Other databases fall back to icontains.
+"""
+import re
+
+from django.db import connections
+from django.db import DEFAULT_DB_ALIAS
+from django.db.models import BooleanField
+from django.db.models import FloatField
+from django.db.models import Q
+from django.db.models import Value
+from django.db.models.expressions import RawSQL
+
+FTS_TABLE = "tasks_task_fts"
+# Matches in the name weigh more than matches in the description
+NAME_WEIGHT = 10.0
+DESCRIPTION_WEIGHT = 1.0
+
+SQLITE_TRIGGERS = {
+    "tasks_task_fts_insert": f"""
+        CREATE TRIGGER IF NOT EXISTS tasks_task_fts_insert
+        AFTER INSERT ON tasks_task BEGIN
+            INSERT INTO {FTS_TABLE}(rowid, name, description)
+            VALUES (new.id, new.name, new.description);
+        END
+    """,
+    "tasks_task_fts_delete": f"""
+        CREATE TRIGGER IF NOT EXISTS tasks_task_fts_delete
+        AFTER DELETE ON tasks_task BEGIN
+            INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, name, description)
+            VALUES ('delete', old.id, old.name, old.description);
+        END
+    """,
+    "tasks_task_fts_update": f"""
+        CREATE TRIGGER IF NOT EXISTS tasks_task_fts_update
+        AFTER UPDATE OF name, description ON tasks_task BEGIN
+            INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, name, description)
+            VALUES ('delete', old.id, old.name, old.description);
+            INSERT INTO {FTS_TABLE}(rowid, name, description)
+            VALUES (new.id, new.name, new.description);
+        END
+    """,
+}
+
+SQLITE_SCHEMA = [
+    f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5(
+        name, description,
+        content='tasks_task', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    *SQLITE_TRIGGERS.values(),
+    f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')",
+]
+
+SQLITE_DROP = [
+    *(f"DROP TRIGGER IF EXISTS {name}" for name in SQLITE_TRIGGERS),
+    f"DROP TABLE IF EXISTS {FTS_TABLE}",
+]
+
+# 'simple' configuration: texts are in Russian and English
+POSTGRES_SCHEMA = [
+    """
+    ALTER TABLE tasks_task ADD COLUMN search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('simple', coalesce(name, '')), 'A')
+        || setweight(to_tsvector('simple', coalesce(description, '')), 'B')
+    ) STORED
+    """,
+    "CREATE INDEX task_search_idx ON tasks_task USING GIN (search_vector)",
+]
+
+POSTGRES_DROP = [
+    "DROP INDEX IF EXISTS task_search_idx",
+    "ALTER TABLE tasks_task DROP COLUMN IF EXISTS search_vector",
+]
+
+
+def install(connection) -> None:
+    statements = {"sqlite": SQLITE_SCHEMA, "postgresql": POSTGRES_SCHEMA}
+    with connection.cursor() as cursor:
+        for sql in statements.get(connection.vendor, ()):
+            cursor.execute(sql)
+
+
+def uninstall(connection) -> None:
+    statements = {"sqlite": SQLITE_DROP, "postgresql": POSTGRES_DROP}
+    with connection.cursor() as cursor:
+        for sql in statements.get(connection.vendor, ()):
+            cursor.execute(sql)
+
+
+def repair_sqlite_triggers(connection) -> None:
+    """
+    SQLite drops triggers when a migration remakes tasks_task,
+    create them again and reindex rows changed meanwhile.
+    """
+    if connection.vendor != "sqlite":
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'trigger' "
+            "AND tbl_name = 'tasks_task'"
+        )
+        existing = {row[0] for row in cursor.fetchall()}
+        cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = %s", [FTS_TABLE]
+        )
+        if cursor.fetchone() is None or existing >= set(SQLITE_TRIGGERS):
+            return
+        for sql in SQLITE_TRIGGERS.values():
+            cursor.execute(sql)
+        cursor.execute(
+            f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')"
+        )
+
+
+def repair_search_index(sender, using=DEFAULT_DB_ALIAS, **kwargs):
+    """post_migrate receiver."""
+    repair_sqlite_triggers(connections[using])
+
+
+def to_fts5_query(text: str) -> str:
+    """All words of the text as prefixes, FTS5 operators are not allowed."""
+    return " ".join(f'"{word}"*' for word in re.findall(r"\w+", text))
+
+
+def search(queryset, text: str):
+    """Tasks matching the text, annotated with `search_rank` (higher first)."""
+    vendor = connections[queryset.db].vendor
+    if vendor == "sqlite":
+        query = to_fts5_query(text)
+        if not query:
+            return queryset.none()
+        # Joined, not a subquery: bm25() needs the row of the MATCH query
+        rank = RawSQL(
+            f"-bm25({FTS_TABLE}, %s, %s)",
+            [NAME_WEIGHT, DESCRIPTION_WEIGHT],
+            output_field=FloatField(),
+        )
+        return queryset.extra(
+            tables=[FTS_TABLE],
+            where=[
+                f"{FTS_TABLE}.rowid = tasks_task.id",
+                f"{FTS_TABLE} MATCH %s",
+            ],
+            params=[query],
+        ).annotate(search_rank=rank).order_by("-search_rank")
+    if vendor == "postgresql":
+        tsquery = "websearch_to_tsquery('simple', %s)"
+        matches = RawSQL(
+            f"tasks_task.search_vector @@ {tsquery}", [text],
+            output_field=BooleanField(),
+        )
+        rank = RawSQL(
+            f"ts_rank(tasks_task.search_vector, {tsquery})", [text],
+            output_field=FloatField(),
+        )
+        return queryset.filter(matches) \
+            .annotate(search_rank=rank).order_by("-search_rank")
+    return queryset.filter(
+        Q(name__icontains=text) | Q(description__icontains=text)
+    ).annotate(
+        search_rank=Value(0.0, output_field=FloatField())
+    ).order_by("-search_rank")
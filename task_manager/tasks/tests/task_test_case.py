@@ -1,18 +1,19 @@
 from http import HTTPStatus
 
-from django.test import TestCase
 from django.urls import reverse_lazy
 
+from task_manager.core.tests.core_test_case import CacheTestCase
 from task_manager.tasks.models import Task
 from task_manager.users.models import User
 
 
-class TaskTestCase(TestCase):
+class TaskTestCase(CacheTestCase):
     """Task testcase object with options."""
     fixtures = ["test_users", "test_status", "test_labels", "test_tasks"]
     status_ok = HTTPStatus.OK
 
     def setUp(self) -> None:
+        super().setUp()
         self.test_task_1 = Task.objects.get(pk=1)
         self.test_task_2 = Task.objects.get(pk=2)
         self.tasks = Task.objects.all()
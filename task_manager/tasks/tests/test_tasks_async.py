@@ -0,0 +1,122 @@
+from http import HTTPStatus
+
+from django.test import override_settings
+from django.urls import include
+from django.urls import path
+from django.urls import reverse_lazy
+
+from task_manager.labels.views import AsyncLabelLookupView
+from task_manager.tasks.models import Task
+from task_manager.tasks.tests.task_test_case import TaskTestCase
+from task_manager.tasks.views import AsyncTaskDetailView
+from task_manager.tasks.views import AsyncTaskIndexView
+from task_manager.users.views import AsyncUserLookupView
+
+# Routes of ASYNC_VIEWS=1, resolved before the sync ones
+urlpatterns = [
+    path("tasks/", AsyncTaskIndexView.as_view(), name="list_task"),
+    path("tasks/<int:pk>/", AsyncTaskDetailView.as_view(),
+         name="detail_task"),
+    path("users/lookup/", AsyncUserLookupView.as_view(), name="lookup_user"),
+    path("labels/lookup/", AsyncLabelLookupView.as_view(),
+         name="lookup_label"),
+    path("", include("task_manager.core.urls")),
+]
+
+
+@override_settings(ROOT_URLCONF=__name__)
+class TestTasksAsyncViews(TaskTestCase):
+    """Async views render the same pages as the sync ones."""
+
+    url = reverse_lazy("list_task")
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.async_client.force_login(self.test_user_1)
+
+    def test_views_are_async(self) -> None:
+        for view in (AsyncTaskIndexView, AsyncTaskDetailView,
+                     AsyncUserLookupView, AsyncLabelLookupView):
+            with self.subTest(view=view.__name__):
+                self.assertTrue(view.view_is_async)
+
+    async def test_list_shows_tasks(self) -> None:
+        response = await self.async_client.get(self.url)
+        self.assertEqual(response.status_code, self.status_ok)
+        self.assertContains(response, self.test_task_1.name)
+        self.assertContains(response, self.test_task_2.name)
+
+    async def test_list_is_filtered(self) -> None:
+        response = await self.async_client.get(
+            self.url, {"status": self.test_task_1.status_id}
+        )
+        expected = [
+            task async for task in Task.objects.filter(
+                status_id=self.test_task_1.status_id
+            )
+        ]
+        self.assertEqual(
+            {task.pk for task in response.context["object_list"]},
+            {task.pk for task in expected},
+        )
+
+    async def test_list_pages_follow_cursor(self) -> None:
+        first = await self.async_client.get(self.url, {"page_size": 1})
+        self.assertEqual(len(first.context["object_list"]), 1)
+        second = await self.async_client.get(
+            f"{self.url}?{first.context['next_page_query']}"
+        )
+        self.assertNotEqual(
+            first.context["object_list"][0].pk,
+            second.context["object_list"][0].pk,
+        )
+
+    async def test_invalid_cursor_is_not_found(self) -> None:
+        response = await self.async_client.get(self.url, {"cursor": "x"})
+        self.assertEqual(response.status_code, HTTPStatus.NOT_FOUND)
+
+    async def test_unchanged_list_is_not_modified(self) -> None:
+        # The first response sets the CSRF cookie, the ETag depends on it
+        await self.async_client.get(self.url)
+        response = await self.async_client.get(self.url)
+        cached = await self.async_client.get(
+            self.url, headers={"if-none-match": response["ETag"]}
+        )
+        self.assertEqual(cached.status_code, HTTPStatus.NOT_MODIFIED)
+
+    async def test_login_is_required(self) -> None:
+        await self.async_client.alogout()
+        response = await self.async_client.get(self.url)
+        self.assertEqual(response.status_code, HTTPStatus.FOUND)
+        self.assertTrue(
+            response["Location"].startswith(str(reverse_lazy("login")))
+        )
+
+    async def test_detail_shows_task(self) -> None:
+        response = await self.async_client.get(
+            reverse_lazy("detail_task", kwargs={"pk": self.test_task_1.pk})
+        )
+        self.assertEqual(response.status_code, self.status_ok)
+        self.assertContains(response, self.test_task_1.name)
+        self.assertEqual(response.context["task"], self.test_task_1)
+
+    async def test_missing_task_is_not_found(self) -> None:
+        response = await self.async_client.get(
+            reverse_lazy("detail_task", kwargs={"pk": 10 ** 6})
+        )
+        self.assertEqual(response.status_code, HTTPStatus.NOT_FOUND)
+
+    async def test_lookup_searches_prefix(self) -> None:
+        response = await self.async_client.get(
+            reverse_lazy("lookup_user"),
+            {"q": self.test_user_1.first_name[:3].upper()},
+        )
+        self.assertIn(
+            {"id": self.test_user_1.pk, "text": str(self.test_user_1)},
+            response.json()["results"],
+        )
+
+    async def test_lookup_requires_authentication(self) -> None:
+        await self.async_client.alogout()
+        response = await self.async_client.get(reverse_lazy("lookup_label"))
+        self.assertEqual(response.status_code, HTTPStatus.FORBIDDEN)
@@ -0,0 +1,167 @@
+import json
+from http import HTTPStatus
+
+from django.contrib.admin import helpers
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse_lazy
+
+from task_manager.core.cache import get_model_version
+from task_manager.labels.models import Label
+from task_manager.statuses.models import Status
+from task_manager.tasks.models import Task
+from task_manager.tasks.models import TaskAndLabelNode
+from task_manager.tasks.tests.task_test_case import TaskTestCase
+from task_manager.users.models import User
+
+
+class TestTasksBulk(TaskTestCase):
+    """Bulk endpoint applies all items in one transaction or none."""
+
+    url = reverse_lazy("api_tasks_bulk")
+
+    def post(self, data: dict):
+        return self.client.post(
+            self.url, json.dumps(data), content_type="application/json"
+        )
+
+    def create_items(self, count: int, prefix: str = "Bulk") -> list[dict]:
+        labels = list(Label.objects.values_list("pk", flat=True))
+        return [
+            {
+                "name": f"{prefix}{number}",
+                "status": self.test_task_1.status_id,
+                "performer": self.test_user_2.pk,
+                "labels": labels,
+            }
+            for number in range(count)
+        ]
+
+    def test_create_inserts_tasks_and_label_nodes(self) -> None:
+        version = get_model_version(Task)
+        response = self.post({"action": "create",
+                              "items": self.create_items(5)})
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        ids = response.json()["ids"]
+        tasks = Task.objects.filter(pk__in=ids)
+        self.assertEqual(tasks.count(), 5)
+        self.assertTrue(all(
+            task.author_id == self.test_user_1.pk for task in tasks
+        ))
+        self.assertEqual(
+            TaskAndLabelNode.objects.filter(task__in=ids).count(),
+            5 * Label.objects.count(),
+        )
+        self.assertNotEqual(get_model_version(Task), version)
+
+    def test_create_queries_do_not_grow_with_items(self) -> None:
+        def count_queries(count: int, prefix: str) -> int:
+            with CaptureQueriesContext(connection) as queries:
+                response = self.post({
+                    "action": "create",
+                    "items": self.create_items(count, prefix),
+                })
+            self.assertEqual(response.status_code, HTTPStatus.OK)
+            return len(queries)
+
+        self.assertEqual(count_queries(2, "Few"), count_queries(40, "Many"))
+
+    def test_invalid_item_cancels_whole_request(self) -> None:
+        items = self.create_items(3)
+        items[1]["status"] = 0
+        items[2]["name"] = self.test_task_1.name
+        response = self.post({"action": "create", "items": items})
+        self.assertEqual(response.status_code, HTTPStatus.BAD_REQUEST)
+        errors = {
+            error["index"]: error["errors"]
+            for error in response.json()["errors"]
+        }
+        self.assertEqual(set(errors), {1, 2})
+        self.assertIn("status", errors[1])
+        self.assertIn("name", errors[2])
+        self.assertFalse(Task.objects.filter(name="Bulk0").exists())
+
+    def test_update_changes_given_fields_and_labels(self) -> None:
+        label = Label.objects.first()
+        self.test_task_1.labels.set(Label.objects.all())
+        response = self.post({"action": "update", "items": [
+            {"id": self.test_task_1.pk, "labels": [label.pk]},
+            {"id": self.test_task_2.pk, "description": "Changed"},
+        ]})
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertEqual(list(self.test_task_1.labels.all()), [label])
+        task = Task.objects.get(pk=self.test_task_2.pk)
+        self.assertEqual(task.description, "Changed")
+        self.assertEqual(task.name, self.test_task_2.name)
+
+    def test_set_status_moves_all_tasks(self) -> None:
+        status = Status.objects.create(name="Bulk status")
+        response = self.post({
+            "action": "set_status",
+            "ids": [self.test_task_1.pk, self.test_task_2.pk],
+            "status": status.pk,
+        })
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertEqual(Task.objects.filter(status=status).count(), 2)
+
+    def test_bulk_changes_are_shown_by_cached_rows(self) -> None:
+        status = Status.objects.create(name="Bulk status")
+        self.client.get(reverse_lazy("list_task"))
+        self.post({
+            "action": "set_status",
+            "ids": [self.test_task_1.pk],
+            "status": status.pk,
+        })
+        self.post({
+            "action": "update",
+            "items": [{"id": self.test_task_2.pk, "name": "Bulk renamed"}],
+        })
+        response = self.client.get(reverse_lazy("list_task"))
+        self.assertContains(response, f"<td>{status.name}</td>")
+        self.assertContains(response, "<td>Bulk renamed</td>")
+
+    def test_delete_applies_author_rule_to_whole_set(self) -> None:
+        own, foreign = self.test_task_2, self.test_task_1
+        response = self.post({
+            "action": "delete", "ids": [own.pk, foreign.pk],
+        })
+        self.assertEqual(response.status_code, HTTPStatus.BAD_REQUEST)
+        self.assertEqual(response.json()["errors"][0]["index"], 1)
+        self.assertEqual(Task.objects.filter(pk=own.pk).count(), 1)
+
+        response = self.post({"action": "delete", "ids": [own.pk]})
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertFalse(Task.objects.filter(pk=own.pk).exists())
+
+    def test_unknown_action_is_bad_request(self) -> None:
+        response = self.post({"action": "rename", "ids": [1]})
+        self.assertEqual(response.status_code, HTTPStatus.BAD_REQUEST)
+
+
+class TestTasksAdminBulk(TaskTestCase):
+    """Admin action changes status of selected tasks."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        admin = User.objects.create_superuser("admin", password="admin")
+        self.client.force_login(admin)
+        self.url = reverse_lazy("admin:tasks_task_changelist")
+        self.data = {
+            "action": "set_status",
+            helpers.ACTION_CHECKBOX_NAME: [
+                self.test_task_1.pk, self.test_task_2.pk
+            ],
+        }
+
+    def test_action_asks_for_status(self) -> None:
+        response = self.client.post(self.url, self.data)
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertTemplateUsed(response, "admin/tasks/set_status.html")
+
+    def test_action_changes_status(self) -> None:
+        status = Status.objects.create(name="Admin status")
+        response = self.client.post(
+            self.url, {**self.data, "apply": "1", "status": status.pk}
+        )
+        self.assertRedirects(response, self.url)
+        self.assertEqual(Task.objects.filter(status=status).count(), 2)
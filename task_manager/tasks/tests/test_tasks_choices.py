@@ -0,0 +1,111 @@
+from tempfile import TemporaryDirectory
+
+from django.core.cache import caches
+from django.core.cache.backends.filebased import FileBasedCache
+from django.test import override_settings
+from django.urls import reverse_lazy
+
+from task_manager.labels.models import Label
+from task_manager.statuses.models import Status
+from task_manager.tasks.filters import TaskFilter
+from task_manager.tasks.forms import TaskForm
+from task_manager.tasks.tests.task_test_case import TaskTestCase
+from task_manager.users.models import User
+
+
+class CachedChoicesTests:
+    """Dropdowns of TaskForm and TaskFilter are rendered from cache."""
+
+    @staticmethod
+    def render_selects() -> str:
+        """Render status selects and labels of every cached choice."""
+        form = TaskForm()
+        filter_form = TaskFilter(data={}, queryset=None).form
+        rendered = [str(form["status"]), str(filter_form["status"])]
+        for field in (
+            form.fields["performer"], form.fields["labels"],
+            filter_form.fields["performer"], filter_form.fields["labels"],
+        ):
+            rendered.extend(str(label) for _, label in field.choices)
+        return "".join(rendered)
+
+    def test_choices_are_rendered_without_queries(self) -> None:
+        first = self.render_selects()
+        with self.assertNumQueries(0):
+            second = self.render_selects()
+        self.assertEqual(first, second)
+        self.assertIn(str(self.test_user_1), second)
+
+    def test_choices_are_invalidated_on_save(self) -> None:
+        self.render_selects()
+        Status.objects.create(name="FreshStatus")
+        label = Label.objects.create(name="FreshLabel")
+        self.test_user_2.first_name = "Renamed"
+        self.test_user_2.save()
+        rendered = self.render_selects()
+        self.assertIn("FreshStatus", rendered)
+        self.assertIn("FreshLabel", rendered)
+        self.assertIn("Renamed", rendered)
+
+        label.delete()
+        self.assertNotIn("FreshLabel", self.render_selects())
+
+    def test_login_does_not_invalidate_choices(self) -> None:
+        self.render_selects()
+        User.objects.get(pk=self.test_user_2.pk).save(
+            update_fields=["last_login"]
+        )
+        with self.assertNumQueries(0):
+            self.render_selects()
+
+
+class TestLocmemCachedChoices(CachedChoicesTests, TaskTestCase):
+    pass
+
+
+class TestFileCachedChoices(CachedChoicesTests, TaskTestCase):
+
+    def setUp(self) -> None:
+        directory = TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        settings_override = override_settings(CACHES={
+            "default": {
+                "BACKEND": "django.core.cache.backends.filebased."
+                           "FileBasedCache",
+                "LOCATION": directory.name,
+            },
+        })
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        super().setUp()
+
+    def test_file_backend_is_used(self) -> None:
+        self.assertIsInstance(caches["default"], FileBasedCache)
+
+
+class TestLookupWidgets(TaskTestCase):
+    """Performer and labels selects render only the selected options."""
+
+    def test_create_form_has_no_user_options(self) -> None:
+        response = self.client.get(reverse_lazy("create_task"))
+        self.assertContains(response, reverse_lazy("lookup_user"))
+        self.assertContains(response, reverse_lazy("lookup_label"))
+        self.assertNotContains(response, str(self.test_user_2))
+
+    def test_update_form_renders_selected_options(self) -> None:
+        self.test_task_1.labels.set([1])
+        response = self.client.get(
+            reverse_lazy("update_task", kwargs={"pk": self.test_task_1.pk})
+        )
+        self.assertContains(response, str(self.test_task_1.performer))
+        self.assertContains(response, "TestLabel1")
+        self.assertNotContains(response, "TestLabel2")
+
+    def test_label_lookup_matches_non_ascii_names(self) -> None:
+        label = Label.objects.create(name="Срочно")
+        response = self.client.get(
+            reverse_lazy("lookup_label"), {"q": "СРОЧ"}
+        )
+        self.assertEqual(response.json()["results"], [
+            {"id": label.pk, "text": "Срочно"},
+        ])
@@ -0,0 +1,57 @@
+from http import HTTPStatus
+
+from django.urls import reverse_lazy
+
+from task_manager.core.permission_mixins import TaskDeletionTestMixin
+from task_manager.tasks.models import Task
+from task_manager.tasks.tests.task_test_case import TaskTestCase
+
+
+class TestTasksConditionalGet(TaskTestCase):
+    """Unchanged pages are answered with 304 Not Modified."""
+
+    url = reverse_lazy("list_task")
+
+    def test_unchanged_list_is_not_modified(self) -> None:
+        response = self.client.get(self.url)
+        self.assertTrue(response.has_header("ETag"))
+        self.assertTrue(response.has_header("Last-Modified"))
+        cached = self.client.get(
+            self.url, HTTP_IF_NONE_MATCH=response["ETag"]
+        )
+        self.assertEqual(cached.status_code, HTTPStatus.NOT_MODIFIED)
+        self.assertEqual(cached.content, b"")
+
+    def test_changed_list_is_rendered(self) -> None:
+        etag = self.client.get(self.url)["ETag"]
+        Task.objects.create(
+            name="Fresh task",
+            status=self.test_task_1.status,
+            author=self.test_user_1,
+        )
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, self.status_ok)
+        self.assertContains(response, "Fresh task")
+
+    def test_etag_depends_on_filter_parameters(self) -> None:
+        etag = self.client.get(self.url)["ETag"]
+        response = self.client.get(
+            self.url, {"own_task": "on"}, HTTP_IF_NONE_MATCH=etag
+        )
+        self.assertEqual(response.status_code, self.status_ok)
+
+    def test_etag_depends_on_user(self) -> None:
+        etag = self.client.get(self.url)["ETag"]
+        self.client.force_login(self.test_user_2)
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, self.status_ok)
+
+    def test_pending_messages_are_rendered(self) -> None:
+        etag = self.client.get(self.url)["ETag"]
+        # Denied deletion redirects to the list with an error message
+        self.client.get(
+            reverse_lazy("delete_task", kwargs={"pk": self.test_task_1.pk})
+        )
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, self.status_ok)
+        self.assertContains(response, TaskDeletionTestMixin.protect_message)
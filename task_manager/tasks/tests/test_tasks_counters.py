@@ -0,0 +1,128 @@
+import json
+from io import StringIO
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.urls import reverse_lazy
+
+from task_manager.labels.models import Label
+from task_manager.statuses.models import Status
+from task_manager.tasks.counters import reconcile_counters
+from task_manager.tasks.importer import TaskImporter
+from task_manager.tasks.models import Task
+from task_manager.tasks.tests.task_test_case import TaskTestCase
+
+
+class TestTasksCounters(TaskTestCase):
+    """Task counters follow every way of changing tasks."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        # Fixtures are written without counters
+        reconcile_counters()
+        self.labels = list(Label.objects.values_list("pk", flat=True))
+
+    def assertCountersRight(self) -> None:
+        wrong = reconcile_counters(fix=False)
+        self.assertEqual(
+            {name: count for name, count in wrong.items() if count}, {}
+        )
+
+    def test_task_views_keep_counters(self) -> None:
+        self.client.post(reverse_lazy("create_task"), {
+            "name": "Counted",
+            "status": self.test_task_1.status_id,
+            "performer": self.test_user_2.pk,
+            "labels": self.labels,
+        })
+        task = Task.objects.get(name="Counted")
+        self.assertEqual(Label.objects.get(pk=self.labels[0]).task_count, 1)
+        self.assertCountersRight()
+
+        self.client.post(reverse_lazy("update_task", args=[task.pk]), {
+            "name": "Counted",
+            "status": self.test_task_2.status_id,
+            "performer": self.test_user_1.pk,
+            "labels": self.labels[:1],
+        })
+        self.assertCountersRight()
+
+        self.client.post(reverse_lazy("delete_task", args=[task.pk]))
+        self.assertFalse(Task.objects.filter(pk=task.pk).exists())
+        self.assertCountersRight()
+
+    def test_label_manager_keeps_counters(self) -> None:
+        self.test_task_1.labels.add(*self.labels)
+        self.test_task_1.labels.remove(self.labels[0])
+        label = Label.objects.get(pk=self.labels[1])
+        label.labels.add(self.test_task_2)
+        self.assertEqual(Label.objects.get(pk=label.pk).task_count, 2)
+        self.assertCountersRight()
+        self.test_task_1.labels.clear()
+        self.assertCountersRight()
+
+    def test_bulk_actions_keep_counters(self) -> None:
+        url = reverse_lazy("api_tasks_bulk")
+
+        def post(data: dict) -> dict:
+            response = self.client.post(
+                url, json.dumps(data), content_type="application/json"
+            )
+            self.assertEqual(response.status_code, self.status_ok)
+            self.assertCountersRight()
+            return response.json()
+
+        ids = post({"action": "create", "items": [
+            {
+                "name": f"Bulk{number}",
+                "status": self.test_task_1.status_id,
+                "performer": self.test_user_2.pk,
+                "labels": self.labels[:number % 3],
+            }
+            for number in range(6)
+        ]})["ids"]
+        post({"action": "update", "items": [
+            {"id": ids[0], "performer": None, "labels": self.labels},
+            {"id": ids[1], "status": self.test_task_2.status_id},
+            {"id": ids[2], "description": "Only text"},
+        ]})
+        post({"action": "set_status", "ids": ids[3:],
+              "status": self.test_task_2.status_id})
+        post({"action": "delete", "ids": ids[::2]})
+
+    def test_import_keeps_counters(self) -> None:
+        rows = [
+            {
+                "name": f"Imported{number}",
+                "status": "Imported status",
+                "author": self.test_user_1.username,
+                "performer": self.test_user_2.username,
+                "labels": ["imported", "TestLabel1"],
+            }
+            for number in range(3)
+        ]
+        TaskImporter(batch_size=2).run(rows)
+        self.assertEqual(
+            Status.objects.get(name="Imported status").task_count, 3
+        )
+        self.assertCountersRight()
+
+    def test_reconcile_command_fixes_counters(self) -> None:
+        Status.objects.update(task_count=7)
+        with self.assertRaises(CommandError):
+            call_command("reconcile_counters", "--check", stdout=StringIO())
+        out = StringIO()
+        call_command("reconcile_counters", stdout=out)
+        self.assertIn("statuses.Status.task_count: 2 wrong", out.getvalue())
+        self.assertCountersRight()
+
+    def test_delete_link_is_hidden_for_used_status(self) -> None:
+        unused = Status.objects.create(name="Unused")
+        response = self.client.get(reverse_lazy("list_status"))
+        self.assertContains(
+            response, reverse_lazy("delete_status", args=[unused.pk])
+        )
+        self.assertNotContains(
+            response,
+            reverse_lazy("delete_status", args=[self.test_task_1.status_id]),
+        )
@@ -0,0 +1,83 @@
+import csv
+import json
+from http import HTTPStatus
+from io import StringIO
+from unittest import mock
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse_lazy
+
+from task_manager.labels.models import Label
+from task_manager.tasks.models import Task
+from task_manager.tasks.tests.task_test_case import TaskTestCase
+from task_manager.tasks.views import TaskExportView
+
+
+class TestTasksExport(TaskTestCase):
+    """Filtered tasks are streamed as CSV or JSON lines."""
+
+    url = reverse_lazy("export_task")
+
+    def export(self, params: dict = None) -> str:
+        response = self.client.get(self.url, params or {})
+        self.assertEqual(response.status_code, self.status_ok)
+        self.assertTrue(response.streaming)
+        return b"".join(response.streaming_content).decode()
+
+    def test_csv_contains_every_task_with_labels(self) -> None:
+        self.test_task_1.labels.set(Label.objects.all())
+        rows = list(csv.reader(StringIO(self.export())))
+        self.assertEqual(len(rows), Task.objects.count() + 1)
+        by_id = {row[0]: row for row in rows[1:]}
+        row = by_id[str(self.test_task_1.pk)]
+        self.assertEqual(row[1], self.test_task_1.name)
+        self.assertEqual(row[3], self.test_task_1.status.name)
+        self.assertEqual(row[6], ", ".join(
+            sorted(Label.objects.values_list("name", flat=True))
+        ))
+
+    def test_jsonl_follows_filter(self) -> None:
+        status = self.test_task_1.status_id
+        lines = self.export({"format": "jsonl", "status": status})
+        tasks = [json.loads(line) for line in lines.splitlines()]
+        self.assertEqual(
+            [task["id"] for task in tasks],
+            list(
+                Task.objects.filter(status=status)
+                .order_by("-created_at", "-pk").values_list("pk", flat=True)
+            ),
+        )
+        self.assertEqual(tasks[0]["labels"], sorted(
+            self.test_task_1.labels.values_list("name", flat=True)
+        ))
+
+    def test_chunks_cover_all_rows_once(self) -> None:
+        for number in range(5):
+            Task.objects.create(
+                name=f"Exported{number}",
+                status=self.test_task_1.status,
+                author=self.test_user_1,
+            )
+        with mock.patch.object(TaskExportView, "chunk_size", 2):
+            lines = self.export({"format": "jsonl", "ordering": "name"})
+        self.assertEqual(
+            [json.loads(line)["id"] for line in lines.splitlines()],
+            list(Task.objects.order_by("name", "pk")
+                 .values_list("pk", flat=True)),
+        )
+
+    def test_labels_do_not_add_queries(self) -> None:
+        def count_queries() -> int:
+            with CaptureQueriesContext(connection) as queries:
+                self.export()
+            return len(queries)
+
+        without_labels = count_queries()
+        for task in Task.objects.all():
+            task.labels.set(Label.objects.all())
+        self.assertEqual(count_queries(), without_labels)
+
+    def test_unknown_format_is_bad_request(self) -> None:
+        response = self.client.get(self.url, {"format": "xml"})
+        self.assertEqual(response.status_code, HTTPStatus.BAD_REQUEST)
@@ -0,0 +1,186 @@
+import json
+from io import StringIO
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from django.core.management import call_command
+from django.db import connection
+from django.test import TransactionTestCase
+
+from task_manager.core.cache import get_model_version
+from task_manager.labels.models import Label
+from task_manager.statuses.models import Status
+from task_manager.tasks.importer import read_csv
+from task_manager.tasks.importer import read_jsonl
+from task_manager.tasks.importer import TaskImporter
+from task_manager.tasks.models import Task
+from task_manager.tasks.tests.task_test_case import TaskTestCase
+from task_manager.users.models import User
+
+
+class TestImportTasks(TaskTestCase):
+    """import_tasks command writes rows in batches."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        directory = TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = Path(directory.name)
+
+    def import_file(self, name: str, content: str, *args) -> str:
+        path = self.directory / name
+        path.write_text(content, encoding="utf-8")
+        out = StringIO()
+        call_command(
+            "import_tasks", str(path), "--batch-size=2", *args,
+            stdout=out, stderr=StringIO(),
+        )
+        return out.getvalue()
+
+    def test_csv_creates_tasks_and_missing_references(self) -> None:
+        status = self.test_task_1.status.name
+        author = self.test_user_1.username
+        output = self.import_file("tasks.csv", (
+            "name,description,status,author,performer,labels\n"
+            f"Imported1,First,{status},{author},,\"bug, new label\"\n"
+            f"Imported2,,New status,{author},newcomer,\n"
+            f"Imported3,,{status},newcomer,{author},new label\n"
+        ))
+        self.assertIn("Imported 3 of 3 rows", output)
+        first = Task.objects.get(name="Imported1")
+        self.assertEqual(first.author, self.test_user_1)
+        self.assertEqual(
+            set(first.labels.values_list("name", flat=True)),
+            {"bug", "new label"},
+        )
+        self.assertEqual(Label.objects.filter(name="new label").count(), 1)
+        self.assertTrue(Status.objects.filter(name="New status").exists())
+        newcomer = User.objects.get(username="newcomer")
+        self.assertFalse(newcomer.has_usable_password())
+        self.assertEqual(
+            Task.objects.get(name="Imported3").author, newcomer
+        )
+
+    def test_existing_and_unknown_rows_are_skipped(self) -> None:
+        status = self.test_task_1.status.name
+        author = self.test_user_1.username
+        output = self.import_file("tasks.csv", (
+            "name,status,author\n"
+            f"{self.test_task_1.name},{status},{author}\n"
+            f"Imported,Unknown status,{author}\n"
+            f"Kept,{status},{author}\n"
+        ), "--no-create")
+        self.assertIn("Imported 1 of 3 rows, skipped 2", output)
+        self.assertTrue(Task.objects.filter(name="Kept").exists())
+        self.assertFalse(Status.objects.filter(name="Unknown status")
+                         .exists())
+
+    def test_jsonl_keeps_creation_dates(self) -> None:
+        rows = [
+            {
+                "name": f"Dated{number}",
+                "status": self.test_task_1.status.name,
+                "author": self.test_user_1.username,
+                "labels": ["imported"],
+                "created_at": f"2020-01-0{number + 1}T10:00:00+00:00",
+            }
+            for number in range(3)
+        ]
+        self.import_file(
+            "tasks.jsonl", "\n".join(json.dumps(row) for row in rows)
+        )
+        task = Task.objects.get(name="Dated0")
+        self.assertEqual(task.created_at.isoformat(),
+                         "2020-01-01T10:00:00+00:00")
+        self.assertEqual(Label.objects.get(name="imported").labels.count(), 3)
+
+    def test_invalid_jsonl_rows_are_reported(self) -> None:
+        valid = {
+            "status": self.test_task_1.status.name,
+            "author": self.test_user_1.username,
+        }
+        lines = [
+            json.dumps({"name": "Kept1", **valid}),
+            "{broken",
+            json.dumps(["not", "an", "object"]),
+            json.dumps({**valid, "name": 5}),
+            json.dumps({**valid, "name": "Labels", "labels": [1]}),
+            json.dumps({**valid, "name": "Labels", "labels": {"a": 1}}),
+            json.dumps({**valid, "name": "x" * 256}),
+            json.dumps({**valid, "name": "Label", "labels": ["x" * 256]}),
+            json.dumps({**valid, "name": "Date", "created_at": "2020-13-45"}),
+            json.dumps({"name": "Kept2", "labels": None, **valid}),
+        ]
+        result = TaskImporter(batch_size=4).run(
+            read_jsonl(StringIO("\n".join(lines)))
+        )
+        self.assertEqual((result.rows, result.imported), (10, 2))
+        self.assertEqual(result.errors, [
+            "row 2: invalid JSON: Expecting property name enclosed in "
+            "double quotes",
+            "row 3: row is not a JSON object",
+            "row 4: name is not a string",
+            "row 5: labels are not strings",
+            "row 6: labels are not a string or a list",
+            "row 7: name is longer than 255 characters",
+            "row 8: labels are longer than 255 characters",
+            "row 9: created_at is not a date and time",
+        ])
+        self.assertFalse(Task.objects.get(name="Kept2").labels.exists())
+
+    def test_invalid_csv_rows_are_reported(self) -> None:
+        status = self.test_task_1.status.name
+        author = self.test_user_1.username
+        result = TaskImporter().run(read_csv(StringIO(
+            "name,status,author\n"
+            f"Kept1,{status},{author}\n"
+            f"{'x' * 200000},{status},{author}\n"
+            f"Kept2,{status},{author}\n"
+        )))
+        self.assertEqual((result.rows, result.imported), (3, 2))
+        self.assertEqual(result.errors, [
+            "row 2: invalid CSV: field larger than field limit (131072)",
+        ])
+
+    def test_versions_are_bumped_after_each_batch(self) -> None:
+        valid = {
+            "status": self.test_task_1.status.name,
+            "author": self.test_user_1.username,
+        }
+
+        def rows():
+            yield {"name": "Batch1", **valid}
+            yield {"name": "Batch2", **valid}
+            raise OSError("connection lost")
+
+        version = get_model_version(Task)
+        with self.assertRaises(OSError):
+            TaskImporter(batch_size=2).run(rows())
+        self.assertTrue(Task.objects.filter(name="Batch2").exists())
+        self.assertNotEqual(get_model_version(Task), version)
+
+
+class TestImportTasksDeferredIndexes(TransactionTestCase):
+    """Schema changes can't run inside the transaction of TestCase."""
+
+    fixtures = TaskTestCase.fixtures
+
+    def test_deferred_indexes_are_rebuilt(self) -> None:
+        with TemporaryDirectory() as directory:
+            path = Path(directory) / "tasks.csv"
+            path.write_text(
+                "name,status,author\n"
+                f"Indexed,{Status.objects.first().name},"
+                f"{User.objects.first().username}\n"
+            )
+            call_command(
+                "import_tasks", str(path), "--defer-indexes",
+                stdout=StringIO(),
+            )
+        self.assertTrue(Task.objects.filter(name="Indexed").exists())
+        with connection.cursor() as cursor:
+            constraints = connection.introspection.get_constraints(
+                cursor, Task._meta.db_table
+            )
+        for index in Task._meta.indexes:
+            self.assertIn(index.name, constraints)
@@ -0,0 +1,112 @@
+from datetime import timedelta
+from http import HTTPStatus
+
+from django.urls import reverse_lazy
+from django.utils import timezone
+
+from task_manager.core.pagination import encode_cursor
+from task_manager.core.pagination import NEXT
+from task_manager.tasks.models import Task
+from task_manager.tasks.tests.task_test_case import TaskTestCase
+
+
+class TestTasksPagination(TaskTestCase):
+    """Walk the task list with keyset cursors."""
+
+    page_size = 3
+
+    def setUp(self) -> None:
+        super().setUp()
+        now = timezone.now()
+        for number in range(10):
+            task = Task.objects.create(
+                name=f"Paginated{number}",
+                status=self.test_task_1.status,
+                author=self.test_user_1,
+            )
+            # pairs of tasks share creation date, so pk must break the tie
+            Task.objects.filter(pk=task.pk).update(
+                created_at=now - timedelta(minutes=number // 2)
+            )
+
+    def walk(self, params: dict, key: str = "next_page_query") -> list:
+        """Collect object ids from every page following the cursors."""
+        seen = []
+        query = "&".join(f"{name}={value}" for name, value in params.items())
+        while query is not None:
+            response = self.client.get(f"{reverse_lazy('list_task')}?{query}")
+            self.assertEqual(response.status_code, self.status_ok)
+            self.assertLessEqual(
+                len(response.context["object_list"]), self.page_size
+            )
+            seen.extend(task.pk for task in response.context["object_list"])
+            query = response.context.get(key)
+        return seen
+
+    def test_pages_follow_default_ordering(self) -> None:
+        expected = list(
+            Task.objects.order_by("-created_at", "-pk")
+            .values_list("pk", flat=True)
+        )
+        self.assertEqual(self.walk({"page_size": self.page_size}), expected)
+
+    def test_pages_follow_requested_ordering(self) -> None:
+        expected = list(
+            Task.objects.order_by("name", "pk").values_list("pk", flat=True)
+        )
+        self.assertEqual(
+            self.walk({"page_size": self.page_size, "ordering": "name"}),
+            expected,
+        )
+
+    def test_cursor_keeps_filter_parameters(self) -> None:
+        status = self.test_task_1.status.pk
+        first_page = self.client.get(
+            reverse_lazy("list_task"),
+            {"page_size": self.page_size, "status": status},
+        )
+        self.assertIn(
+            f"status={status}", first_page.context["next_page_query"]
+        )
+        expected = list(
+            Task.objects.filter(status=status)
+            .order_by("-created_at", "-pk")
+            .values_list("pk", flat=True)
+        )
+        self.assertEqual(
+            self.walk({"page_size": self.page_size, "status": status}),
+            expected,
+        )
+
+    def test_previous_cursor_returns_previous_page(self) -> None:
+        url = reverse_lazy("list_task")
+        first = self.client.get(url, {"page_size": self.page_size})
+        second = self.client.get(f"{url}?{first.context['next_page_query']}")
+        back = self.client.get(
+            f"{url}?{second.context['previous_page_query']}"
+        )
+        self.assertEqual(
+            list(back.context["object_list"]),
+            list(first.context["object_list"]),
+        )
+        self.assertNotIn("previous_page_query", back.context)
+
+    def test_invalid_cursor_returns_not_found(self) -> None:
+        response = self.client.get(reverse_lazy("list_task"), {"cursor": "!"})
+        self.assertEqual(response.status_code, HTTPStatus.NOT_FOUND)
+
+    def test_tampered_cursor_returns_not_found(self) -> None:
+        pk = self.test_task_1.pk
+        for values in (
+            ["garbage", pk],
+            [None, pk],
+            ["2026-01-01", "x"],
+            [[1], {"pk": 1}],
+            # Cursor of the name ordering sent with the default ordering
+            ["Paginated1", pk],
+        ):
+            with self.subTest(values=values):
+                response = self.client.get(reverse_lazy("list_task"), {
+                    "cursor": encode_cursor(NEXT, values),
+                })
+                self.assertEqual(response.status_code, HTTPStatus.NOT_FOUND)
@@ -0,0 +1,95 @@
+from http import HTTPStatus
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse_lazy
+
+from task_manager.labels.models import Label
+from task_manager.tasks.models import Task
+from task_manager.tasks.tests.task_test_case import TaskTestCase
+
+
+class TestTasksQueryCount(TaskTestCase):
+    """Number of queries must not depend on the number of rows."""
+
+    def count_queries(self, url: str) -> int:
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, self.status_ok)
+        return len(context.captured_queries)
+
+    def add_tasks(self, count: int) -> None:
+        labels = Label.objects.all()
+        for number in range(count):
+            task = Task.objects.create(
+                name=f"Crowded{number}",
+                status=self.test_task_1.status,
+                author=self.test_user_1,
+                performer=self.test_user_2,
+            )
+            task.labels.set(labels)
+
+    def test_list_view_queries_do_not_grow_with_rows(self) -> None:
+        url = reverse_lazy("list_task")
+        few_rows = self.count_queries(url)
+        self.add_tasks(20)
+        many_rows = self.count_queries(url)
+        self.assertEqual(few_rows, many_rows)
+
+    def test_detail_view_queries_do_not_grow_with_labels(self) -> None:
+        url = reverse_lazy("detail_task", kwargs={"pk": self.test_task_1.pk})
+        without_labels = self.count_queries(url)
+        self.test_task_1.labels.set(Label.objects.all())
+        with_labels = self.count_queries(url)
+        self.assertEqual(without_labels, with_labels)
+
+    def test_delete_view_loads_task_once(self) -> None:
+        url = reverse_lazy("delete_task", kwargs={"pk": self.test_task_2.pk})
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, self.status_ok)
+        task_selects = [
+            query for query in context.captured_queries
+            if query["sql"].startswith('SELECT "tasks_task"')
+        ]
+        self.assertEqual(len(task_selects), 1)
+
+    def edit_labels(self, labels: list[int]) -> list[str]:
+        """Post the task form with new labels, return label node queries."""
+        task = self.test_task_1
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.post(
+                reverse_lazy("update_task", kwargs={"pk": task.pk}), {
+                    "name": task.name,
+                    "description": task.description,
+                    "status": task.status_id,
+                    "performer": task.performer_id,
+                    "labels": labels,
+                },
+            )
+        self.assertEqual(response.status_code, HTTPStatus.FOUND)
+        return [
+            query["sql"].split()[0] for query in context.captured_queries
+            if "tasks_taskandlabelnode" in query["sql"]
+        ]
+
+    def test_unchanged_labels_are_only_read(self) -> None:
+        labels = list(Label.objects.values_list("pk", flat=True))
+        self.edit_labels(labels)
+        # Labels shown in the form and the ones compared with
+        self.assertEqual(self.edit_labels(labels), ["SELECT", "SELECT"])
+
+    def test_changed_labels_are_written_at_once(self) -> None:
+        for number in range(3):
+            Label.objects.create(name=f"Extra{number}")
+        labels = list(Label.objects.values_list("pk", flat=True))
+        self.edit_labels(labels[:3])
+        # Nodes compared with are read again by the delete collector
+        self.assertEqual(
+            self.edit_labels(labels[2:]),
+            ["SELECT", "SELECT", "SELECT", "DELETE", "INSERT"],
+        )
+        self.assertEqual(
+            set(self.test_task_1.labels.values_list("pk", flat=True)),
+            set(labels[2:]),
+        )
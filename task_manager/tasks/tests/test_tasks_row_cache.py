@@ -0,0 +1,57 @@
+from django.urls import reverse_lazy
+
+from task_manager.statuses.models import Status
+from task_manager.tasks.models import Task
+from task_manager.tasks.tests.task_test_case import TaskTestCase
+
+
+class TestTasksRowCache(TaskTestCase):
+    """Rows of the task list are rendered from cache until a change."""
+
+    def test_rows_are_rendered_from_cache(self) -> None:
+        self.client.get(reverse_lazy("list_task"))
+        # update() sends no signals, so cached rows are not invalidated
+        Status.objects.filter(pk=self.test_task_1.status_id).update(
+            name="Silently renamed"
+        )
+        response = self.client.get(reverse_lazy("list_task"))
+        self.assertNotContains(response, "Silently renamed")
+
+    def test_row_key_has_fields_of_the_view(self) -> None:
+        self.client.get(reverse_lazy("list_status"))
+        # task_count is one of row_cache_fields of the status list
+        Status.objects.filter(pk=self.test_task_1.status_id).update(
+            name="Silently renamed", task_count=99
+        )
+        response = self.client.get(reverse_lazy("list_status"))
+        self.assertContains(response, "Silently renamed")
+        self.assertContains(response, "<td>99</td>")
+
+    def test_rows_are_invalidated_on_save(self) -> None:
+        self.client.get(reverse_lazy("list_task"))
+        status = self.test_task_1.status
+        status.name = "Renamed status"
+        status.save()
+        response = self.client.get(reverse_lazy("list_task"))
+        self.assertContains(response, "Renamed status")
+
+    def test_saved_task_invalidates_only_its_row(self) -> None:
+        self.client.get(reverse_lazy("list_task"))
+        Task.objects.filter(pk=self.test_task_2.pk).update(
+            name="Silently renamed"
+        )
+        self.test_task_1.name = "Saved task"
+        self.test_task_1.save()
+        response = self.client.get(reverse_lazy("list_task"))
+        self.assertContains(response, "Saved task")
+        self.assertNotContains(response, "Silently renamed")
+
+    def test_rows_are_cached_per_language(self) -> None:
+        english = self.client.get(
+            reverse_lazy("list_task"), HTTP_ACCEPT_LANGUAGE="en-us"
+        )
+        russian = self.client.get(
+            reverse_lazy("list_task"), HTTP_ACCEPT_LANGUAGE="ru-ru"
+        )
+        self.assertContains(english, ">Edit<")
+        self.assertContains(russian, ">Изменить<")
@@ -0,0 +1,80 @@
+from unittest import skipUnless
+
+from django.db import connection
+from django.urls import reverse_lazy
+
+from task_manager.tasks.models import Task
+from task_manager.tasks.search import repair_sqlite_triggers
+from task_manager.tasks.search import SQLITE_TRIGGERS
+from task_manager.tasks.tests.task_test_case import TaskTestCase
+
+
+class TestTasksSearch(TaskTestCase):
+    """Full-text index follows task changes and ranks results."""
+
+    def create(self, name: str, description: str = "") -> Task:
+        return Task.objects.create(
+            name=name,
+            description=description,
+            status=self.test_task_1.status,
+            author=self.test_user_1,
+        )
+
+    def found(self, text: str) -> list[int]:
+        return list(Task.objects.search(text).values_list("pk", flat=True))
+
+    def test_name_matches_rank_above_description_matches(self) -> None:
+        in_description = self.create("Deploy", "Update the invoice service")
+        in_name = self.create("Invoice totals", "Wrong rounding")
+        self.create("Unrelated", "Nothing to see")
+        self.assertEqual(
+            self.found("invoice"), [in_name.pk, in_description.pk]
+        )
+
+    def test_words_are_matched_as_prefixes_all_together(self) -> None:
+        task = self.create("Migration", "Rewrite reports module")
+        self.create("Reports", "Another task")
+        self.assertEqual(self.found("report rewr"), [task.pk])
+
+    def test_index_follows_update_and_delete(self) -> None:
+        task = self.create("Searchable", "first version")
+        task.description = "second version"
+        task.save()
+        self.assertEqual(self.found("first"), [])
+        self.assertEqual(self.found("second"), [task.pk])
+        # Queries bypassing save() are indexed by the database too
+        Task.objects.filter(pk=task.pk).update(description="third")
+        self.assertEqual(self.found("third"), [task.pk])
+        task.delete()
+        self.assertEqual(self.found("third"), [])
+
+    def test_query_syntax_is_not_interpreted(self) -> None:
+        task = self.create("Quoted", 'say "hello" OR NOT')
+        self.assertEqual(self.found('"hello" OR ('), [task.pk])
+        self.assertEqual(self.found("*** ()"), [])
+
+    def test_list_filter_pages_through_results(self) -> None:
+        expected = [
+            self.create(f"Paged {number}", "needle " * number).pk
+            for number in range(1, 5)
+        ]
+        url = reverse_lazy("list_task")
+        query = "search=needle&page_size=1"
+        seen = []
+        while query is not None:
+            response = self.client.get(f"{url}?{query}")
+            self.assertEqual(response.status_code, self.status_ok)
+            seen.extend(task.pk for task in response.context["object_list"])
+            query = response.context.get("next_page_query")
+        self.assertEqual(sorted(seen), sorted(expected))
+        self.assertEqual(seen, self.found("needle"))
+
+    @skipUnless(connection.vendor == "sqlite", "FTS5 triggers")
+    def test_missing_triggers_are_repaired(self) -> None:
+        with connection.cursor() as cursor:
+            for name in SQLITE_TRIGGERS:
+                cursor.execute(f"DROP TRIGGER {name}")
+        task = self.create("Unindexed", "written without triggers")
+        self.assertEqual(self.found("unindexed"), [])
+        repair_sqlite_triggers(connection)
+        self.assertEqual(self.found("unindexed"), [task.pk])
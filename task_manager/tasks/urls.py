@@ -1,16 +1,25 @@
+from django.conf import settings
 from django.urls import path
 
+from task_manager.tasks.views import AsyncTaskDetailView
+from task_manager.tasks.views import AsyncTaskIndexView
 from task_manager.tasks.views import TaskCreateView
 from task_manager.tasks.views import TaskDeleteView
 from task_manager.tasks.views import TaskDetailView
+from task_manager.tasks.views import TaskExportView
 from task_manager.tasks.views import TaskIndexView
 from task_manager.tasks.views import TaskUpdateView
 
+if settings.ASYNC_VIEWS:
+    index_view, detail_view = AsyncTaskIndexView, AsyncTaskDetailView
+else:
+    index_view, detail_view = TaskIndexView, TaskDetailView
 
 urlpatterns = [
-    path("", TaskIndexView.as_view(), name="list_task"),
+    path("", index_view.as_view(), name="list_task"),
     path("create/", TaskCreateView.as_view(), name="create_task"),
-    path("<int:pk>/", TaskDetailView.as_view(), name="detail_task"),
+    path("export/", TaskExportView.as_view(), name="export_task"),
+    path("<int:pk>/", detail_view.as_view(), name="detail_task"),
     path("<int:pk>/update/", TaskUpdateView.as_view(), name="update_task"),
     path("<int:pk>/delete/", TaskDeleteView.as_view(), name="delete_task"),
 ]
@@ -1,4 +1,9 @@
+from asgiref.sync import sync_to_async
+from django.conf import settings
 from django.contrib.messages.views import SuccessMessageMixin
+from django.http import Http404
+from django.http import HttpResponseBadRequest
+from django.http import StreamingHttpResponse
 from django.urls import reverse_lazy
 from django.utils.translation import gettext_lazy as _
 from django.views.generic import CreateView
@@ -6,20 +11,48 @@ from django.views.generic import DeleteView
 from django.views.generic import DetailView
 from django.views.generic import ListView
 from django.views.generic import UpdateView
+from django.views.generic import View
+from django.views.generic.base import ContextMixin
+from django.views.generic.base import TemplateResponseMixin
+from django.views.generic.detail import SingleObjectMixin
+from django.views.generic.detail import SingleObjectTemplateResponseMixin
+from django_filters.views import FilterMixin
 from django_filters.views import FilterView
 
+from task_manager.core.cache import AsyncConditionalGetMixin
+from task_manager.core.cache import ConditionalGetMixin
+from task_manager.core.cache import RowCacheMixin
+from task_manager.core.pagination import KeysetPaginationMixin
+from task_manager.core.permission_mixins import AsyncUserMixin
 from task_manager.core.permission_mixins import TaskDeletionTestMixin
 from task_manager.core.permission_mixins import UserLoginRequiredMixin
+from task_manager.labels.models import Label
+from task_manager.statuses.models import Status
+from task_manager.tasks import export
+from task_manager.tasks.bulk import ROWS_VERSION
 from task_manager.tasks.filters import TaskFilter
 from task_manager.tasks.forms import TaskForm
 from task_manager.tasks.models import Task
+from task_manager.users.models import User
 
 
-class TaskIndexView(UserLoginRequiredMixin, FilterView, ListView):
-    """List all tasks. Authorization required."""
+class TaskListMixin:
+    """Task list page of TaskIndexView and AsyncTaskIndexView."""
     model = Task
+    queryset = Task.objects.with_related()
     template_name = "list_objects.html"
     filterset_class = TaskFilter
+    # Default ordering, may be overridden by TaskFilter's `ordering`
+    ordering = ("-created_at",)
+    # KeysetPaginationMixin attrs
+    paginate_by = settings.TASK_LIST_PAGE_SIZE
+    max_paginate_by = settings.TASK_LIST_MAX_PAGE_SIZE
+    # ConditionalGetMixin attrs
+    condition_models = (Task, Status, User, Label)
+    # RowCacheMixin attrs. Saving a task changes its created_at, bulk
+    # updates don't and bump ROWS_VERSION instead
+    row_cache_fields = ("id", "created_at")
+    row_cache_models = (ROWS_VERSION, Status, User)
     extra_context = {
         "title": _("Tasks"),
         "button_text": _("Create task"),
@@ -31,13 +64,98 @@ class TaskIndexView(UserLoginRequiredMixin, FilterView, ListView):
         "url_to_create": reverse_lazy("create_task"),
         "url_to_update": "update_task",
         "url_to_delete": "delete_task",
+        "row_template": "includes/rows/task.html",
     }
 
 
-class TaskDetailView(UserLoginRequiredMixin, DetailView):
-    """Show task info page."""
+class TaskIndexView(TaskListMixin,
+                    UserLoginRequiredMixin,
+                    ConditionalGetMixin,
+                    RowCacheMixin,
+                    KeysetPaginationMixin,
+                    FilterView,
+                    ListView):
+    """List all tasks page by page. Authorization required."""
+
+
+class AsyncTaskIndexView(TaskListMixin,
+                         AsyncUserMixin,
+                         UserLoginRequiredMixin,
+                         AsyncConditionalGetMixin,
+                         RowCacheMixin,
+                         KeysetPaginationMixin,
+                         FilterMixin,
+                         TemplateResponseMixin,
+                         ContextMixin,
+                         View):
+    """
+    TaskIndexView of async deployments, see ASYNC_VIEWS setting.
+    The page is fetched with the async ORM, filters are validated and
+    the context is built in a thread, because forms and cache are sync.
+    """
+
+    def get_queryset(self):
+        return self.queryset.order_by(*self.ordering)
+
+    def filter_queryset(self):
+        """Tasks chosen by the filters, like BaseFilterView.get()."""
+        self.filterset = self.get_filterset(self.get_filterset_class())
+        if not self.filterset.is_bound or self.filterset.is_valid() \
+                or not self.get_strict():
+            return self.filterset.qs
+        return self.filterset.queryset.none()
+
+    async def get(self, request, *args, **kwargs):
+        queryset = await sync_to_async(self.filter_queryset)()
+        paginator, page, object_list, is_paginated = \
+            await self.apaginate_queryset(
+                queryset, self.get_paginate_by(queryset)
+            )
+        context = await sync_to_async(self.get_context_data)(
+            filter=self.filterset,
+            paginator=paginator,
+            page_obj=page,
+            is_paginated=is_paginated,
+            object_list=object_list,
+        )
+        return self.render_to_response(context)
+
+
+class TaskDetailMixin:
+    """Task page of TaskDetailView and AsyncTaskDetailView."""
     model = Task
+    queryset = Task.objects.with_related()
     template_name = "task_detail.html"
+    # ConditionalGetMixin attrs
+    condition_models = (Task, Status, User, Label)
+
+
+class TaskDetailView(TaskDetailMixin,
+                     UserLoginRequiredMixin,
+                     ConditionalGetMixin,
+                     DetailView):
+    """Show task info page."""
+
+
+class AsyncTaskDetailView(TaskDetailMixin,
+                          AsyncUserMixin,
+                          UserLoginRequiredMixin,
+                          AsyncConditionalGetMixin,
+                          SingleObjectTemplateResponseMixin,
+                          SingleObjectMixin,
+                          View):
+    """TaskDetailView fetching the task with the async ORM."""
+
+    async def get(self, request, *args, **kwargs):
+        try:
+            self.object = await self.get_queryset().aget(
+                pk=self.kwargs[self.pk_url_kwarg]
+            )
+        except Task.DoesNotExist:
+            raise Http404(_("No %(verbose_name)s found matching the query")
+                          % {"verbose_name": Task._meta.verbose_name})
+        context = self.get_context_data(object=self.object)
+        return self.render_to_response(context)
 
 
 class TaskCreateView(UserLoginRequiredMixin, SuccessMessageMixin, CreateView):
@@ -91,3 +209,34 @@ class TaskDeleteView(UserLoginRequiredMixin,
     }
     # SuccessMessageMixin attrs
     success_message = _("Task successfully deleted")
+
+
+class TaskExportView(UserLoginRequiredMixin, View):
+    """Stream tasks chosen by TaskFilter parameters as CSV or JSON lines."""
+
+    formats = {
+        "csv": ("text/csv; charset=utf-8", export.csv_lines),
+        "jsonl": ("application/jsonl; charset=utf-8", export.jsonl_lines),
+    }
+    format_kwarg = "format"
+    chunk_size = settings.EXPORT_CHUNK_SIZE
+
+    def get(self, request, *args, **kwargs):
+        file_format = request.GET.get(self.format_kwarg, "csv")
+        filterset = TaskFilter(
+            request.GET,
+            queryset=Task.objects.order_by("-created_at"),
+            request=request,
+        )
+        if file_format not in self.formats or not filterset.is_valid():
+            return HttpResponseBadRequest()
+        content_type, write = self.formats[file_format]
+        # Captions are translated now, the response is written later
+        header = [str(caption) for _name, caption in export.COLUMNS]
+        response = StreamingHttpResponse(
+            write(export.iter_tasks(filterset.qs, self.chunk_size), header),
+            content_type=content_type,
+        )
+        response["Content-Disposition"] = \
+            f'attachment; filename="tasks.{file_format}"'
+        return response
@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class UsersConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'task_manager.users'
+
+    def ready(self):
+        from task_manager.users.backends import connect_signals
+        connect_signals()
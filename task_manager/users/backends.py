@@ -0,0 +1,58 @@
+"""
+Authentication backend caching the users of sessions.
+
+Every authenticated request loads its user by the id stored in the
+session. CachedModelBackend keeps that user in the cache for
+USER_CACHE_TIMEOUT seconds and saving or deleting the user drops it.
+Counters changed with update() aren't refreshed in the cached copy,
+so the request user must not be saved as a whole.
+"""
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.auth.backends import ModelBackend
+from django.core.cache import cache
+from django.db import transaction
+
+USER_KEY = "session-user:{}"
+
+
+def user_cache_key(user_id) -> str:
+    return USER_KEY.format(user_id)
+
+
+class CachedModelBackend(ModelBackend):
+    """ModelBackend reading the session user from the cache."""
+
+    def get_user(self, user_id):
+        timeout = settings.USER_CACHE_TIMEOUT
+        if not timeout:
+            return super().get_user(user_id)
+        key = user_cache_key(user_id)
+        user = cache.get(key)
+        if user is None:
+            # Inactive and missing users aren't cached
+            user = super().get_user(user_id)
+            if user is not None:
+                cache.set(key, user, timeout)
+        return user
+
+
+def forget_user(sender, instance, using=None, **kwargs):
+    """
+    Drop the cached user now, and after commit for copies cached
+    by concurrent requests meanwhile.
+    """
+    key = user_cache_key(instance.pk)
+    cache.delete(key)
+    transaction.on_commit(lambda: cache.delete(key), using=using)
+
+
+def connect_signals():
+    from django.db.models.signals import post_delete
+    from django.db.models.signals import post_save
+
+    for signal, name in ((post_save, "save"), (post_delete, "delete")):
+        signal.connect(
+            forget_user, sender=get_user_model(),
+            dispatch_uid=f"forget-user-{name}",
+        )
@@ -0,0 +1,23 @@
+# Generated by Django 5.0.1 on 2026-10-18 19:15
+from django.db import migrations
+from django.db import models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0002_lookup_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='authored_task_count',
+            field=models.IntegerField(default=0, editable=False, verbose_name='Authored tasks'),
+        ),
+        migrations.AddField(
+            model_name='user',
+            name='performed_task_count',
+            field=models.IntegerField(default=0, editable=False, verbose_name='Assigned tasks'),
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 5.0.1 on 2026-10-18 20:07
+
+import task_manager.core.fields
+from django.db import migrations
+from task_manager.core.fields import search_key
+
+
+def fill_search_name(apps, schema_editor):
+    """search_key() of the full name of existing users."""
+    User = apps.get_model("users", "User")
+    users = list(User.objects.using(schema_editor.connection.alias))
+    for user in users:
+        user.search_name = search_key(f"{user.first_name} {user.last_name}")[:255]
+    User.objects.using(schema_editor.connection.alias) \
+        .bulk_update(users, ["search_name"], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0003_user_task_counts'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='user',
+            name='user_username_lower_idx',
+        ),
+        migrations.AddField(
+            model_name='user',
+            name='search_name',
+            field=task_manager.core.fields.SearchKeyField(db_index=True, default='', editable=False, max_length=255, source='get_full_name'),
+        ),
+        migrations.RunPython(fill_search_name, migrations.RunPython.noop),
+    ]
@@ -1,8 +1,26 @@
 from django.contrib.auth.models import AbstractUser
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+from task_manager.core.fields import SearchKeyField
 
 
 class User(AbstractUser):
     """Default task manager's user"""
 
+    # Maintained by tasks.counters
+    authored_task_count = models.IntegerField(
+        default=0,
+        editable=False,
+        verbose_name=_("Authored tasks"),
+    )
+    performed_task_count = models.IntegerField(
+        default=0,
+        editable=False,
+        verbose_name=_("Assigned tasks"),
+    )
+    # Full name shown by lookup options, searched by prefix
+    search_name = SearchKeyField(source="get_full_name")
+
     def __str__(self):
         return self.get_full_name()
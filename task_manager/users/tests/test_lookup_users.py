@@ -0,0 +1,76 @@
+from http import HTTPStatus
+from unittest import mock
+
+from django.urls import reverse_lazy
+
+from task_manager.users.models import User
+from task_manager.users.tests.users_test_case import UsersTestCase
+from task_manager.users.views import UserLookupView
+
+
+class TestLookupUsers(UsersTestCase):
+    """Typeahead endpoint searches users by full name prefix."""
+
+    lookup_url = reverse_lazy("lookup_user")
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.client.force_login(User.objects.get(username="PythonLover"))
+
+    def test_lookup_requires_authentication(self):
+        self.client.logout()
+        response = self.client.get(self.lookup_url)
+        self.assertEqual(response.status_code, HTTPStatus.FORBIDDEN)
+
+    def test_lookup_is_case_insensitive_prefix_search(self):
+        response = self.client.get(self.lookup_url, {"q": "gUiDo  vAN"})
+        user = User.objects.get(username="PythonLover")
+        self.assertEqual(response.json(), {
+            "results": [{"id": user.pk, "text": str(user)}],
+            "next": None,
+        })
+
+    def test_lookup_does_not_match_inside_name(self):
+        response = self.client.get(self.lookup_url, {"q": "rossum"})
+        self.assertEqual(response.json()["results"], [])
+
+    def test_lookup_does_not_search_username(self):
+        response = self.client.get(self.lookup_url, {"q": "python"})
+        self.assertEqual(response.json()["results"], [])
+
+    def test_lookup_matches_non_ascii_names(self):
+        user = User.objects.create_user(
+            username="anna", first_name="Анна", last_name="Иванова"
+        )
+        for term in ("анна и", "АННА И"):
+            with self.subTest(term=term):
+                response = self.client.get(self.lookup_url, {"q": term})
+                self.assertEqual(
+                    [item["id"] for item in response.json()["results"]],
+                    [user.pk],
+                )
+
+    def test_lookup_follows_renamed_users(self):
+        user = User.objects.get(username="LinuxLover")
+        user.first_name = "Ёжик"
+        user.save()
+        response = self.client.get(self.lookup_url, {"q": "ёЖ"})
+        self.assertEqual(
+            [item["id"] for item in response.json()["results"]], [user.pk]
+        )
+
+    @mock.patch.object(UserLookupView, "page_size", 1)
+    def test_lookup_pages_follow_cursor(self):
+        first = self.client.get(self.lookup_url).json()
+        second = self.client.get(
+            self.lookup_url, {"cursor": first["next"]}
+        ).json()
+        self.assertEqual(
+            [item["text"] for item in first["results"] + second["results"]],
+            [str(user) for user in User.objects.order_by("search_name")],
+        )
+        self.assertIsNone(second["next"])
+
+    def test_lookup_rejects_invalid_cursor(self):
+        response = self.client.get(self.lookup_url, {"cursor": "broken"})
+        self.assertEqual(response.status_code, HTTPStatus.BAD_REQUEST)
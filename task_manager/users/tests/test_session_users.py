@@ -0,0 +1,65 @@
+from django.db import connection
+from django.test import Client
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse_lazy
+
+from task_manager.users.models import User
+from task_manager.users.tests.users_test_case import UsersTestCase
+
+
+class TestSessionUsers(UsersTestCase):
+    """Authenticated requests read the session and its user from cache."""
+
+    url = reverse_lazy("list_status")
+
+    def get_tables(self, client: Client) -> list[str]:
+        """Tables read by an authenticated request after the first one."""
+        client.get(self.url)
+        with CaptureQueriesContext(connection) as context:
+            response = client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        return [
+            table for table in ("django_session", "users_user")
+            if any(f'FROM "{table}"' in query["sql"]
+                   for query in context.captured_queries)
+        ]
+
+    def login(self) -> Client:
+        # Middleware is set up with the settings of the first request
+        client = Client()
+        client.force_login(User.objects.get(username="PythonLover"))
+        return client
+
+    def test_user_is_cached(self):
+        self.assertEqual(self.get_tables(self.login()), ["django_session"])
+
+    @override_settings(USER_CACHE_TIMEOUT=0)
+    def test_user_cache_can_be_turned_off(self):
+        self.assertEqual(
+            self.get_tables(self.login()), ["django_session", "users_user"]
+        )
+
+    @override_settings(
+        SESSION_ENGINE="django.contrib.sessions.backends.cached_db"
+    )
+    def test_cached_sessions(self):
+        self.assertEqual(self.get_tables(self.login()), [])
+
+    def test_changed_user_is_reloaded(self):
+        client = self.login()
+        client.get(self.url)
+        user = User.objects.get(username="PythonLover")
+        user.first_name = "New"
+        user.save()
+        response = client.get(self.url)
+        self.assertEqual(response.context["user"].first_name, "New")
+
+    def test_sessions_of_model_backend_stay_valid(self):
+        client = Client()
+        client.force_login(
+            User.objects.get(username="PythonLover"),
+            backend="django.contrib.auth.backends.ModelBackend",
+        )
+        response = client.get(self.url)
+        self.assertEqual(response.context["user"].username, "PythonLover")
@@ -0,0 +1,71 @@
+from http import HTTPStatus
+
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse_lazy
+
+from task_manager.users.backends import user_cache_key
+from task_manager.users.models import User
+from task_manager.users.tests.users_test_case import UsersTestCase
+
+
+class TestUpdateUser(UsersTestCase):
+    """Only user can edit himself."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.user = User.objects.get(username="PythonLover")
+        self.other_user = User.objects.get(username="LinuxLover")
+        self.client.force_login(self.user)
+
+    def test_user_can_open_own_update_form(self):
+        response = self.client.get(
+            reverse_lazy("update_user", kwargs={"pk": self.user.pk})
+        )
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertTemplateUsed(response, "form.html")
+
+    def test_user_cannot_update_another_user(self):
+        response = self.client.get(
+            reverse_lazy("update_user", kwargs={"pk": self.other_user.pk})
+        )
+        self.assertRedirects(response, reverse_lazy("list_user"))
+
+    def test_missing_user_is_not_found(self):
+        for name in ("update_user", "delete_user"):
+            with self.subTest(name=name):
+                response = self.client.get(
+                    reverse_lazy(name, kwargs={"pk": 10 ** 6})
+                )
+                self.assertEqual(response.status_code, HTTPStatus.NOT_FOUND)
+
+    def test_update_form_loads_user_once(self):
+        """Session user is read from the cache, edited user is loaded once."""
+        url = reverse_lazy("update_user", kwargs={"pk": self.user.pk})
+        # The first request caches the session user
+        self.client.get(url)
+        with CaptureQueriesContext(connection) as context:
+            self.client.get(url)
+        user_selects = [
+            query for query in context.captured_queries
+            if query["sql"].startswith('SELECT "users_user"')
+        ]
+        self.assertEqual(len(user_selects), 1)
+
+    def test_update_drops_cached_user(self):
+        url = reverse_lazy("update_user", kwargs={"pk": self.user.pk})
+        self.client.get(url)
+        self.assertIsNotNone(cache.get(user_cache_key(self.user.pk)))
+        response = self.client.post(url, {
+            "first_name": "Changed",
+            "last_name": self.user.last_name,
+            "username": self.user.username,
+            "password1": "123",
+            "password2": "123",
+        })
+        self.assertRedirects(
+            response, reverse_lazy("list_user"),
+            fetch_redirect_response=False,
+        )
+        self.assertIsNone(cache.get(user_cache_key(self.user.pk)))
@@ -1,15 +1,15 @@
 from django.contrib.messages import Message
 from django.contrib.messages import SUCCESS
 from django.contrib.messages.test import MessagesTestMixin
-from django.test import TestCase
 from django.urls import reverse_lazy
 from django.utils.translation import gettext_lazy as _
 
+from task_manager.core.tests.core_test_case import CacheTestCase
 from task_manager.users.forms import UserRegistrationForm
 from task_manager.users.views import UserCreateView
 
 
-class UsersTestCase(MessagesTestMixin, TestCase):
+class UsersTestCase(MessagesTestMixin, CacheTestCase):
     """Testcase special for test user model."""
 
     fixtures = ["test_users"]
@@ -34,4 +34,5 @@ class UsersTestCase(MessagesTestMixin, TestCase):
     test_password: str = "123"
 
     def setUp(self) -> None:
+        super().setUp()
         self.create_view = self.client.get(reverse_lazy("create_user"))
@@ -1,14 +1,23 @@
+from django.conf import settings
 from django.urls import path
 from task_manager.users.views import (
     UserIndexView,
     UserCreateView,
     UserUpdateView,
-    UserDeleteView
+    UserDeleteView,
+    UserLookupView,
+    AsyncUserLookupView,
 )
 
+if settings.ASYNC_VIEWS:
+    lookup_view = AsyncUserLookupView
+else:
+    lookup_view = UserLookupView
+
 urlpatterns = [
     path('', UserIndexView.as_view(), name='list_user'),
     path('create/', UserCreateView.as_view(), name='create_user'),
+    path('lookup/', lookup_view.as_view(), name='lookup_user'),
     path('<int:pk>/update/', UserUpdateView.as_view(), name='update_user'),
     path('<int:pk>/delete/', UserDeleteView.as_view(), name='delete_user'),
 ]
@@ -6,15 +6,22 @@ from django.views.generic.edit import DeleteView
 from django.views.generic.edit import UpdateView
 from django.views.generic.list import ListView
 
+from task_manager.core.cache import AnonymousPageCacheMixin
+from task_manager.core.cache import ConditionalGetMixin
+from task_manager.core.cache import RowCacheMixin
+from task_manager.core.lookups import AsyncModelLookupView
+from task_manager.core.lookups import ModelLookupView
 from task_manager.core.permission_mixins import ProtectObjectDeletionMixin
 from task_manager.core.permission_mixins import UserLoginRequiredMixin
 from task_manager.core.permission_mixins import UserPermissionTestMixin
+from task_manager.tasks.models import Task
 from task_manager.users.forms import UserRegistrationForm
 from task_manager.users.forms import UserUpdateForm
 from task_manager.users.models import User
 
 
-class UserIndexView(ListView):
+class UserIndexView(ConditionalGetMixin, AnonymousPageCacheMixin,
+                    RowCacheMixin, ListView):
     """List all User objects."""
     model = User
     template_name = "list_objects.html"
@@ -22,11 +29,13 @@ class UserIndexView(ListView):
         "title": _("Users"),
         "button_text": None,
         "captions": [
-            _("Username"), _("Full name"), _("Creation date")
+            _("Username"), _("Full name"), _("Creation date"),
+            _("Authored tasks"), _("Assigned tasks"),
         ],
         "url_to_create": reverse_lazy("create_user"),
         "url_to_update": "update_user",
         "url_to_delete": "delete_user",
+        "row_template": "includes/rows/user.html",
     }
     # Optimize orm query and exclude admin
     queryset = User.objects.exclude(is_superuser=True).values(
@@ -34,8 +43,28 @@ class UserIndexView(ListView):
         'username',
         'date_joined',
         'first_name',
-        'last_name'
+        'last_name',
+        'authored_task_count',
+        'performed_task_count',
     )
+    # ConditionalGetMixin attrs, task changes change the counts
+    condition_models = (User, Task)
+    # AnonymousPageCacheMixin attrs
+    page_cache_models = (User, Task)
+    # RowCacheMixin attrs
+    row_cache_fields = (
+        "id", "date_joined", "authored_task_count", "performed_task_count",
+    )
+    row_cache_models = (User,)
+
+
+class UserLookupView(ModelLookupView):
+    """Search users by full name prefix for typeahead widgets."""
+    queryset = User.objects.exclude(is_superuser=True)
+
+
+class AsyncUserLookupView(AsyncModelLookupView, UserLookupView):
+    """UserLookupView of async deployments, see ASYNC_VIEWS setting."""
 
 
 class UserCreateView(SuccessMessageMixin, CreateView):